@@ -0,0 +1,121 @@
+# Benchmark comparing queue.Queue, BoundedQueue and SPSCChannel for passing data chunks between two threads
+# (data source thread -> task thread).
+#
+# Usage (from the MLDOG-Framework directory):
+#   python benchmarks/channel_benchmark.py [number of chunks]
+
+import sys
+import os
+import time
+from queue import Empty, Queue
+from threading import Thread
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+
+from mldog.app.model.bounded_queue import BoundedQueue
+from mldog.app.model.spsc_channel import SPSCChannel
+
+
+CAPACITY = 1024
+BLOCK_SIZES = [10, 480]
+
+
+def measure_overhead(channel, chunks: list) -> float:
+    """
+    Measure the pure synchronization cost of a put/get pair within a single thread (no waiting involved).
+    """
+
+    batch = min(len(chunks), CAPACITY // 2)
+    start_time = time.perf_counter()
+
+    for offset in range(0, len(chunks) - batch + 1, batch):
+        for chunk in chunks[offset:offset + batch]:
+            channel.put(chunk)
+        for _ in range(batch):
+            channel.get()
+
+    return (time.perf_counter() - start_time) / (len(chunks) // batch * batch)
+
+
+def measure(channel, chunks: list, batched: bool = False) -> tuple:
+    """
+    Pass all chunks through the given channel from a producer thread to the calling (consumer) thread.
+
+    Returns the mean time per chunk and the median latency (put to get) per chunk.
+    """
+
+    put_times = np.zeros(len(chunks))
+
+    def produce():
+        for idx, chunk in enumerate(chunks):
+            put_times[idx] = time.perf_counter()
+            channel.put((idx, chunk))
+
+    received = 0
+    latencies = np.zeros(len(chunks))
+
+    producer = Thread(target=produce)
+    start_time = time.perf_counter()
+    producer.start()
+
+    while received < len(chunks):
+        if batched:
+            items = channel.getAll()
+            if len(items) == 0:
+                try:
+                    items = [channel.get(block=True, timeout=1)]
+                except Empty:
+                    continue
+        else:
+            try:
+                items = [channel.get(block=True, timeout=1)]
+            except Empty:
+                continue
+
+        now = time.perf_counter()
+        for idx, _ in items:
+            latencies[idx] = now - put_times[idx]
+        received += len(items)
+
+    runtime = time.perf_counter() - start_time
+    producer.join()
+
+    return runtime / len(chunks), float(np.median(latencies))
+
+
+if __name__ == '__main__':
+    n_chunks = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for block_size in BLOCK_SIZES:
+        chunks = [np.zeros((block_size, 3))] * n_chunks
+
+        print(f'{n_chunks} chunks of {block_size} samples (capacity {CAPACITY}):')
+        print(f'{"":<28} {"per chunk":>12} {"median latency":>16}')
+        print('producer and consumer thread (saturated):')
+
+        baseline = None
+        for name, create, batched in [
+            ('queue.Queue', lambda: Queue(CAPACITY), False),
+            ('BoundedQueue', lambda: BoundedQueue(CAPACITY, 'block'), False),
+            ('BoundedQueue (getAll)', lambda: BoundedQueue(CAPACITY, 'block'), True),
+            ('SPSCChannel', lambda: SPSCChannel(CAPACITY, 'block'), False),
+            ('SPSCChannel (getAll)', lambda: SPSCChannel(CAPACITY, 'block'), True),
+        ]:
+            per_chunk, latency = measure(create(), chunks, batched)
+            baseline = per_chunk if baseline is None else baseline
+            print(f'{name:<28} {per_chunk * 1e6:9.2f} us {latency * 1e6:13.1f} us   ({baseline / per_chunk:.1f}x)')
+
+        print('put/get pair within one thread (synchronization overhead):')
+        baseline = None
+        for name, create in [
+            ('queue.Queue', lambda: Queue(CAPACITY)),
+            ('BoundedQueue', lambda: BoundedQueue(CAPACITY, 'block')),
+            ('SPSCChannel', lambda: SPSCChannel(CAPACITY, 'block')),
+        ]:
+            per_chunk = measure_overhead(create(), chunks)
+            baseline = per_chunk if baseline is None else baseline
+            print(f'{name:<28} {per_chunk * 1e6:9.2f} us {"":>16}   ({baseline / per_chunk:.1f}x)')
+
+        print()
@@ -0,0 +1,98 @@
+# Benchmark comparing the former vstack based buffering of the DrillProcedureDetector with the preallocated capture buffer.
+# The time per chunk is reported for increasingly long drill procedures, it should stay flat for the capture buffer.
+#
+# Usage (from the MLDOG-Framework directory):
+#   python benchmarks/drill_detector_benchmark.py [max seconds]
+
+import sys
+import os
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+
+from mldog.util.drill.drill_procedure_detector import DrillProcedureDetector
+
+
+FREQUENCY = 96000
+CHUNK_SIZE = 480
+
+
+class LegacyDrillProcedureDetector(DrillProcedureDetector):
+    """
+    Reference implementation of the former buffering, reallocating the whole buffer for each chunk.
+    """
+
+    def __init__(self, ttl_max = 150, window_size = 48000, active_power = 20):
+        super().__init__(ttl_max, window_size, active_power)
+        self.buffer = np.zeros((0, 3))
+
+    def update(self, data: np.ndarray) -> np.ndarray:
+        self.buffer = np.vstack([self.buffer, data])
+        result = None
+
+        is_active = np.max(np.abs(data[:, 1] * data[:, 2])) > self.active_power
+
+        if not self.start_detected:
+            if is_active:
+                self.start_detected = True
+                self.ttl = self.ttl_max
+            elif len(self.buffer) > self.window_size:
+                self.buffer = self.buffer[-self.window_size:]
+        elif is_active:
+            self.ttl = self.ttl_max
+        else:
+            self.ttl = self.ttl - 1
+            if self.ttl == 0:
+                result = self.buffer
+                self.buffer = np.zeros((0, 3))
+                self.start_detected = False
+
+        return result
+
+
+def drill_chunks(seconds: float):
+    """
+    Generate the chunks of a single drill procedure of the given duration, embedded in idle periods.
+    """
+
+    idle = np.zeros((CHUNK_SIZE, 3))
+    active = np.zeros((CHUNK_SIZE, 3))
+    active[:, 1] = 20
+    active[:, 2] = 5
+
+    n_active = int(seconds * FREQUENCY / CHUNK_SIZE)
+    return [idle] * 200 + [active] * n_active + [idle] * 200
+
+
+def measure(detector: DrillProcedureDetector, chunks: list) -> tuple:
+    """
+    Feed all chunks into the detector and return the time per chunk and the detected procedure.
+    """
+
+    result = None
+    start_time = time.perf_counter()
+    for chunk in chunks:
+        drill_data = detector.update(chunk)
+        if drill_data is not None:
+            result = drill_data
+
+    return (time.perf_counter() - start_time) / len(chunks), result
+
+
+if __name__ == '__main__':
+    max_seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 32.0
+
+    print(f'{"drill duration":>14} {"legacy":>14} {"capture buffer":>16} {"speedup":>8}')
+
+    seconds = 1.0
+    while seconds <= max_seconds:
+        chunks = drill_chunks(seconds)
+        legacy_time, legacy_result = measure(LegacyDrillProcedureDetector(), chunks)
+        buffer_time, buffer_result = measure(DrillProcedureDetector(), chunks)
+
+        assert np.array_equal(legacy_result, buffer_result), 'detected procedures differ'
+
+        print(f'{seconds:>13.0f}s {legacy_time * 1e6:>11.1f} us {buffer_time * 1e6:>13.1f} us {legacy_time / buffer_time:>7.1f}x')
+        seconds *= 2
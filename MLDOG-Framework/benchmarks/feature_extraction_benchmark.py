@@ -0,0 +1,70 @@
+# Benchmark comparing the former pandas based feature extraction of CsvRestructuring with the numpy feature extraction.
+#
+# Usage (from the MLDOG-Framework directory):
+#   python benchmarks/feature_extraction_benchmark.py [drill seconds]
+
+import sys
+import os
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from mldog.util.drill.features import extract_feature_frame
+
+
+FREQUENCY = 96000
+REPETITIONS = 200
+
+
+def extract_features_pandas(X: np.ndarray) -> pd.DataFrame:
+    """
+    Reference implementation of the former CsvRestructuring.transform().
+    """
+
+    dfFromArray = pd.DataFrame({
+        '# Audio': X[:,0],
+        'Voltage': X[:,1],
+        'Current': X[:,2],
+    })
+
+    return pd.DataFrame({
+        'AudioAvg': dfFromArray['# Audio'].mean(),
+        'VoltageAvg': dfFromArray['Voltage'].mean(),
+        'CurrentAvg': dfFromArray['Current'].mean(),
+        'time': dfFromArray.shape[0] / 96000
+    }, index=[0])
+
+
+def measure(name: str, method, *args) -> float:
+    """
+    Run the given extraction repeatedly and report the mean latency.
+    """
+
+    start_time = time.perf_counter()
+    for _ in range(REPETITIONS):
+        method(*args)
+    runtime = (time.perf_counter() - start_time) / REPETITIONS
+
+    print(f'{name:<28} {runtime * 1e6:10.1f} us')
+
+    return runtime
+
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    drill_data = np.random.randn(int(seconds * FREQUENCY), 3)
+
+    pd.testing.assert_frame_equal(extract_features_pandas(drill_data), extract_feature_frame(drill_data), check_exact=False)
+
+    print(f'Feature extraction for a {seconds:.0f}s drill procedure ({drill_data.shape[0]} samples):')
+    baseline = measure('pandas (former)', extract_features_pandas, drill_data)
+    runtime = measure('numpy (basic)', extract_feature_frame, drill_data)
+    print(f'{"":<28} speedup: {baseline / runtime:.1f}x')
+    measure('numpy (extended)', extract_feature_frame, drill_data, FREQUENCY, 'extended')
+
+    batch = [drill_data] * 16
+    runtime = measure('numpy (basic, batch of 16)', extract_feature_frame, batch)
+    print(f'{"":<28} per procedure: {runtime / len(batch) * 1e6:.1f} us')
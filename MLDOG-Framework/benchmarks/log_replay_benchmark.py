@@ -0,0 +1,82 @@
+# Benchmark comparing the former line-by-line .csv parsing of the LogDataSource with the chunked block reader.
+#
+# Usage (from the MLDOG-Framework directory):
+#   python benchmarks/log_replay_benchmark.py [seconds]
+
+import sys
+import os
+import time
+import tempfile
+import datetime
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+
+from mldog.app.model.universal_data_sources import LogDataSource
+from mldog.util.drill.io import write_measurement_binary, RECORDING_EXTENSION
+
+
+FREQUENCY = 96000
+BLOCK_SIZE = 480
+
+
+def read_blocks_line_by_line(file_path: str, block_size: int):
+    """
+    Reference implementation of the former per-row parsing of the LogDataSource.
+    """
+
+    with open(file_path) as f:
+        row_idx = 0
+
+        for i, line in enumerate(f):
+            row_values = line.strip().split(',')
+
+            if i == 0:
+                sensor_data = np.zeros((block_size, len(row_values)))
+                continue
+
+            sensor_data[row_idx, :] = np.array(row_values)
+            row_idx += 1
+
+            if row_idx == block_size:
+                yield sensor_data.copy()
+                row_idx = 0
+
+        if row_idx > 0:
+            yield sensor_data[:row_idx, :].copy()
+
+
+def measure(name: str, blocks) -> float:
+    """
+    Consume all blocks and report the throughput relative to real-time.
+    """
+
+    start_time = time.perf_counter()
+    n_samples = sum(block.shape[0] for block in blocks)
+    runtime = time.perf_counter() - start_time
+
+    print(f'{name:<24} {n_samples / runtime / 1e6:8.2f} MSamples/s {n_samples / FREQUENCY / runtime:8.1f}x real-time')
+
+    return runtime
+
+
+if __name__ == '__main__':
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    data = np.random.randn(int(duration * FREQUENCY), 3)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_file = os.path.join(tmp_dir, f'2024_01_01_00_00_00_{FREQUENCY}Hz.csv')
+        binary_file = os.path.join(tmp_dir, f'2024_01_01_00_00_00_{FREQUENCY}Hz{RECORDING_EXTENSION}')
+
+        np.savetxt(csv_file, data, delimiter=',', header='Audio,Voltage,Current', fmt='%2.6f')
+        write_measurement_binary(binary_file, data, FREQUENCY, ['Audio', 'Voltage', 'Current'], datetime.datetime.now())
+
+        source = LogDataSource(tmp_dir, BLOCK_SIZE, FREQUENCY)
+
+        print(f'Reading {duration:.0f}s of {FREQUENCY}Hz data in blocks of {BLOCK_SIZE} samples:')
+        baseline = measure('csv (line by line)', read_blocks_line_by_line(csv_file, BLOCK_SIZE))
+        runtime = measure('csv (chunked)', source.readBlocks(csv_file))
+        print(f'{"":<24} speedup: {baseline / runtime:.1f}x')
+        runtime = measure('binary (memory-mapped)', source.readBlocks(binary_file))
+        print(f'{"":<24} speedup: {baseline / runtime:.1f}x')
@@ -0,0 +1,97 @@
+# Micro-benchmark comparing the per-sample struct decoder with the vectorized UDPDataSource decoder.
+#
+# Usage (from the MLDOG-Framework directory):
+#   python benchmarks/udp_decoding_benchmark.py [n_packets]
+
+import sys
+import os
+import time
+from struct import pack_into, unpack_from
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+
+from mldog.app.model.data_source import MeasurementConfiguration, ChannelConfiguration
+from mldog.app.model.universal_data_sources import UDPDataSource
+
+
+# maximum capturama datagram size and resulting number of samples per packet
+PACKET_SIZE = 4244
+N_CHANNELS = 3
+
+
+def create_packets(n_packets: int, n_channels: int = N_CHANNELS) -> list[bytes]:
+    """
+    Create synthetic capturama sensor data packets (type 1) with random payload.
+    """
+
+    n_samples = (PACKET_SIZE - 8) // (4 * n_channels)
+    packets = []
+
+    for seq_no in range(1, n_packets + 1):
+        buffer = bytearray(8 + n_samples * n_channels * 4)
+        pack_into('<LL', buffer, 0, seq_no, 1)
+        buffer[8:] = np.random.randn(n_samples, n_channels).astype('<f4').tobytes()
+        packets.append(bytes(buffer))
+
+    return packets
+
+
+def parse_sensor_data_struct(data: bytes, n_channels: int) -> np.ndarray:
+    """
+    Reference implementation of the former per-sample struct based decoder.
+    """
+
+    n_bytes = len(data)
+    n_values = int((n_bytes - 8) / 4)
+    n_samples = int(n_values / n_channels)
+    unpack_format = '<' + 'f' * n_channels
+
+    sensor_data = []
+
+    for idx in range(0, n_samples):
+        sample = unpack_from(unpack_format, data, 8 + idx * n_channels * 4)
+        sensor_data.append(sample)
+
+    return np.array(sensor_data)
+
+
+def measure(name: str, decode, packets: list[bytes]) -> float:
+    """
+    Decode all packets and report the time per packet.
+    """
+
+    start_time = time.perf_counter()
+    for packet in packets:
+        decode(packet)
+    runtime = time.perf_counter() - start_time
+
+    n_samples = sum((len(p) - 8) // (4 * N_CHANNELS) for p in packets)
+    print(f'{name:<28} {runtime / len(packets) * 1e6:10.2f} us/packet {n_samples / runtime / 1e6:10.2f} MSamples/s')
+
+    return runtime
+
+
+if __name__ == '__main__':
+    n_packets = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    packets = create_packets(n_packets)
+
+    mconfig = MeasurementConfiguration(96000, [ChannelConfiguration(i, name) for i, name in enumerate(['Audio', 'Voltage', 'Current'])])
+
+    sources = {}
+    for dtype in [np.float64, np.float32]:
+        source = UDPDataSource(dtype=dtype)
+        source.mconfig = mconfig
+        sources[np.dtype(dtype).name] = source
+
+    # sanity check: all decoders have to produce the same values
+    reference = parse_sensor_data_struct(packets[0], N_CHANNELS)
+    for source in sources.values():
+        assert np.array_equal(reference, source.parseSensorData(packets[0]))
+
+    print(f'Decoding {n_packets} packets with {reference.shape[0]} samples x {N_CHANNELS} channels each:')
+    baseline = measure('struct (per sample)', lambda p: parse_sensor_data_struct(p, N_CHANNELS), packets)
+    for name, source in sources.items():
+        runtime = measure(f'vectorized ({name})', source.parseSensorData, packets)
+        print(f'{"":<28} speedup: {baseline / runtime:.1f}x')
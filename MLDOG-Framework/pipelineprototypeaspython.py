@@ -47,23 +47,23 @@ breakpoint1 = '2024_10_23_10_32_42_96000Hz.csv'
 
 
 # Listgeneration for Traindataframe
+trainFiles = []
 for datafr in dfmeasurements['dataFile']:
 
-    tempdf = pd.read_csv(f'data/{datafr}') # Pfad variiert je nach Pc -> damit funktioniert anpassen
-
-    audioAvg = tempdf['# Audio'].mean()
-    voltageAvg = tempdf['Voltage'].mean()
-    currentAvg = tempdf['Current'].mean()
-    time = tempdf.shape[0] / 96000
-
-    lisVoltTrain += [voltageAvg]
-    lisCurrentTrain += [currentAvg]
-    lisTimeTrain += [time]
-    lisAudioTrain += [audioAvg]
+    trainFiles += [f'data/{datafr}'] # Pfad variiert je nach Pc -> damit funktioniert anpassen
 
     if datafr == breakpoint1:
         break
 
+# features (AudioAvg, VoltageAvg, CurrentAvg, time) are cached in data/.features -> only new recordings are read
+# (single process: this script has no main guard, worker processes would re-run it when spawned)
+featureStore = dog.FeatureStore('data/.features')
+trainFeatures = featureStore.getFeatures(trainFiles, 'basic', n_workers=1)
+lisAudioTrain, lisVoltTrain, lisCurrentTrain, lisTimeTrain = (list(column) for column in trainFeatures.T)
+
+# tsfresh features (parallel over recordings, cached in the same store) -> pipeline step: TsfreshFeatureExtractor('efficient-live')
+# trainTsfresh = dog.tsfresh_features.extract_tsfresh_recording_features(trainFiles, 'efficient-live', store=featureStore)
+
         
         
 
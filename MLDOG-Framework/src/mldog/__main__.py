@@ -0,0 +1,29 @@
+# command line entry point: python -m mldog <command> [options]
+import importlib
+import sys
+
+
+# available commands: name -> (module providing a main(argv) function, description)
+COMMANDS = {
+    'simulate': ('mldog.util.drill.simulator', 'replay recordings or synthetic signals via the capturama UDP protocol'),
+    'score': ('mldog.app.model.scoring', 'classify all recordings of a measurement series and report the accuracy'),
+    'benchmark': ('mldog.app.model.challenge_benchmark', 'measure the prediction latency of a challenge task on drill recordings'),
+    'train': ('mldog.app.model.training', 'train a material classifier on a measurement series and export the model artifact'),
+}
+
+
+def main(argv: list[str] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if len(argv) == 0 or argv[0] not in COMMANDS:
+        print('usage: python -m mldog <command> [options]\n\ncommands:')
+        for name, (_, description) in COMMANDS.items():
+            print(f'  {name:<12} {description}')
+        sys.exit(0 if len(argv) > 0 and argv[0] in ('-h', '--help') else 2)
+
+    module = importlib.import_module(COMMANDS[argv[0]][0])
+    module.main(argv[1:])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+import time
+from queue import Full, Queue
+
+
+
+class BoundedQueue(Queue):
+    """
+    Queue with a fixed capacity and a selectable overflow policy, used between data source, task and UI.
+
+    Overflow policies (applied when putting into a full queue):
+    - 'block': the producer waits until space is available (backpressure), until the queue is closed
+    - 'drop_oldest': the oldest queued item is discarded in favor of the new one
+    - 'drop_newest': the new item is discarded
+    - 'sample': only every sample_every-th item arriving while the queue is full is kept (replacing the oldest one), thus
+      the stream is decimated under overload instead of cut off
+
+    A capacity of 0 means unbounded (like queue.Queue). Queue depth and drop counters are available via getStatistics().
+    """
+
+    POLICIES = ('block', 'drop_oldest', 'drop_newest', 'sample')
+
+    def __init__(self, maxsize: int = 0, policy: str = 'block', sample_every: int = 4):
+        """
+        Construct a new bounded queue.
+
+        Parameters
+        ----------
+        maxsize : int
+            The capacity of the queue (number of items), 0 for unbounded.
+        policy : str
+            The overflow policy, one of 'block', 'drop_oldest', 'drop_newest' or 'sample'.
+        sample_every : int
+            The decimation factor of the 'sample' policy.
+        """
+
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unknown queue overflow policy "{policy}"')
+
+        super().__init__(maxsize)
+
+        self.policy: str = policy
+        self.sample_every: int = max(1, sample_every)
+
+        self._closed: bool = False
+        self._overflow_count: int = 0
+
+        self.n_put: int = 0
+        self.n_dropped: int = 0
+        self.max_depth: int = 0
+        self.blocked_time: float = 0.0
+
+
+    def close(self) -> None:
+        """
+        Close the queue, waking up blocked producers. Items put into a closed queue are dropped.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self.mutex:
+            self._closed = True
+            self.not_full.notify_all()
+
+
+    def isClosed(self) -> bool:
+        """
+        Check if the queue is closed.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        closed : bool
+            True, if the queue is closed, False otherwise.
+        """
+
+        return self._closed
+
+
+    def put(self, item, block: bool = True, timeout: float = None) -> None:
+        """
+        Put an item into the queue, applying the overflow policy if the queue is full.
+
+        Parameters
+        ----------
+        item : object
+            The item to put.
+        block : bool
+            False, to raise queue.Full instead of waiting ('block' policy only).
+        timeout : float
+            The maximum waiting time in seconds ('block' policy only), None to wait until space is available or the queue is closed.
+
+        Returns
+        -------
+        None
+        """
+
+        with self.not_full:
+            if self._closed:
+                self.n_dropped += 1
+                return
+
+            if self.maxsize > 0 and self._qsize() >= self.maxsize:
+                if self.policy == 'block':
+                    if not block:
+                        raise Full
+
+                    start_time = time.perf_counter()
+                    end_time = None if timeout is None else start_time + timeout
+                    while self._qsize() >= self.maxsize and not self._closed:
+                        remaining = None if end_time is None else end_time - time.perf_counter()
+                        if remaining is not None and remaining <= 0:
+                            self.blocked_time += time.perf_counter() - start_time
+                            raise Full
+                        self.not_full.wait(remaining)
+                    self.blocked_time += time.perf_counter() - start_time
+
+                    if self._closed:
+                        self.n_dropped += 1
+                        return
+
+                elif self.policy == 'drop_newest':
+                    self.n_dropped += 1
+                    return
+
+                else:
+                    if self.policy == 'sample':
+                        self._overflow_count += 1
+                        if self._overflow_count % self.sample_every != 0:
+                            self.n_dropped += 1
+                            return
+
+                    # discard the oldest item
+                    self._get()
+                    self.unfinished_tasks -= 1
+                    self.n_dropped += 1
+            else:
+                self._overflow_count = 0
+
+            self._put(item)
+            self.n_put += 1
+            self.unfinished_tasks += 1
+            self.max_depth = max(self.max_depth, self._qsize())
+            self.not_empty.notify()
+
+
+    def getAll(self) -> list:
+        """
+        Retrieve all pending items at once (with a single lock round-trip).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        items : list
+            The pending items, in the order they were put.
+        """
+
+        with self.not_full:
+            items = list(self.queue)
+            self.queue.clear()
+            self.unfinished_tasks -= len(items)
+            self.not_full.notify_all()
+
+        return items
+
+
+    def getStatistics(self) -> dict:
+        """
+        Retrieve the queue statistics.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        statistics : dict
+            The capacity, policy, current and maximum depth, number of queued and dropped items and the time producers were blocked.
+        """
+
+        with self.mutex:
+            return {
+                'capacity': self.maxsize,
+                'policy': self.policy,
+                'depth': self._qsize(),
+                'max_depth': self.max_depth,
+                'put': self.n_put,
+                'dropped': self.n_dropped,
+                'blocked_time': self.blocked_time,
+            }
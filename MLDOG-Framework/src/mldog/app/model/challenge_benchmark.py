@@ -0,0 +1,273 @@
+# latency benchmark of challenge tasks: python -m mldog benchmark <recordings directory> [--task module:Class]
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .challenge_task import ChallengeTask
+from ...util.drill.io import RECORDING_EXTENSION, read_measurement_array
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+# default challenge task
+DEFAULT_TASK = 'mldog.app.tasks.example_challenge_task:ExampleChallengeTask'
+
+# reported latency percentiles
+PERCENTILES = [50, 95, 99]
+
+
+def loadChallengeTask(spec: str) -> ChallengeTask:
+    """
+    Create a challenge task instance of the given class.
+
+    Parameters
+    ----------
+    spec : str
+        The challenge task class as 'module:Class' (or 'module.Class'), e.g. 'mldog.app.tasks.example_challenge_task:ExampleChallengeTask'.
+
+    Returns
+    -------
+    task : ChallengeTask
+        The new challenge task instance.
+    """
+
+    module_name, _, class_name = spec.rpartition(':') if ':' in spec else spec.rpartition('.')
+    task_class = getattr(importlib.import_module(module_name), class_name)
+
+    if not (isinstance(task_class, type) and issubclass(task_class, ChallengeTask)):
+        raise TypeError(f'{spec} is not a ChallengeTask subclass')
+
+    return task_class()
+
+
+def listRecordings(directory: str) -> list[str]:
+    """
+    List the drill recordings of a directory, in the order of its measurements.csv table if available.
+
+    Parameters
+    ----------
+    directory : str
+        The recordings directory.
+
+    Returns
+    -------
+    files : list[str]
+        The paths of the recordings.
+    """
+
+    measurements_file = os.path.join(directory, 'measurements.csv')
+    if os.path.exists(measurements_file):
+        data_files = pd.read_csv(measurements_file)['dataFile'].dropna()
+        files = [os.path.join(directory, data_file) for data_file in data_files if data_file != '']
+        return [file for file in files if os.path.exists(file)]
+
+    return [os.path.join(directory, fname) for fname in sorted(os.listdir(directory))
+            if (fname.endswith('.csv') or fname.endswith(RECORDING_EXTENSION)) and fname not in ('measurements.csv', 'predictions.csv')]
+
+
+def getPeakRss() -> int:
+    """
+    Retrieve the peak resident set size of the process in bytes (None if not available on this platform).
+    """
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def summarizeLatencies(latencies: np.ndarray) -> dict:
+    """
+    Compute the summary statistics (in milliseconds) of the given latencies (in seconds).
+
+    Parameters
+    ----------
+    latencies : ndarray
+        The latencies of the measured calls.
+
+    Returns
+    -------
+    summary : dict
+        The count, mean, std, min, max and percentiles of the latencies.
+    """
+
+    if len(latencies) == 0:
+        return {'count': 0}
+
+    latencies = np.asarray(latencies) * 1000
+    summary = {
+        'count': int(len(latencies)),
+        'mean_ms': float(np.mean(latencies)),
+        'std_ms': float(np.std(latencies)),
+        'min_ms': float(np.min(latencies)),
+        'max_ms': float(np.max(latencies)),
+    }
+    for percentile, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+        summary[f'p{percentile}_ms'] = float(value)
+
+    return summary
+
+
+def benchmarkChallengeTask(task: ChallengeTask, recordings: list[np.ndarray], repetitions: int = 1, warmup: int = 5,
+                           budget: float = None, frequency: int = 96000) -> dict:
+    """
+    Measure the prediction latency of a challenge task on the given drill procedures.
+
+    Each predict call is timed by wall clock time (perf_counter, covering I/O, waiting on threads, ...) and by CPU time of the
+    process (process_time, covering all threads including BLAS workers). The data is copied before each call, outside the
+    measurement (as done by ChallengeTask.run()). The first warmup calls (lazy model loading, caches, ...) are reported separately
+    from the steady state.
+
+    Parameters
+    ----------
+    task : ChallengeTask
+        The challenge task to measure.
+    recordings : list[ndarray]
+        The (n_samples, n_channels) drill procedures.
+    repetitions : int
+        The number of passes over all recordings.
+    warmup : int
+        The number of initial calls reported as warm-up.
+    budget : float
+        The latency budget in milliseconds, or None.
+    frequency : int
+        The sample rate of the recordings (to report the processed signal duration).
+
+    Returns
+    -------
+    results : dict
+        The benchmark results (JSON serializable).
+    """
+
+    rss_start = getPeakRss()
+    n_calls = len(recordings) * repetitions
+    wall_times = np.zeros(n_calls)
+    cpu_times = np.zeros(n_calls)
+    predictions = {}
+
+    for idx in range(n_calls):
+        data_copy = recordings[idx % len(recordings)].copy()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = task.predict(drill_data=data_copy)
+        cpu_times[idx] = time.process_time() - cpu_start
+        wall_times[idx] = time.perf_counter() - wall_start
+
+        predictions[str(result)] = predictions.get(str(result), 0) + 1
+
+    warmup = min(warmup, n_calls)
+    steady_wall = wall_times[warmup:]
+    steady_samples = sum(recordings[idx % len(recordings)].shape[0] for idx in range(warmup, n_calls))
+
+    results = {
+        'task': task.getName(),
+        'task_class': f'{type(task).__module__}:{type(task).__name__}',
+        'n_recordings': len(recordings),
+        'repetitions': repetitions,
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'first_call_ms': float(wall_times[0] * 1000) if n_calls > 0 else None,
+        'warmup': {
+            'wall': summarizeLatencies(wall_times[:warmup]),
+            'cpu': summarizeLatencies(cpu_times[:warmup]),
+        },
+        'steady': {
+            'wall': summarizeLatencies(steady_wall),
+            'cpu': summarizeLatencies(cpu_times[warmup:]),
+        },
+        'total_wall_s': float(np.sum(wall_times)),
+        'total_cpu_s': float(np.sum(cpu_times)),
+        'throughput_per_s': float(len(steady_wall) / np.sum(steady_wall)) if np.sum(steady_wall) > 0 else None,
+        'realtime_factor': float(steady_samples / frequency / np.sum(steady_wall)) if np.sum(steady_wall) > 0 else None,
+        'peak_rss_bytes': getPeakRss(),
+        'peak_rss_start_bytes': rss_start,
+        'predictions': predictions,
+    }
+
+    if budget is not None:
+        results['budget_ms'] = budget
+        results['over_budget'] = int(np.count_nonzero(steady_wall * 1000 > budget))
+        results['within_budget'] = bool(len(steady_wall) == 0 or results['steady']['wall']['p99_ms'] <= budget)
+
+    return results
+
+
+def printResults(results: dict) -> None:
+    """
+    Print a human readable summary of the benchmark results.
+    """
+
+    print(f'{results["task"]} ({results["task_class"]}): {results["n_recordings"]} recordings x {results["repetitions"]}')
+    print(f'  first call:  {results["first_call_ms"]:.2f} ms')
+
+    for phase in ('warmup', 'steady'):
+        wall, cpu = results[phase]['wall'], results[phase]['cpu']
+        if wall['count'] == 0:
+            continue
+        print(f'  {phase:<7} wall: mean {wall["mean_ms"]:.2f} ms, ' + ', '.join(f'p{p} {wall[f"p{p}_ms"]:.2f} ms' for p in PERCENTILES) + f' ({wall["count"]} calls)')
+        print(f'  {phase:<7} cpu:  mean {cpu["mean_ms"]:.2f} ms, ' + ', '.join(f'p{p} {cpu[f"p{p}_ms"]:.2f} ms' for p in PERCENTILES))
+
+    if results['throughput_per_s'] is not None:
+        print(f'  throughput:  {results["throughput_per_s"]:.1f} predictions/s ({results["realtime_factor"]:.0f}x real time)')
+    if results['peak_rss_bytes'] is not None:
+        print(f'  peak RSS:    {results["peak_rss_bytes"] / 2**20:.1f} MiB')
+    if 'budget_ms' in results:
+        print(f'  budget:      {results["budget_ms"]:.1f} ms -> {"OK" if results["within_budget"] else "EXCEEDED"} ({results["over_budget"]} calls over budget)')
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command line entry point of the challenge task benchmark.
+    """
+
+    parser = argparse.ArgumentParser(prog='mldog benchmark', description='Measure the prediction latency of a challenge task on a directory of drill recordings.')
+    parser.add_argument('directory', help='directory of drill recordings (.csv or binary), ordered by measurements.csv if available')
+    parser.add_argument('--task', default=DEFAULT_TASK, help=f'challenge task class as module:Class (default: {DEFAULT_TASK})')
+    parser.add_argument('--repetitions', type=int, default=1, help='passes over all recordings (default: 1)')
+    parser.add_argument('--warmup', type=int, default=5, help='initial calls reported as warm-up (default: 5)')
+    parser.add_argument('--limit', type=int, default=None, help='maximum number of recordings (default: all)')
+    parser.add_argument('--budget', type=float, default=None, help='latency budget in ms, checked against the steady state p99')
+    parser.add_argument('--output', default=None, help='write the results as JSON to this file')
+    args = parser.parse_args(argv)
+
+    # recordings are loaded before the task is created, thus file I/O of the replay is not measured
+    files = listRecordings(args.directory)[:args.limit]
+    if len(files) == 0:
+        parser.error(f'no recordings found in {args.directory}')
+    recordings = [read_measurement_array(file, csv_dtype=np.float64)[0] for file in files]
+
+    setup_start = time.perf_counter()
+    task = loadChallengeTask(args.task)
+    setup_time = time.perf_counter() - setup_start
+
+    results = benchmarkChallengeTask(task, recordings, args.repetitions, args.warmup, args.budget)
+    results['setup_ms'] = setup_time * 1000
+
+    printResults(results)
+    print(f'  setup:       {results["setup_ms"]:.2f} ms')
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if 'within_budget' in results and not results['within_budget']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,10 @@ from threading import Thread
 from .event_dispatcher import EventDispatcher
 from .data_source import DataSource
 from .task import Task
+from .result_notifier import ResultNotifier
+from .result_coalescer import ResultCoalescer
+from .task_binding import TaskBinding
+from .fan_out import FanOut
 from queue import Queue, Empty
 
 from typing import Callable, Any
@@ -28,15 +32,20 @@ class Core(EventDispatcher):
         # the data source (live/dummy/log/etc.)
         self._data_source: DataSource = None
 
-        # the task
+        # the task (of the active application)
         self._task: Task = None
 
-        # the task result listener callback
-        self._task_result_callback: Callable[[Any], None] = None
+        # all running tasks (the task of the active application and additional tasks), with their worker threads and result routing
+        self._bindings: list[TaskBinding] = []
+
+        # the broadcast stage passing the data of the data source to all running tasks
+        self._fan_out: FanOut = FanOut()
+
+        # the wakeup channel signaling new task results
+        self._result_notifier: ResultNotifier = ResultNotifier()
 
         # the thread instances
         self._data_thread: Thread = None
-        self._task_thread: Thread = None
 
     
     def getActiveDataSource(self) -> DataSource:
@@ -55,6 +64,23 @@ class Core(EventDispatcher):
 
         return self._data_source
 
+
+    def getDataSourceStatistics(self) -> dict:
+        """
+        Retrieve the stream statistics of the active data source.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        statistics : dict
+            A snapshot of the stream statistics (see StreamStatistics.snapshot()), or None if no data source is active or the data source does not collect statistics.
+        """
+
+        return None if self._data_source is None else self._data_source.getStatistics()
+
     
     def getActiveTask(self) -> Task:
         """
@@ -73,6 +99,127 @@ class Core(EventDispatcher):
         return self._task
     
 
+    def getResultNotifier(self) -> ResultNotifier:
+        """
+        Retrieve the notifier signaling new task results.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        notifier : ResultNotifier
+            The result notifier, shared by all tasks of this core.
+        """
+
+        return self._result_notifier
+
+
+    def getTasks(self) -> list[Task]:
+        """
+        Retrieve all running tasks.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        tasks : list[Task]
+            The task of the active application (if any) and all additional tasks (see addTask()).
+        """
+
+        return [binding.task for binding in self._bindings]
+
+
+    def _getBinding(self, task: Task = None) -> TaskBinding:
+        """
+        Retrieve the binding of the given task (None for the active task), or None if the task is not running.
+        """
+
+        task = task if task is not None else self._task
+
+        for binding in self._bindings:
+            if binding.task is task:
+                return binding
+
+        return None
+
+
+    def getResultStatistics(self, task: Task = None) -> dict:
+        """
+        Retrieve the result coalescing statistics of a task.
+
+        Parameters
+        ----------
+        task : Task
+            The task, None for the active task.
+
+        Returns
+        -------
+        statistics : dict
+            The number of received, dispatched, merged and dropped results (see ResultCoalescer.getStatistics()), or None if the task is not running.
+        """
+
+        binding = self._getBinding(task)
+        return None if binding is None else binding.coalescer.getStatistics()
+
+
+    def getQueueStatistics(self, task: Task = None) -> dict:
+        """
+        Retrieve the depth and drop counters of the data and result queues of a task.
+
+        Parameters
+        ----------
+        task : Task
+            The task, None for the active task.
+
+        Returns
+        -------
+        statistics : dict
+            The statistics of the data queue ('data') and the result queue ('result') (see BoundedQueue.getStatistics()), or None if the task is not running.
+        """
+
+        binding = self._getBinding(task)
+        return None if binding is None else binding.task.getQueueStatistics()
+
+
+    def getResultDispatchDelay(self) -> float:
+        """
+        Retrieve the time until the next result dispatch is allowed by the frame rate limits of the tasks with pending results.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        delay : float
+            The remaining time in seconds, 0 if results can be dispatched immediately.
+        """
+
+        delays = [binding.coalescer.getDispatchDelay() for binding in self._bindings if binding.hasPendingResults()]
+        return min(delays, default=0.0)
+
+
+    def hasPendingTaskResults(self) -> bool:
+        """
+        Check for task results which are not dispatched yet (e.g. held back by a frame rate limit).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        pending : bool
+            True, if any task has pending results, False otherwise.
+        """
+
+        return any(binding.hasPendingResults() for binding in self._bindings)
+
+
     def hasActiveDataSource(self) -> bool:
         """
         Check for valid data source instance.
@@ -107,6 +254,23 @@ class Core(EventDispatcher):
         return self._task is not None
 
 
+    def hasTasks(self) -> bool:
+        """
+        Check for running tasks (the active task or additional tasks).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        running : bool
+            True, if at least one task is running, False otherwise.
+        """
+
+        return len(self._bindings) > 0
+
+
     def setDataSource(self, source: DataSource = None) -> None:
         """
         Set the active data source instance.
@@ -155,9 +319,13 @@ class Core(EventDispatcher):
     def setTask(self,
                 task: Task = None,
                 task_result_callback: Callable[[Any], None] = None,
-                autostart: bool = True) -> None:
+                autostart: bool = True,
+                batch_results: bool = False,
+                coalescer: ResultCoalescer = None) -> None:
         """
-        Start a new task.
+        Start a new task (the task of the active application), replacing the previous one.
+
+        Additional tasks (see addTask()) are not affected, and a running measurement continues while additional tasks are running.
 
         Parameters
         ----------
@@ -167,45 +335,132 @@ class Core(EventDispatcher):
             The method to call for new task results.
         autostart : bool
             True if a new measurement should be automatically started for the given task, False if not.
+        batch_results : bool
+            True, if the callback should receive a list of all pending results at once, False for one call per result.
+        coalescer : ResultCoalescer
+            The coalescing of pending results (merging stream chunks, dropping intermediate results, frame rate limit), None to pass on all results.
 
         Returns
         -------
         None
         """
 
-        # stop any active measurements
-        self.stopMeasurement()
+        # stop any active measurements (unless additional tasks keep processing the data stream)
+        if not any(binding.task is not self._task for binding in self._bindings):
+            self.stopMeasurement()
         
         # shutdown current task and wait for task thread to finish
         if self._task is not None:
-            print(f'===== Shutdown Task: "{self._task.getName()}"')
-            self._task.shutdown()
-
-            if self._task_thread is not None:
-                print('-> Waiting for processing thread to finish... ', end='')
-                self._task_thread.join()
-                print('done!')
-                self._task_thread = None
+            self._stopTask(self._task)
         
         # set new task
         self._task = task
-        self._task_result_callback = task_result_callback
 
         if self._task is not None:
-            print(f'===== Run Task: "{self._task.getName()}"')
-
-            # start new task thread
-            self._task_thread = Thread(target = self._task.run, daemon = True)
-            self._task_thread.start()
+            self._startTask(TaskBinding(task, task_result_callback, batch_results, coalescer))
 
         # publish event
         self._dispatchEvent('task_changed')
 
         # autostart a new measurement if requested
-        if autostart:
+        if autostart and not self.isMeasuring():
             self.startMeasurement()
 
 
+    def addTask(self,
+                task: Task,
+                task_result_callback: Callable[[Any], None] = None,
+                batch_results: bool = False,
+                coalescer: ResultCoalescer = None,
+                autostart: bool = True) -> None:
+        """
+        Start an additional task, processing the same data stream as the active task (e.g. monitoring, recording and classification at once).
+
+        Each chunk of the data source is broadcast to all running tasks as a shared read-only array, each task processes it in its
+        own thread and its results are routed to its own callback. Additional tasks are kept when the active task changes
+        (see setTask()) and can be added or removed during a measurement.
+
+        Parameters
+        ----------
+        task : Task
+            The task instance to start in a dedicated thread.
+        task_result_callback : Callback[[Any], None]
+            The method to call for new task results.
+        batch_results : bool
+            True, if the callback should receive a list of all pending results at once, False for one call per result.
+        coalescer : ResultCoalescer
+            The coalescing of pending results, None to pass on all results.
+        autostart : bool
+            True if a new measurement should be automatically started if none is active, False if not.
+
+        Returns
+        -------
+        None
+        """
+
+        self._startTask(TaskBinding(task, task_result_callback, batch_results, coalescer))
+
+        # publish event
+        self._dispatchEvent('task_changed')
+
+        if autostart and not self.isMeasuring():
+            self.startMeasurement()
+
+
+    def removeTask(self, task: Task) -> None:
+        """
+        Stop a running task (see addTask()).
+
+        Parameters
+        ----------
+        task : Task
+            The task to stop.
+
+        Returns
+        -------
+        None
+        """
+
+        if task is self._task:
+            self.setTask(autostart=self.isMeasuring())
+            return
+
+        self._stopTask(task)
+
+        if len(self._bindings) == 0:
+            self.stopMeasurement()
+
+        # publish event
+        self._dispatchEvent('task_changed')
+
+
+    def _startTask(self, binding: TaskBinding) -> None:
+        """
+        Start the task of the given binding and connect it to the data stream and the result notifier.
+        """
+
+        binding.task.setResultNotifier(self._result_notifier)
+        binding.start()
+
+        self._bindings.append(binding)
+        self._fan_out.addQueue(binding.task.getDataQueue())
+
+
+    def _stopTask(self, task: Task) -> None:
+        """
+        Disconnect the given task from the data stream and stop it.
+        """
+
+        binding = self._getBinding(task)
+        if binding is None:
+            return
+
+        self._fan_out.removeQueue(task.getDataQueue())
+        self._bindings.remove(binding)
+
+        binding.stop()
+
+
     def startMeasurement(self) -> None:
         """
         Instruct the data source to start a new measurement.
@@ -219,8 +474,8 @@ class Core(EventDispatcher):
         None
         """
         
-        if self._data_source is not None and self._task is not None:
-            self._data_source.startMeasurement(self._task.getDataQueue())
+        if self._data_source is not None and len(self._bindings) > 0:
+            self._data_source.startMeasurement(self._fan_out)
 
 
     def stopMeasurement(self) -> None:
@@ -276,9 +531,14 @@ class Core(EventDispatcher):
             self.startMeasurement()
 
 
-    def checkForTaskResults(self) -> None:
+    def checkForTaskResults(self) -> int:
         """
-        Check result queue of active task for updates and notify listeners accordingly.
+        Check result queues of all running tasks for updates and notify listeners accordingly.
+
+        All results pending at the time of the call are coalesced and dispatched to the callback of their task, either one by one
+        or as a single batch (see setTask()). Results of tasks whose frame rate limit does not allow a dispatch yet are kept pending,
+        see getResultDispatchDelay() and hasPendingTaskResults().
+        Failed tasks (see Task.hasFailed()) are disconnected from the data stream and reported via the 'task_failed' event.
 
         Parameters
         ----------
@@ -286,21 +546,33 @@ class Core(EventDispatcher):
 
         Returns
         -------
-        None
+        n_results : int
+            The number of dispatched results.
         """
 
-        if self._task is None:
-            # no active task, thus nothing to check
-            return
-        
-        result_queue = self._task.getResultQueue()
-        while result_queue.qsize() > 0:
-            try:
-                msg = result_queue.get(block=False)
-            except Empty as e:
-                # return in case of an empty message
-                return
-            
-            # forward task message to result listener callback
-            if not self._task_result_callback is None:
-                self._task_result_callback(msg)
+        # reset the wakeup state first, thus results published from now on signal a new wakeup
+        self._result_notifier.drain()
+
+        # iterate over a copy, as callbacks may change the running tasks
+        n_results = sum(binding.dispatchResults() for binding in list(self._bindings))
+
+        for binding in list(self._bindings):
+            if binding.task.hasFailed():
+                self._detachFailedTask(binding)
+
+        return n_results
+
+
+    def _detachFailedTask(self, binding: TaskBinding) -> None:
+        """
+        Disconnect a task which stopped due to an exception (see Task.hasFailed()) and publish the failure.
+        """
+
+        self._stopTask(binding.task)
+
+        if len(self._bindings) == 0:
+            self.stopMeasurement()
+
+        # publish events
+        self._dispatchEvent('task_failed', task=binding.task, error=binding.task.getError())
+        self._dispatchEvent('task_changed')
@@ -1,6 +1,7 @@
 from queue import Queue
 
 from .event_dispatcher import EventDispatcher
+from .stream_statistics import StreamStatistics
 
 
 
@@ -59,6 +60,7 @@ class DataSource(EventDispatcher):
         self.name: str = name
         self.mconfig: MeasurementConfiguration = None
         self.data_queue: Queue = None
+        self.statistics: StreamStatistics = None
     
 
     def getName(self) -> str:
@@ -77,6 +79,14 @@ class DataSource(EventDispatcher):
         return self.mconfig
 
 
+    def getStatistics(self) -> dict:
+        """
+        Retrieve a snapshot of the stream statistics, or None if this data source does not collect statistics.
+        """
+
+        return None if self.statistics is None else self.statistics.snapshot()
+
+
     def setup(self):
         """
         Setup the data source.
@@ -0,0 +1,127 @@
+from threading import Lock
+
+import numpy as np
+
+
+
+class FanOut:
+    """
+    Broadcast stage between a data source and the data queues of multiple tasks.
+
+    The data source publishes into the fan-out like into a single task queue. Each chunk is passed to all registered queues as
+    one shared read-only view, thus no data is copied and no task can modify the data seen by the others.
+    Queues can be added and removed while the data source is publishing (the queue list is replaced, never modified in place).
+
+    Note: task data queues drop their oldest chunks by default, thus a slow task can not slow down the others. A task opting in to
+    the 'block' policy (see Task.configureQueues()) stalls the producer, and thereby all tasks, while its queue is full.
+    """
+
+    def __init__(self):
+        """
+        Construct a new fan-out.
+
+        Parameters
+        ----------
+        None
+        """
+
+        self._queues: tuple = ()
+        self._lock: Lock = Lock()
+
+
+    def addQueue(self, queue) -> None:
+        """
+        Register a data queue.
+
+        Parameters
+        ----------
+        queue : BoundedQueue | SPSCChannel
+            The data queue of a task.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            if queue not in self._queues:
+                self._queues = self._queues + (queue,)
+
+
+    def removeQueue(self, queue) -> None:
+        """
+        Unregister a data queue.
+
+        Parameters
+        ----------
+        queue : BoundedQueue | SPSCChannel
+            The data queue of a task.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._queues = tuple(q for q in self._queues if q is not queue)
+
+
+    def getQueues(self) -> tuple:
+        """
+        Retrieve the registered data queues.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        queues : tuple
+            The registered data queues.
+        """
+
+        return self._queues
+
+
+    def put(self, item, block: bool = True, timeout: float = None) -> None:
+        """
+        Broadcast an item to all registered queues.
+
+        Parameters
+        ----------
+        item : object
+            The item to broadcast, arrays are passed on as read-only views.
+        block : bool
+            False, to not wait on full queues (see the queue overflow policies).
+        timeout : float
+            The maximum waiting time per queue.
+
+        Returns
+        -------
+        None
+        """
+
+        queues = self._queues
+
+        if isinstance(item, np.ndarray):
+            item = item.view()
+            item.flags.writeable = False
+
+        for queue in queues:
+            queue.put(item, block, timeout)
+
+
+    def put_nowait(self, item) -> None:
+        """
+        Broadcast an item without waiting, see put().
+        """
+
+        self.put(item, block=False)
+
+
+    def qsize(self) -> int:
+        """
+        Retrieve the depth of the fullest registered queue (used by data sources for backpressure).
+        """
+
+        return max((queue.qsize() for queue in self._queues), default=0)
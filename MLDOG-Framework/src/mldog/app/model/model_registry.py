@@ -0,0 +1,215 @@
+import os
+import pickle
+import time
+from threading import Lock
+
+
+
+# environment variable overriding the default model artifact
+MODEL_PATH_ENV = 'MLDOG_MODEL_PATH'
+
+# model artifact shipped with the package
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pipelinecdfFulldata.pkl')
+
+# self-describing model artifacts (written by 'mldog train'): {'format', 'version', 'pipeline', 'metadata'}
+MODEL_FORMAT = 'mldog-model'
+MODEL_FORMAT_VERSION = 1
+
+
+def getDefaultModelPath() -> str:
+    """
+    Retrieve the path of the default model artifact.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    model_path : str
+        The path given by the MLDOG_MODEL_PATH environment variable, or the package-relative default artifact.
+    """
+
+    return os.environ.get(MODEL_PATH_ENV, DEFAULT_MODEL_PATH)
+
+
+def loadPickle(model_path: str) -> object:
+    """
+    Default model loader, unpickling the given model artifact.
+    """
+
+    with open(model_path, 'rb') as model_file:
+        return pickle.load(model_file)
+
+
+def isModelArtifact(model: object) -> bool:
+    """
+    Check if a loaded model is a self-describing model artifact (as opposed to a legacy pickled classifier).
+
+    Parameters
+    ----------
+    model : object
+        The loaded model.
+
+    Returns
+    -------
+    artifact : bool
+        True, if the model is a model artifact of a supported version, False otherwise.
+    """
+
+    if not isinstance(model, dict) or model.get('format') != MODEL_FORMAT:
+        return False
+
+    if model.get('version') != MODEL_FORMAT_VERSION:
+        raise ValueError(f'Unsupported model artifact version {model.get("version")} (supported: {MODEL_FORMAT_VERSION})')
+
+    return True
+
+
+def saveModelArtifact(model_path: str, pipeline: object, metadata: dict) -> dict:
+    """
+    Write a self-describing model artifact.
+
+    The file is replaced atomically, thus running tasks reload the complete artifact (see ModelRegistry) and never a partial file.
+
+    Parameters
+    ----------
+    model_path : str
+        The path of the artifact.
+    pipeline : Pipeline
+        The fitted prediction pipeline (feature extraction and classifier).
+    metadata : dict
+        The artifact metadata (feature set, label map, training time, sample rate, ...).
+
+    Returns
+    -------
+    artifact : dict
+        The written artifact.
+    """
+
+    artifact = {
+        'format': MODEL_FORMAT,
+        'version': MODEL_FORMAT_VERSION,
+        'pipeline': pipeline,
+        'metadata': metadata,
+    }
+
+    with open(model_path + '.tmp', 'wb') as model_file:
+        pickle.dump(artifact, model_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(model_path + '.tmp', model_path)
+
+    return artifact
+
+
+
+class ModelRegistry:
+    """
+    Cache for model artifacts, loading each artifact once - lazily on first access.
+
+    Entries are keyed by the absolute file path and the modification time of the file.
+    If an artifact is replaced on disk, it is reloaded on its next access after the check interval (hot reload).
+    Between two checks, the cached model is returned without touching the file system, thus predictions do not pay for stat calls.
+    Loading is serialized, thus concurrent tasks requesting the same model share a single loaded instance.
+    """
+
+    def __init__(self, loader = loadPickle, check_interval: float = 2.0):
+        """
+        Construct a new model registry.
+
+        Parameters
+        ----------
+        loader : Callable[[str], object]
+            The method loading a model artifact from a given file path.
+        check_interval : float
+            The minimum time (in seconds) between two checks of an artifact for changes on disk.
+        """
+
+        self._loader = loader
+        self.check_interval: float = check_interval
+        self._entries: dict = {}
+        self._checked: dict = {}
+        self._lock: Lock = Lock()
+
+
+    def getModel(self, model_path: str = None, check: bool = False) -> object:
+        """
+        Retrieve the model of the given artifact, loading or reloading it if necessary.
+
+        Parameters
+        ----------
+        model_path : str
+            The path of the model artifact, or None for the default model.
+        check : bool
+            True, to check the artifact for changes immediately, False to check at most once per check interval.
+
+        Returns
+        -------
+        model : object
+            The loaded model.
+        """
+
+        # fast path: the model was checked recently (keyed by the requested path, thus without resolving it)
+        checked = self._checked.get(model_path)
+        if not check and checked is not None and time.monotonic() - checked[0] < self.check_interval:
+            return checked[1]
+
+        resolved_path = os.path.abspath(model_path if model_path is not None else getDefaultModelPath())
+        mtime = os.stat(resolved_path).st_mtime_ns
+
+        with self._lock:
+            entry = self._entries.get(resolved_path)
+
+            if entry is None or entry[0] != mtime:
+                print(f'Loading model: {resolved_path}')
+                entry = (mtime, self._loader(resolved_path))
+                self._entries[resolved_path] = entry
+
+            self._checked[model_path] = (time.monotonic(), entry[1])
+
+            return entry[1]
+
+
+    def isLoaded(self, model_path: str = None) -> bool:
+        """
+        Check if the given artifact is loaded and up to date.
+
+        Parameters
+        ----------
+        model_path : str
+            The path of the model artifact, or None for the default model.
+
+        Returns
+        -------
+        loaded : bool
+            True, if the model is cached and the artifact did not change since, False otherwise.
+        """
+
+        model_path = os.path.abspath(model_path if model_path is not None else getDefaultModelPath())
+
+        with self._lock:
+            entry = self._entries.get(model_path)
+
+        return entry is not None and os.path.exists(model_path) and entry[0] == os.stat(model_path).st_mtime_ns
+
+
+    def clear(self) -> None:
+        """
+        Remove all cached models.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._checked.clear()
+
+
+
+# registry shared by all tasks
+model_registry = ModelRegistry()
@@ -12,109 +12,211 @@ from sklearn.pipeline import Pipeline
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.metrics import accuracy_score
-import pickle
-import os
+import numpy as np
+from threading import Lock
 
+from .model_registry import isModelArtifact, model_registry
+from ...util.drill.features import extract_feature_frame, feature_names
+from ...util.drill.tsfresh_features import extract_tsfresh_feature_frame, tsfresh_feature_names
 
 
-base_dir = os.path.dirname(os.path.abspath(__file__))
-model_path = os.path.join("mldog", "app", "model", "pipelinecdfFulldata.pkl")
+# display names of the material labels of the legacy classifier
+MATERIAL_NAMES = {
+    'kunststoff-pom': 'Kunststoff-POM',
+    'holz-spahn': 'Spanholz',
+}
 
 
-with open(model_path,'rb') as modelFile:
-    clf = pickle.load(modelFile)
+class CsvRestructuring(BaseEstimator, TransformerMixin):
+    """
+    Feature extraction of drill procedures, computed directly on the raw (n_samples, 3) array (or a list of procedures).
 
+    The 'basic' feature set yields the columns AudioAvg, VoltageAvg, CurrentAvg and time the pickled classifier is trained with.
+    """
+
+    def __init__(self, feature_set: str = 'basic', frequency: int = 96000):
+        self.feature_set = feature_set
+        self.frequency = frequency
 
 
-class CsvRestructuring(BaseEstimator, TransformerMixin):
     def fit(self, X, y=None):
         return self
 
 
     def transform(self, X):
-        dfFromArray = pd.DataFrame({
-            '# Audio': X[:,0],
-            'Voltage': X[:,1],
-            'Current': X[:,2],
-        })
-        
-        voltAvg = dfFromArray['Voltage'].mean()
-        curAvg = dfFromArray['Current'].mean()
-        audioAvg = dfFromArray['# Audio'].mean()
-        time = dfFromArray.shape[0] / 96000
-
-        dfTransformer = pd.DataFrame({
-            'AudioAvg': audioAvg,
-            'VoltageAvg': voltAvg,
-            'CurrentAvg': curAvg,
-            'time': time
-        }, index=[0])
-
-        return dfTransformer
+        if isinstance(X, pd.DataFrame):
+            X = X.to_numpy()
+
+        return extract_feature_frame(X, self.frequency, self.feature_set)
+
+
+    def featureNames(self) -> list[str]:
+        """
+        Retrieve the names of the extracted feature columns.
+        """
+
+        return feature_names(self.feature_set)
     
 
-###########################
-# define the transformer
-###########################
+class TsfreshFeatureExtractor(BaseEstimator, TransformerMixin):
+    """
+    tsfresh feature extraction of drill procedures (a single (n_samples, 3) array or a list of procedures).
 
+    The profile selects the calculators: 'minimal' and 'efficient-live' fit the live latency budget,
+    'efficient' and 'comprehensive' are meant for offline training (see util.drill.tsfresh_features).
+    """
 
-# class CsvRestructuring(BaseEstimator, TransformerMixin):
+    def __init__(self, profile: str = 'efficient-live', frequency: int = 96000, n_jobs: int = 0):
+        self.profile = profile
+        self.frequency = frequency
+        self.n_jobs = n_jobs
 
-#     def fit(self, X, y=None):
-#         return self
 
-#     def transform(self, X):
-#         from tsfresh.feature_extraction import EfficientFCParameters
-#         efficient = EfficientFCParameters()
+    def fit(self, X, y=None):
+        return self
 
-#         ass = ['partial_autocorrelation' ,'number_cwt_peaks', 
-#        'agg_linear_trend', 'augmented_dickey_fuller', 'lempel_ziv_complexity', 'permutation_entropy']
 
-#         for x in ass:
-#             del efficient[x]
+    def transform(self, X):
+        if isinstance(X, pd.DataFrame):
+            X = X.to_numpy()
 
-#         dfFromArray = pd.DataFrame({
-#             '# Audio': X[:,0],
-#             'Voltage': X[:,1],
-#             'Current': X[:,2],
-#         })
+        return extract_tsfresh_feature_frame(X, self.profile, self.frequency, self.n_jobs)
 
 
-#         # Per hand features
-#         time = dfFromArray.shape[0] / 96000
+    @property
+    def feature_set(self) -> str:
+        return f'tsfresh-{self.profile}'
 
-#         #hinzufügen der ID
-#         dfFromArray['ID'] = 0
-        
 
+    def featureNames(self) -> list[str]:
+        """
+        Retrieve the names of the extracted feature columns.
+        """
 
-#         features = extract_features(dfFromArray, column_id= 'ID', default_fc_parameters= efficient, n_jobs=0) # MinimalFCParameters() # Minimal
-#         features['time'] = time
-#         return features
+        return tsfresh_feature_names(self.profile)
 
 
 class MaterialClassifier(BaseEstimator):
-    def __init__(self):
-        self.pipeline = self._create_pipeline()
+    """
+    Material classification of drill procedures, based on a model artifact from the model registry.
+
+    Model artifacts written by 'mldog train' contain the complete pipeline and its metadata (feature set, label map, ...) and are used as is.
+    Legacy artifacts (a pickled classifier) are combined with the feature extractor (default: CsvRestructuring with the 'basic' feature set).
+    The model is loaded lazily on first use and reloaded automatically if the artifact changes.
+    Use getShared() to obtain a shared instance per artifact instead of creating a new classifier per prediction.
+    """
+
+    # shared instances per model path
+    _shared: dict = {}
+    _shared_lock = Lock()
+
+
+    def __init__(self, model_path: str = None, feature_extractor: TransformerMixin = None):
+        self.model_path = model_path
+        self.feature_extractor = feature_extractor
+        self.pipeline = None
+        self.metadata = None
+        self._model = None
+
 
-    def _create_pipeline(self):
+    @classmethod
+    def getShared(cls, model_path: str = None) -> 'MaterialClassifier':
+        """
+        Retrieve the shared classifier instance of the given model artifact (None for the default model).
+        """
+
+        with cls._shared_lock:
+            classifier = cls._shared.get(model_path)
+            if classifier is None:
+                classifier = cls(model_path)
+                cls._shared[model_path] = classifier
+
+        return classifier
+
+
+    def _create_pipeline(self, clf):
             pipe = Pipeline([
-                ('csv_scaler', CsvRestructuring()),
+                ('csv_scaler', self.feature_extractor if self.feature_extractor is not None else CsvRestructuring()),
                 ('classifier', clf)
                 ])
             return pipe
 
+    def getPipeline(self) -> Pipeline:
+        """
+        Retrieve the prediction pipeline, (re-)building it if the registry provides a new model.
+        """
+
+        model = model_registry.getModel(self.model_path)
+        if model is not self._model:
+            if isModelArtifact(model):
+                self.pipeline = model['pipeline']
+                self.metadata = model['metadata']
+            else:
+                self.pipeline = self._create_pipeline(model)
+                self.metadata = {
+                    'feature_set': self.pipeline.named_steps['csv_scaler'].feature_set,
+                    'label_map': dict(MATERIAL_NAMES),
+                    'sample_rate': self.pipeline.named_steps['csv_scaler'].frequency,
+                }
+            self._model = model
+
+        return self.pipeline
+
+    def reload(self) -> Pipeline:
+        """
+        Check the model artifact for changes immediately (instead of after the check interval of the registry) and reload it if necessary.
+        """
+
+        model_registry.getModel(self.model_path, check=True)
+        return self.getPipeline()
+
+    def getMetadata(self) -> dict:
+        """
+        Retrieve the metadata of the model artifact (feature set, label map, sample rate, training information).
+        """
+
+        self.getPipeline()
+        return self.metadata
+
+    def warmUp(self) -> None:
+        """
+        Load the classifier and run a dummy prediction, thus the first real prediction only pays for the predict call.
+        """
+
+        self.predict(np.zeros((480, 3)))
+
     def predict(self, X):
-        material = self.pipeline.predict(X)
-        if material == ['kunststoff-pom']:
-            return "Kunststoff-POM"
-        elif material == ['holz-spahn']:
-            return "Spanholz"
-        # if material == 0:
-        #     return "Spanholz"
-        # elif material == 1:
-        #     return "Kunststoff-POM"
-        # elif material == 2:
-        #     return "Holz-Eiche"
-        # elif material == 3:
-        #     return "Metall-Alu"
\ No newline at end of file
+        material = self.getPipeline().predict(X)
+        return self._material_name(material)
+
+    def predictFeatures(self, features):
+        """
+        Classify a drill procedure based on precomputed features (e.g. accumulated while drilling), skipping the feature extraction step.
+        """
+
+        if not isinstance(features, pd.DataFrame):
+            features = pd.DataFrame(np.atleast_2d(features), columns=self.getPipeline().named_steps['csv_scaler'].featureNames())
+
+        material = self.getPipeline().named_steps['classifier'].predict(features)
+        return self._material_name(material)
+
+    def predictBatch(self, drill_data: list) -> np.ndarray:
+        """
+        Classify multiple drill procedures with a single (vectorized) predict call, returning the raw class labels (e.g. 'holz-spahn').
+        """
+
+        return self.predictFeatureBatch(self.getPipeline().named_steps['csv_scaler'].transform(drill_data))
+
+    def predictFeatureBatch(self, features) -> np.ndarray:
+        """
+        Classify multiple drill procedures based on their precomputed (n_procedures, n_features) features, returning the raw class labels.
+        """
+
+        if not isinstance(features, pd.DataFrame):
+            features = pd.DataFrame(np.atleast_2d(features), columns=self.getPipeline().named_steps['csv_scaler'].featureNames())
+
+        return self.getPipeline().named_steps['classifier'].predict(features)
+
+    def _material_name(self, material):
+        label = material[0] if len(material) > 0 else None
+        return self.getMetadata()['label_map'].get(label, label)
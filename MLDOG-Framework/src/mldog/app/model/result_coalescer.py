@@ -0,0 +1,192 @@
+import time
+
+import numpy as np
+
+
+
+class ResultCoalescer:
+    """
+    Coalescing of task results between the result queue and the UI callback.
+
+    All results pending at a dispatch are reduced according to the policy:
+    - 'none': all results are passed on unchanged
+    - 'merge': consecutive (n_samples, n_channels) arrays are concatenated into a single array, other results are passed on unchanged.
+      If max_samples is given, only the latest max_samples samples of a merged array are kept
+    - 'latest': only the latest result is passed on, all intermediate results are dropped
+
+    In addition, the dispatch rate can be limited to max_rate dispatches per second, thus results arriving faster are
+    collected (and coalesced) until the next frame. Therefore the UI work per frame is bounded and no backlog builds up at any input rate.
+    """
+
+    POLICIES = ('none', 'merge', 'latest')
+
+    def __init__(self, policy: str = 'none', max_samples: int = None, max_rate: float = None):
+        """
+        Construct a new result coalescer.
+
+        Parameters
+        ----------
+        policy : str
+            The coalescing policy, one of 'none', 'merge' or 'latest'.
+        max_samples : int
+            The maximum number of samples of a merged array ('merge' policy), None for no limit.
+        max_rate : float
+            The maximum number of dispatches per second, None for no limit.
+        """
+
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unknown result coalescing policy "{policy}"')
+
+        self.policy: str = policy
+        self.max_samples: int = max_samples
+        self.min_interval: float = 0.0 if max_rate is None else 1.0 / max_rate
+
+        self._last_dispatch: float = None
+
+        self.reset()
+
+
+    def reset(self) -> None:
+        """
+        Reset the result statistics.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.received: int = 0
+        self.dispatched: int = 0
+        self.merged: int = 0
+        self.dropped: int = 0
+        self.dropped_samples: int = 0
+        self.frames: int = 0
+
+
+    def getDispatchDelay(self) -> float:
+        """
+        Retrieve the time until the next dispatch is allowed by the rate limit.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        delay : float
+            The remaining time in seconds, 0 if results can be dispatched immediately.
+        """
+
+        if self._last_dispatch is None or self.min_interval <= 0:
+            return 0.0
+
+        return max(0.0, self._last_dispatch + self.min_interval - time.perf_counter())
+
+
+    def coalesce(self, results: list) -> list:
+        """
+        Reduce the given pending results according to the policy.
+
+        Parameters
+        ----------
+        results : list
+            The pending results, in the order of publication.
+
+        Returns
+        -------
+        results : list
+            The results to dispatch.
+        """
+
+        self.received += len(results)
+
+        if len(results) > 0:
+            self.frames += 1
+            self._last_dispatch = time.perf_counter()
+
+        if self.policy == 'latest':
+            coalesced = results[-1:]
+            self.dropped += len(results) - len(coalesced)
+        elif self.policy == 'merge':
+            coalesced = self._merge(results)
+        else:
+            coalesced = results
+
+        self.dispatched += len(coalesced)
+
+        return coalesced
+
+
+    def _merge(self, results: list) -> list:
+        """
+        Concatenate runs of consecutive arrays with equal channel count.
+        """
+
+        coalesced = []
+        run = []
+
+        def flushRun():
+            if len(run) == 0:
+                return
+
+            self.merged += len(run) - 1
+
+            if self.max_samples is not None:
+                # skip chunks beyond the sample limit, thus their samples are never copied
+                first, n_samples = len(run), 0
+                while first > 0 and n_samples < self.max_samples:
+                    first -= 1
+                    n_samples += run[first].shape[0]
+                self.dropped_samples += sum(chunk.shape[0] for chunk in run[:first])
+                del run[:first]
+
+            data = run[0] if len(run) == 1 else np.concatenate(run)
+
+            if self.max_samples is not None and data.shape[0] > self.max_samples:
+                self.dropped_samples += data.shape[0] - self.max_samples
+                data = data[-self.max_samples:]
+
+            coalesced.append(data)
+            run.clear()
+
+        for result in results:
+            if isinstance(result, np.ndarray) and result.ndim == 2:
+                if len(run) > 0 and run[0].shape[1] != result.shape[1]:
+                    flushRun()
+                run.append(result)
+            else:
+                flushRun()
+                coalesced.append(result)
+
+        flushRun()
+
+        return coalesced
+
+
+    def getStatistics(self) -> dict:
+        """
+        Retrieve the result statistics.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        statistics : dict
+            The number of received, dispatched, merged and dropped results, dropped samples and dispatch frames.
+        """
+
+        return {
+            'policy': self.policy,
+            'received': self.received,
+            'dispatched': self.dispatched,
+            'merged': self.merged,
+            'dropped': self.dropped,
+            'dropped_samples': self.dropped_samples,
+            'frames': self.frames,
+        }
@@ -0,0 +1,135 @@
+import os
+from threading import Lock
+
+
+
+class ResultNotifier:
+    """
+    Wakeup channel signaling new task results to the UI thread.
+
+    Producers call notify() after publishing a result, the consumer waits on the read end of a pipe (e.g. via a tkinter file handler)
+    and calls drain() before fetching the results. Only the first notification after a drain writes to the pipe, thus a burst of
+    results causes a single wakeup, independent of the number of results.
+    """
+
+    def __init__(self):
+        """
+        Construct a new result notifier.
+
+        Parameters
+        ----------
+        None
+        """
+
+        self._lock: Lock = Lock()
+        self._signaled: bool = False
+
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+
+
+    def fileno(self) -> int:
+        """
+        Retrieve the file descriptor becoming readable on new notifications.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        fd : int
+            The read end of the wakeup pipe, or None if the notifier is closed.
+        """
+
+        return self._read_fd
+
+
+    def isSignaled(self) -> bool:
+        """
+        Check for pending notifications (without draining them).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        signaled : bool
+            True, if results were published since the last drain, False otherwise.
+        """
+
+        return self._signaled
+
+
+    def notify(self) -> None:
+        """
+        Signal new results (called by the producing thread after publishing a result).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            if self._signaled or self._write_fd is None:
+                return
+            self._signaled = True
+
+            try:
+                os.write(self._write_fd, b'\x01')
+            except BlockingIOError:
+                # pipe full, thus the reader is signaled anyway
+                pass
+
+
+    def drain(self) -> None:
+        """
+        Reset the notification state (called by the consumer before fetching the results).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._signaled = False
+
+            if self._read_fd is None:
+                return
+
+            try:
+                while os.read(self._read_fd, 64):
+                    pass
+            except BlockingIOError:
+                pass
+
+
+    def close(self) -> None:
+        """
+        Close the wakeup pipe.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            if self._read_fd is not None:
+                os.close(self._read_fd)
+                os.close(self._write_fd)
+                self._read_fd = None
+                self._write_fd = None
@@ -0,0 +1,153 @@
+# offline scoring of measurement series: python -m mldog score <measurement series directory>
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from .pipeline import MaterialClassifier, TsfreshFeatureExtractor
+from .model_registry import getDefaultModelPath
+from ...util.drill.feature_store import FeatureStore, FEATURE_STORE_DIR, extract_recording_features
+from ...util.drill.tsfresh_features import extract_tsfresh_recording_features
+
+
+# output files, written next to the measurements.csv table
+PREDICTIONS_FILE = 'predictions.csv'
+SCORES_FILE = 'scores.json'
+
+
+def loadMeasurementSeries(directory: str, feature_set: str = 'basic', n_workers: int = None, batch_size: int = 16,
+                          use_feature_store: bool = True) -> tuple:
+    """
+    Load the measurements table of a measurement series and the features of its recordings.
+
+    Parameters
+    ----------
+    directory : str
+        The measurement series directory (the output layout of the capture plugin: measurements.csv plus one recording per measurement).
+    feature_set : str
+        The feature set, 'basic', 'extended' or 'tsfresh-<profile>' (e.g. 'tsfresh-efficient-live').
+    n_workers : int
+        The number of worker processes for reading recordings, None for the number of CPUs.
+    batch_size : int
+        The number of recordings handed to a worker at once.
+    use_feature_store : bool
+        True, to reuse the features cached in the feature store of the directory (only new or changed recordings are read), False to read all recordings.
+
+    Returns
+    -------
+    (measurements, features) : tuple(DataFrame, ndarray)
+        The measurements of all existing recordings and their (n_recordings, n_features) features.
+    """
+
+    measurements = pd.read_csv(os.path.join(directory, 'measurements.csv'))
+    measurements = measurements[measurements['dataFile'].notna() & (measurements['dataFile'] != '')].reset_index(drop=True)
+
+    files = [os.path.join(directory, data_file) for data_file in measurements['dataFile']]
+    exists = np.array([os.path.exists(file) for file in files], dtype=bool)
+    if not np.all(exists):
+        print(f'Skipping {np.count_nonzero(~exists)} missing recordings')
+        measurements = measurements[exists].reset_index(drop=True)
+        files = [file for file, file_exists in zip(files, exists) if file_exists]
+
+    store = FeatureStore(os.path.join(directory, FEATURE_STORE_DIR)) if use_feature_store else None
+
+    if feature_set.startswith('tsfresh-'):
+        features = extract_tsfresh_recording_features(files, feature_set[len('tsfresh-'):], n_workers, batch_size, store)
+    else:
+        extract = lambda missing_files: extract_recording_features(missing_files, feature_set, n_workers, batch_size)
+        features = store.getFeatures(files, feature_set, extract) if store is not None else extract(files)
+
+    return measurements, features
+
+
+def scoreMeasurementSeries(directory: str, model_path: str = None, n_workers: int = None, batch_size: int = 16, feature_set: str = None,
+                           use_feature_store: bool = True) -> tuple:
+    """
+    Classify all recordings of a measurement series and compare the predictions with the labels of the measurements.csv table.
+
+    Parameters
+    ----------
+    directory : str
+        The measurement series directory (the output layout of the capture plugin: measurements.csv plus one recording per measurement).
+    model_path : str
+        The path of the model artifact, or None for the default model.
+    n_workers : int
+        The number of worker processes for reading recordings, None for the number of CPUs.
+    batch_size : int
+        The number of recordings handed to a worker at once.
+    feature_set : str
+        The feature set the model expects, 'basic', 'extended' or 'tsfresh-<profile>', None for the feature set stored with the model artifact.
+    use_feature_store : bool
+        True, to reuse the features cached in the feature store of the directory (only new or changed recordings are read), False to read all recordings.
+
+    Returns
+    -------
+    (predictions, scores) : tuple(DataFrame, dict)
+        The measurements table extended by a prediction and a correct column, and the summary scores.
+    """
+
+    start_time = time.perf_counter()
+
+    feature_extractor = None
+    if feature_set is not None and feature_set.startswith('tsfresh-'):
+        feature_extractor = TsfreshFeatureExtractor(feature_set[len('tsfresh-'):])
+
+    classifier = MaterialClassifier(model_path, feature_extractor)
+    feature_set = feature_set if feature_set is not None else classifier.getMetadata()['feature_set']
+
+    measurements, features = loadMeasurementSeries(directory, feature_set, n_workers, batch_size, use_feature_store)
+    load_time = time.perf_counter() - start_time
+
+    # single vectorized prediction over all recordings
+    predictions = classifier.predictFeatureBatch(features) if len(measurements) > 0 else np.zeros(0, dtype=object)
+    predict_time = time.perf_counter() - start_time - load_time
+
+    measurements['prediction'] = predictions
+
+    scores = {
+        'model': os.path.abspath(model_path if model_path is not None else getDefaultModelPath()),
+        'n_recordings': len(measurements),
+        'feature_set': feature_set,
+        'load_time': load_time,
+        'predict_time': predict_time,
+    }
+
+    if 'material' in measurements.columns:
+        measurements['correct'] = measurements['material'] == measurements['prediction']
+        scores['accuracy'] = float(measurements['correct'].mean()) if len(measurements) > 0 else None
+        scores['class_accuracy'] = {str(material): float(group['correct'].mean()) for material, group in measurements.groupby('material')}
+
+    return measurements, scores
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command line entry point of the offline scoring.
+    """
+
+    parser = argparse.ArgumentParser(prog='mldog score', description='Classify all recordings of a measurement series and report the accuracy.')
+    parser.add_argument('directory', help='measurement series directory containing measurements.csv')
+    parser.add_argument('--model', default=None, help='model artifact (default: MLDOG_MODEL_PATH or the packaged model)')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--batch-size', type=int, default=16, help='recordings per worker batch (default: 16)')
+    parser.add_argument('--feature-set', default=None, help='feature set expected by the model: basic, extended or tsfresh-<profile> (default: stored with the model)')
+    parser.add_argument('--no-cache', action='store_true', help=f'recompute all features instead of using the feature store ({FEATURE_STORE_DIR})')
+    args = parser.parse_args(argv)
+
+    predictions, scores = scoreMeasurementSeries(args.directory, args.model, args.workers, args.batch_size, args.feature_set, not args.no_cache)
+
+    predictions.to_csv(os.path.join(args.directory, PREDICTIONS_FILE), index=False)
+    with open(os.path.join(args.directory, SCORES_FILE), 'w') as f:
+        json.dump(scores, f, indent=2)
+
+    print(f'Scored {scores["n_recordings"]} recordings in {scores["load_time"] + scores["predict_time"]:.2f}s '
+          f'(loading: {scores["load_time"]:.2f}s, prediction: {scores["predict_time"] * 1000:.1f}ms)')
+    if 'accuracy' in scores and scores['accuracy'] is not None:
+        print(f'Accuracy: {scores["accuracy"]:.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+from multiprocessing import shared_memory
+import numpy as np
+
+
+
+class SharedRingBuffer:
+    """
+    Single-producer ring buffer for measurement samples, located in shared memory.
+
+    The shared memory block starts with a header holding the total number of samples written so far and the end of the write in progress,
+    followed by a (capacity, n_channels) sample array.
+    The producer (possibly in another process) appends samples via write(), consumers keep their own read position and access the written samples
+    via read() as views on the shared memory, i.e. without pickling or copying.
+    Consumers have to keep up with the producer: samples older than capacity are overwritten. As the producer never waits for consumers,
+    a consumer copying samples has to check afterwards which of them may have been overwritten meanwhile (see getPendingIndex()).
+    """
+
+    # size of the header in bytes (keeps the sample array 64 byte aligned)
+    HEADER_SIZE = 64
+
+
+    def __init__(self, capacity: int, n_channels: int, dtype = np.float32, name: str = None):
+        """
+        Create a new shared ring buffer or attach to an existing one.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of samples the ring buffer can hold.
+        n_channels : int
+            The number of channels per sample.
+        dtype : dtype
+            The sample value type.
+        name : str
+            The name of an existing shared memory block to attach to, or None to create a new one.
+        """
+
+        self.capacity: int = capacity
+        self.n_channels: int = n_channels
+        self.dtype: np.dtype = np.dtype(dtype)
+
+        size = self.HEADER_SIZE + capacity * n_channels * self.dtype.itemsize
+        self._owner: bool = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=size)
+
+        self._write_index = np.ndarray((1,), dtype=np.int64, buffer=self._shm.buf, offset=0)
+        self._pending_index = np.ndarray((1,), dtype=np.int64, buffer=self._shm.buf, offset=8)
+        self._data = np.ndarray((capacity, n_channels), dtype=self.dtype, buffer=self._shm.buf, offset=self.HEADER_SIZE)
+
+        if self._owner:
+            self._write_index[0] = 0
+            self._pending_index[0] = 0
+
+
+    def getName(self) -> str:
+        """
+        Retrieve the name of the shared memory block (used to attach from other processes).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        name : str
+            The shared memory block name.
+        """
+
+        return self._shm.name
+
+
+    def getWriteIndex(self) -> int:
+        """
+        Retrieve the total number of samples written to the ring buffer.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        write_index : int
+            The absolute index of the next sample to be written.
+        """
+
+        return int(self._write_index[0])
+
+
+    def getPendingIndex(self) -> int:
+        """
+        Retrieve the end of the samples the producer has written or is currently writing.
+
+        All samples with an absolute index below getPendingIndex() - capacity may have been overwritten.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        pending_index : int
+            The absolute index after the last sample of the write in progress (equal to the write index while the producer is idle).
+        """
+
+        return int(self._pending_index[0])
+
+
+    def write(self, data: np.ndarray) -> None:
+        """
+        Append the given samples to the ring buffer.
+
+        Parameters
+        ----------
+        data : ndarray
+            The (n_samples, n_channels) sample array to append.
+
+        Returns
+        -------
+        None
+        """
+
+        n_samples = data.shape[0]
+        write_index = int(self._write_index[0])
+
+        if n_samples > self.capacity:
+            # only the most recent samples fit into the buffer
+            write_index += n_samples - self.capacity
+            data = data[-self.capacity:]
+            n_samples = self.capacity
+
+        # announce the write first, thus consumers can detect samples overwritten while they copy them
+        self._pending_index[0] = write_index + n_samples
+
+        start = write_index % self.capacity
+        n_first = min(n_samples, self.capacity - start)
+
+        self._data[start:start + n_first] = data[:n_first]
+        self._data[:n_samples - n_first] = data[n_first:]
+
+        # publish new samples only after they have been written
+        self._write_index[0] = write_index + n_samples
+
+
+    def put(self, data: np.ndarray, block: bool = True, timeout: float = None) -> None:
+        """
+        Queue compatible alias for write(), allowing the ring buffer to be used as data source target.
+        """
+
+        self.write(data)
+
+
+    def read(self, start: int, stop: int) -> list[np.ndarray]:
+        """
+        Retrieve read-only views on the samples of the given absolute index range.
+
+        Parameters
+        ----------
+        start : int
+            The absolute index of the first sample.
+        stop : int
+            The absolute index after the last sample (stop - start must not exceed the capacity).
+
+        Returns
+        -------
+        views : list[ndarray]
+            One view, or two views if the range wraps around the end of the buffer.
+        """
+
+        begin = start % self.capacity
+        end = begin + (stop - start)
+
+        if end <= self.capacity:
+            views = [self._data[begin:end]]
+        else:
+            views = [self._data[begin:], self._data[:end - self.capacity]]
+
+        for view in views:
+            view.flags.writeable = False
+
+        return views
+
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block and remove it if this instance created it.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self._write_index = None
+        self._pending_index = None
+        self._data = None
+
+        try:
+            self._shm.close()
+        except BufferError:
+            # views are still referenced by consumers, the mapping is released once they are garbage collected
+            pass
+
+        if self._owner:
+            self._shm.unlink()
@@ -0,0 +1,293 @@
+import time
+from queue import Empty, Full
+from threading import Event
+
+
+
+class SPSCChannel:
+    """
+    Single-producer/single-consumer channel for data chunks, usable in place of the task queues.
+
+    The items are stored in a preallocated ring of slots. The producer only advances the write counter and the consumer only
+    the read counter, thus put and get need no lock (single Python attribute updates are atomic). Events are only used to wake up
+    a waiting consumer (or producer) and are touched only while the other side is actually waiting, thus a stream of chunks
+    causes no lock round-trips while both sides keep up.
+
+    Exactly one thread may put and one thread may get (e.g. data source thread -> task thread, or task thread -> UI thread).
+    Supported overflow policies are 'block' and 'drop_newest' ('drop_oldest' and 'sample' would require the producer to consume).
+    The API mirrors queue.Queue (put/get/qsize/empty/full) and BoundedQueue (close/getStatistics).
+    """
+
+    POLICIES = ('block', 'drop_newest')
+
+    def __init__(self, capacity: int = 1024, policy: str = 'block'):
+        """
+        Construct a new channel.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of slots (maximum number of pending items).
+        policy : str
+            The overflow policy, 'block' (backpressure on the producer) or 'drop_newest'.
+        """
+
+        if capacity <= 0:
+            raise ValueError('The capacity of a SPSC channel must be positive')
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unsupported SPSC channel overflow policy "{policy}"')
+
+        self.maxsize: int = capacity
+        self.policy: str = policy
+        self._low_watermark: int = capacity // 2
+
+        self._slots: list = [None] * capacity
+        self._write_count: int = 0
+        self._read_count: int = 0
+
+        self._consumer_waiting: bool = False
+        self._producer_waiting: bool = False
+        self._not_empty: Event = Event()
+        self._not_full: Event = Event()
+
+        self._closed: bool = False
+
+        self.n_dropped: int = 0
+        self.max_depth: int = 0
+        self.blocked_time: float = 0.0
+
+
+    def qsize(self) -> int:
+        """
+        Retrieve the number of pending items.
+        """
+
+        return self._write_count - self._read_count
+
+
+    def empty(self) -> bool:
+        """
+        Check if no items are pending.
+        """
+
+        return self._write_count == self._read_count
+
+
+    def full(self) -> bool:
+        """
+        Check if all slots are occupied.
+        """
+
+        return self._write_count - self._read_count >= self.maxsize
+
+
+    def close(self) -> None:
+        """
+        Close the channel, waking up a waiting producer or consumer. Items put into a closed channel are dropped.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self._closed = True
+        self._not_full.set()
+        self._not_empty.set()
+
+
+    def isClosed(self) -> bool:
+        """
+        Check if the channel is closed.
+        """
+
+        return self._closed
+
+
+    def _wait(self, event: Event, waiting_attr: str, ready, timeout: float) -> bool:
+        """
+        Wait until ready() holds, the channel is closed or the timeout expires (shared by producer and consumer).
+        """
+
+        end_time = None if timeout is None else time.perf_counter() + timeout
+
+        while not ready() and not self._closed:
+            # announce waiting before re-checking, thus the other side either sees the flag or we see its update
+            setattr(self, waiting_attr, True)
+            event.clear()
+
+            if ready() or self._closed:
+                break
+
+            remaining = None if end_time is None else end_time - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                setattr(self, waiting_attr, False)
+                return False
+
+            event.wait(remaining)
+
+        setattr(self, waiting_attr, False)
+        return ready()
+
+
+    def put(self, item, block: bool = True, timeout: float = None) -> None:
+        """
+        Put an item into the channel (producer thread only).
+
+        Parameters
+        ----------
+        item : object
+            The item to put.
+        block : bool
+            False, to raise queue.Full instead of waiting ('block' policy only).
+        timeout : float
+            The maximum waiting time in seconds ('block' policy only), None to wait until a slot is free or the channel is closed.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._closed:
+            self.n_dropped += 1
+            return
+
+        write_count = self._write_count
+        depth = write_count - self._read_count
+
+        if depth >= self.maxsize:
+            if self.policy == 'drop_newest':
+                self.n_dropped += 1
+                return
+            if not block:
+                raise Full
+
+            # wait until the consumer freed half of the slots, thus a saturated stream wakes the producer once per half ring instead of per item
+            start_time = time.perf_counter()
+            ready = self._wait(self._not_full, '_producer_waiting', lambda: self._write_count - self._read_count <= self._low_watermark, timeout)
+            self.blocked_time += time.perf_counter() - start_time
+
+            if self._closed:
+                self.n_dropped += 1
+                return
+            if not ready:
+                raise Full
+
+            depth = write_count - self._read_count
+
+        self._slots[write_count % self.maxsize] = item
+        self._write_count = write_count + 1
+
+        if depth + 1 > self.max_depth:
+            self.max_depth = depth + 1
+
+        if self._consumer_waiting:
+            self._not_empty.set()
+
+
+    def put_nowait(self, item) -> None:
+        """
+        Put an item without waiting, see put().
+        """
+
+        self.put(item, block=False)
+
+
+    def get(self, block: bool = True, timeout: float = None):
+        """
+        Retrieve the next item (consumer thread only).
+
+        Parameters
+        ----------
+        block : bool
+            False, to raise queue.Empty instead of waiting.
+        timeout : float
+            The maximum waiting time in seconds, None to wait until an item is available or the channel is closed.
+
+        Returns
+        -------
+        item : object
+            The next item.
+        """
+
+        read_count = self._read_count
+
+        if self._write_count == read_count:
+            if not block or not self._wait(self._not_empty, '_consumer_waiting', lambda: self._write_count != self._read_count, timeout):
+                raise Empty
+
+        idx = read_count % self.maxsize
+        item = self._slots[idx]
+        self._slots[idx] = None
+        self._read_count = read_count + 1
+
+        if self._producer_waiting and self._write_count - self._read_count <= self._low_watermark:
+            self._not_full.set()
+
+        return item
+
+
+    def get_nowait(self):
+        """
+        Retrieve the next item without waiting, see get().
+        """
+
+        return self.get(block=False)
+
+
+    def getAll(self) -> list:
+        """
+        Retrieve all pending items at once (consumer thread only).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        items : list
+            The pending items, in the order they were put.
+        """
+
+        read_count, write_count = self._read_count, self._write_count
+        items = []
+
+        for count in range(read_count, write_count):
+            idx = count % self.maxsize
+            items.append(self._slots[idx])
+            self._slots[idx] = None
+
+        self._read_count = write_count
+
+        if self._producer_waiting:
+            self._not_full.set()
+
+        return items
+
+
+    def getStatistics(self) -> dict:
+        """
+        Retrieve the channel statistics (see BoundedQueue.getStatistics()).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        statistics : dict
+            The capacity, policy, current and maximum depth, number of queued and dropped items and the time the producer was blocked.
+        """
+
+        return {
+            'capacity': self.maxsize,
+            'policy': self.policy,
+            'depth': self.qsize(),
+            'max_depth': self.max_depth,
+            'put': self._write_count,
+            'dropped': self.n_dropped,
+            'blocked_time': self.blocked_time,
+        }
@@ -0,0 +1,223 @@
+import time
+
+
+
+class StreamStatistics:
+    """
+    Class for monitoring throughput, packet loss and arrival timing of a measurement data stream.
+
+    The counters are updated by a single thread (the data receive thread) and can be read from any other thread via snapshot().
+    """
+
+    def __init__(self, rate_interval: float = 1.0):
+        """
+        Construct a new stream statistics instance.
+
+        Parameters
+        ----------
+        rate_interval : float
+            The time interval (in seconds) over which the current byte and sample rates are measured.
+        """
+
+        self.rate_interval: float = rate_interval
+
+        self.reset()
+
+
+    def reset(self) -> None:
+        """
+        Reset all counters.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.start_time: float = time.perf_counter()
+
+        # packet counters
+        self.n_received: int = 0
+        self.n_discarded: int = 0
+        self.n_late: int = 0
+        self.n_gap_skipped: int = 0
+
+        # volume counters
+        self.n_bytes: int = 0
+        self.n_samples: int = 0
+
+        # rate measurement window
+        self._window_start: float = self.start_time
+        self._window_bytes: int = 0
+        self._window_samples: int = 0
+        self.byte_rate: float = 0.0
+        self.sample_rate: float = 0.0
+
+        # inter-arrival timing
+        self._last_arrival: float = None
+        self._last_interarrival: float = None
+        self.interarrival_mean: float = 0.0
+        self._interarrival_m2: float = 0.0
+        self.interarrival_max: float = 0.0
+        self.jitter: float = 0.0
+
+
+    def countPacket(self, n_bytes: int) -> None:
+        """
+        Count a received packet.
+
+        Besides counting, the inter-arrival time to the previous packet is tracked.
+        The jitter is estimated analog to RFC 3550 as smoothed absolute difference of consecutive inter-arrival times.
+
+        Parameters
+        ----------
+        n_bytes : int
+            The size of the received packet in bytes.
+
+        Returns
+        -------
+        None
+        """
+
+        now = time.perf_counter()
+
+        self.n_received += 1
+        self.n_bytes += n_bytes
+
+        if self._last_arrival is not None:
+            interarrival = now - self._last_arrival
+
+            # running mean / variance (Welford)
+            n = self.n_received - 1
+            delta = interarrival - self.interarrival_mean
+            self.interarrival_mean += delta / n
+            self._interarrival_m2 += delta * (interarrival - self.interarrival_mean)
+            self.interarrival_max = max(self.interarrival_max, interarrival)
+
+            if self._last_interarrival is not None:
+                self.jitter += (abs(interarrival - self._last_interarrival) - self.jitter) / 16
+
+            self._last_interarrival = interarrival
+
+        self._last_arrival = now
+
+        # update current rates
+        elapsed = now - self._window_start
+        if elapsed >= self.rate_interval:
+            self.byte_rate = (self.n_bytes - self._window_bytes) / elapsed
+            self.sample_rate = (self.n_samples - self._window_samples) / elapsed
+            self._window_start = now
+            self._window_bytes = self.n_bytes
+            self._window_samples = self.n_samples
+
+
+    def countSamples(self, n_samples: int) -> None:
+        """
+        Count received measurement samples.
+
+        Parameters
+        ----------
+        n_samples : int
+            The number of received samples.
+
+        Returns
+        -------
+        None
+        """
+
+        self.n_samples += n_samples
+
+
+    def countDiscarded(self, late: bool = False) -> None:
+        """
+        Count a discarded packet.
+
+        Parameters
+        ----------
+        late : bool
+            True, if the packet was discarded because it arrived late (out of order or duplicated), False otherwise.
+
+        Returns
+        -------
+        None
+        """
+
+        self.n_discarded += 1
+
+        if late:
+            self.n_late += 1
+
+
+    def countGap(self, n_missing: int) -> None:
+        """
+        Count packets skipped due to a gap in the sequence numbers.
+
+        Parameters
+        ----------
+        n_missing : int
+            The number of missing sequence numbers.
+
+        Returns
+        -------
+        None
+        """
+
+        self.n_gap_skipped += n_missing
+
+
+    def snapshot(self) -> dict:
+        """
+        Retrieve a snapshot of the current statistics.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        statistics : dict
+            The current counters, rates (per second, measured over the last rate_interval) and inter-arrival timings (in seconds).
+        """
+
+        now = time.perf_counter()
+        elapsed = now - self.start_time
+        n_expected = self.n_received - self.n_discarded + self.n_gap_skipped
+
+        # the rates are only updated on packet arrival, thus once the current window is overdue (stream stalled) it is measured
+        # up to now, and without any packet during the last rate_interval (stream stopped) the rates are 0
+        byte_rate = self.byte_rate
+        sample_rate = self.sample_rate
+        window_elapsed = now - self._window_start
+        if self._last_arrival is None or now - self._last_arrival >= self.rate_interval:
+            byte_rate = 0.0
+            sample_rate = 0.0
+        elif window_elapsed >= self.rate_interval:
+            byte_rate = max(0, self.n_bytes - self._window_bytes) / window_elapsed
+            sample_rate = max(0, self.n_samples - self._window_samples) / window_elapsed
+
+        return {
+            'received': self.n_received,
+            'discarded': self.n_discarded,
+            'late': self.n_late,
+            'gap_skipped': self.n_gap_skipped,
+            'loss_ratio': self.n_gap_skipped / n_expected if n_expected > 0 else 0.0,
+            'bytes': self.n_bytes,
+            'samples': self.n_samples,
+            'bytes_per_second': byte_rate,
+            'samples_per_second': sample_rate,
+            'avg_bytes_per_second': self.n_bytes / elapsed if elapsed > 0 else 0.0,
+            'avg_samples_per_second': self.n_samples / elapsed if elapsed > 0 else 0.0,
+            'interarrival_mean': self.interarrival_mean,
+            'interarrival_std': (self._interarrival_m2 / (self.n_received - 2)) ** 0.5 if self.n_received > 2 else 0.0,
+            'interarrival_max': self.interarrival_max,
+            'jitter': self.jitter,
+        }
+
+
+    def __repr__(self):
+        stats = self.snapshot()
+        return (f'{stats["samples_per_second"] / 1000:.1f} kS/s, {stats["bytes_per_second"] / 1e6:.2f} MB/s, '
+                f'lost: {stats["gap_skipped"]}, late: {stats["late"]}, jitter: {stats["jitter"] * 1000:.2f} ms')
@@ -1,6 +1,20 @@
 from queue import Empty, Queue
+import traceback
 import numpy as np
 
+from .result_notifier import ResultNotifier
+from .bounded_queue import BoundedQueue
+from .spsc_channel import SPSCChannel
+
+
+# default queue capacities: ~20s of 480 sample chunks at 96kHz, and pending UI results
+DATA_QUEUE_CAPACITY = 4000
+RESULT_QUEUE_CAPACITY = 1000
+
+# default overflow policy of the data queue: a slow (or dead) task loses its oldest chunks instead of blocking the data source,
+# and thereby all other tasks sharing the data stream (see FanOut), 'block' is opt-in via configureQueues()
+DATA_QUEUE_POLICY = 'drop_oldest'
+
 
 
 class Task:
@@ -20,8 +34,10 @@ class Task:
         
         self._name: str = name
         self._shutdown: bool = False
-        self._data_queue: Queue = Queue()
-        self._result_queue: Queue = Queue()
+        self._data_queue: BoundedQueue = BoundedQueue(DATA_QUEUE_CAPACITY, DATA_QUEUE_POLICY)
+        self._result_queue: BoundedQueue = BoundedQueue(RESULT_QUEUE_CAPACITY, 'drop_oldest')
+        self._result_notifier: ResultNotifier = None
+        self._error: Exception = None
 
 
     def getName(self) -> str:
@@ -57,6 +73,106 @@ class Task:
         pass
 
 
+    def configureQueues(self,
+                        data_capacity: int = DATA_QUEUE_CAPACITY,
+                        data_policy: str = None,
+                        result_capacity: int = RESULT_QUEUE_CAPACITY,
+                        result_policy: str = None,
+                        sample_every: int = 4,
+                        channel: str = 'queue',
+                        result_channel: str = None) -> None:
+        """
+        Configure the types, capacities and overflow policies of the data input and result output queues.
+
+        Must be called before the task is started (see Core.setTask()), as the queues are replaced.
+
+        Parameters
+        ----------
+        data_capacity : int
+            The capacity of the data queue (number of data chunks), 0 for unbounded ('queue' only).
+        data_policy : str
+            The overflow policy of the data queue: 'block' (backpressure on the data source, stalling all tasks sharing the data stream
+            while this task lags behind), 'drop_oldest', 'drop_newest' or 'sample', None for 'drop_oldest' ('queue') or 'drop_newest' ('spsc').
+        result_capacity : int
+            The capacity of the result queue (number of results), 0 for unbounded ('queue' only).
+        result_policy : str
+            The overflow policy of the result queue (see data_policy), None for 'drop_oldest' ('queue') or 'drop_newest' ('spsc').
+        sample_every : int
+            The decimation factor of the 'sample' policy.
+        channel : str
+            The type of the data queue: 'queue' (BoundedQueue) or 'spsc' (SPSCChannel, lock-free for a single producer and consumer,
+            requires a positive capacity and the 'block' or 'drop_newest' policy).
+        result_channel : str
+            The type of the result queue (see channel), None for the type of the data queue.
+
+        Returns
+        -------
+        None
+        """
+
+        result_channel = channel if result_channel is None else result_channel
+        if data_policy is None:
+            data_policy = 'drop_newest' if channel == 'spsc' else DATA_QUEUE_POLICY
+        if result_policy is None:
+            result_policy = 'drop_newest' if result_channel == 'spsc' else 'drop_oldest'
+
+        # validate both queues before replacing any of them
+        self._validateQueue('data', channel, data_capacity, data_policy)
+        self._validateQueue('result', result_channel, result_capacity, result_policy)
+
+        self._data_queue = self._createQueue(channel, data_capacity, data_policy, sample_every)
+        self._result_queue = self._createQueue(result_channel, result_capacity, result_policy, sample_every)
+
+
+    def _validateQueue(self, name: str, channel: str, capacity: int, policy: str) -> None:
+        """
+        Check a queue configuration (see configureQueues()), raising a ValueError for unsupported combinations.
+        """
+
+        if channel == 'spsc':
+            if capacity <= 0:
+                raise ValueError(f'The {name} queue of type "spsc" requires a positive capacity (got {capacity})')
+            if policy not in SPSCChannel.POLICIES:
+                raise ValueError(f'The {name} queue of type "spsc" does not support the overflow policy "{policy}" '
+                                 f'(supported: {", ".join(SPSCChannel.POLICIES)})')
+        elif channel == 'queue':
+            if policy not in BoundedQueue.POLICIES:
+                raise ValueError(f'Unknown overflow policy "{policy}" of the {name} queue')
+        else:
+            raise ValueError(f'Unknown queue type "{channel}" of the {name} queue')
+
+
+    def _createQueue(self, channel: str, capacity: int, policy: str, sample_every: int):
+        """
+        Create a queue of the given type (see configureQueues()).
+        """
+
+        if channel == 'spsc':
+            return SPSCChannel(capacity, policy)
+
+        return BoundedQueue(capacity, policy, sample_every)
+
+
+    def getQueueStatistics(self) -> dict:
+        """
+        Retrieve the depth and drop counters of the data and result queues.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        statistics : dict
+            The statistics of the data queue ('data') and the result queue ('result'), see BoundedQueue.getStatistics().
+        """
+
+        return {
+            'data': self._data_queue.getStatistics(),
+            'result': self._result_queue.getStatistics(),
+        }
+
+
     def getDataQueue(self) -> Queue:
         """
         Retrieve the task data input queue.
@@ -91,6 +207,23 @@ class Task:
         return self._result_queue
 
 
+    def setResultNotifier(self, notifier: ResultNotifier = None) -> None:
+        """
+        Set the notifier to signal on new results (set by the core, thus the UI is woken up instead of polling the result queue).
+
+        Parameters
+        ----------
+        notifier : ResultNotifier
+            The result notifier, or None.
+
+        Returns
+        -------
+        None
+        """
+
+        self._result_notifier = notifier
+
+
     def publishResult(self, result_obj: object) -> None:
         """
         Publish a new result data message object.
@@ -107,6 +240,9 @@ class Task:
 
         self._result_queue.put(result_obj)
 
+        if self._result_notifier is not None:
+            self._result_notifier.notify()
+
 
     def shutdown(self) -> None:
         """
@@ -124,11 +260,17 @@ class Task:
         # trigger shutdown
         self._shutdown = True
 
+        # release producers blocked on full queues
+        self._data_queue.close()
+        self._result_queue.close()
+
 
     def run(self) -> None:
         """
         The task run-method, executed by the task thread.
 
+        An exception raised by setup() or process() stops the task (see hasFailed()).
+
         Parameters
         ----------
         None
@@ -139,20 +281,79 @@ class Task:
         """
         
         self._shutdown = False
+        self._error = None
+
+        try:
+            # setup task components (e.g. load models) within the task thread
+            self.setup()
+
+            while not self._shutdown:
+                # fetch next chunk of data
+                try:
+                    data = self._data_queue.get(block=True, timeout=1)
+                except Empty as e:
+                    # skip processing of empty data chunk
+                    # print('Skip processing...')
+                    continue
+
+                # process data chunk
+                self.process(data)
+        except Exception as e:
+            self._fail(e)
 
-        while not self._shutdown:
-            # fetch next chunk of data
-            try:
-                data = self._data_queue.get(block=True, timeout=1)
-            except Empty as e:
-                # skip processing of empty data chunk
-                # print('Skip processing...')
-                continue
+        # print('Exiting Task')
 
-            # process data chunk
-            self.process(data)
 
-        # print('Exiting Task')
+    def _fail(self, error: Exception) -> None:
+        """
+        Stop the task after an exception in the task thread and signal the failure to the core (see Core.checkForTaskResults()).
+        """
+
+        print(f'===== Task failed: "{self._name}"')
+        traceback.print_exc()
+
+        self._error = error
+        self._shutdown = True
+
+        # drop further data instead of queueing it for a task which does not process it anymore
+        self._data_queue.close()
+
+        if self._result_notifier is not None:
+            self._result_notifier.notify()
+
+
+    def hasFailed(self) -> bool:
+        """
+        Check if the task stopped due to an exception raised by setup() or process().
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        failed : bool
+            True, if the task failed, False otherwise.
+        """
+
+        return self._error is not None
+
+
+    def getError(self) -> Exception:
+        """
+        Retrieve the exception which stopped the task.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        error : Exception
+            The exception raised by setup() or process(), or None if the task did not fail.
+        """
+
+        return self._error
 
 
     def process(self, data: np.ndarray) -> None:
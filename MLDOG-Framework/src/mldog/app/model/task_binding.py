@@ -0,0 +1,133 @@
+from threading import Thread
+
+from typing import Callable, Any
+
+from .task import Task
+from .result_coalescer import ResultCoalescer
+
+
+
+class TaskBinding:
+    """
+    A task registered at the core, together with its worker thread and its result routing (callback and coalescing).
+    """
+
+    def __init__(self,
+                 task: Task,
+                 task_result_callback: Callable[[Any], None] = None,
+                 batch_results: bool = False,
+                 coalescer: ResultCoalescer = None):
+        """
+        Construct a new task binding.
+
+        Parameters
+        ----------
+        task : Task
+            The task instance.
+        task_result_callback : Callback[[Any], None]
+            The method to call for new task results.
+        batch_results : bool
+            True, if the callback should receive a list of all pending results at once, False for one call per result.
+        coalescer : ResultCoalescer
+            The coalescing of pending results, None to pass on all results.
+        """
+
+        self.task: Task = task
+        self.task_result_callback: Callable[[Any], None] = task_result_callback
+        self.batch_results: bool = batch_results
+        self.coalescer: ResultCoalescer = coalescer if coalescer is not None else ResultCoalescer()
+
+        self._thread: Thread = None
+
+
+    def start(self) -> None:
+        """
+        Start the task in a dedicated worker thread.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        print(f'===== Run Task: "{self.task.getName()}"')
+
+        self._thread = Thread(target = self.task.run, daemon = True)
+        self._thread.start()
+
+
+    def stop(self) -> None:
+        """
+        Shutdown the task and wait for its worker thread to finish.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        print(f'===== Shutdown Task: "{self.task.getName()}"')
+        self.task.shutdown()
+
+        if self._thread is not None:
+            print('-> Waiting for processing thread to finish... ', end='')
+            self._thread.join()
+            print('done!')
+            self._thread = None
+
+
+    def hasPendingResults(self) -> bool:
+        """
+        Check for results waiting in the result queue of the task.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        pending : bool
+            True, if results are pending, False otherwise.
+        """
+
+        return self.task.getResultQueue().qsize() > 0
+
+
+    def dispatchResults(self) -> int:
+        """
+        Coalesce all pending results of the task and forward them to the result callback.
+
+        Results are kept pending while the frame rate limit of the coalescer does not allow a dispatch yet.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        n_results : int
+            The number of dispatched results.
+        """
+
+        if self.coalescer.getDispatchDelay() > 0:
+            return 0
+
+        results = self.coalescer.coalesce(self.task.getResultQueue().getAll())
+
+        if len(results) == 0 or self.task_result_callback is None:
+            return len(results)
+
+        # forward task messages to result listener callback
+        if self.batch_results:
+            self.task_result_callback(results)
+        else:
+            for msg in results:
+                self.task_result_callback(msg)
+
+        return len(results)
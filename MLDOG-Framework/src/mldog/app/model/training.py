@@ -0,0 +1,167 @@
+# model training: python -m mldog train <measurement series directory>
+import argparse
+import datetime
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.model_selection import StratifiedKFold, cross_validate
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+from .pipeline import CsvRestructuring, MATERIAL_NAMES, TsfreshFeatureExtractor
+from .model_registry import saveModelArtifact
+from .scoring import loadMeasurementSeries
+
+
+# default output file, written into the measurement series directory
+MODEL_FILE = 'model.pkl'
+
+
+def createFeatureExtractor(feature_set: str = 'basic', frequency: int = 96000):
+    """
+    Create the feature extraction step of the given feature set.
+
+    Parameters
+    ----------
+    feature_set : str
+        The feature set, 'basic', 'extended' or 'tsfresh-<profile>' (e.g. 'tsfresh-efficient-live').
+    frequency : int
+        The sample rate of the recordings.
+
+    Returns
+    -------
+    feature_extractor : TransformerMixin
+        The (stateless) feature extraction transformer.
+    """
+
+    if feature_set.startswith('tsfresh-'):
+        return TsfreshFeatureExtractor(feature_set[len('tsfresh-'):], frequency)
+
+    return CsvRestructuring(feature_set, frequency)
+
+
+def trainModel(directory: str, feature_set: str = 'basic', n_jobs: int = None, n_splits: int = 5, n_workers: int = None,
+               batch_size: int = 16, use_feature_store: bool = True, frequency: int = 96000, max_depth: int = None,
+               random_state: int = 0) -> tuple:
+    """
+    Train a material classifier on all recordings of a measurement series.
+
+    The features of the recordings are computed once (reusing the feature store of the directory), thus cross-validation and the
+    final fit only train the classifier. As the feature extraction step is stateless, the fitted classifier is combined with it into
+    the prediction pipeline afterwards.
+
+    Parameters
+    ----------
+    directory : str
+        The measurement series directory containing measurements.csv (with material and dataFile columns).
+    feature_set : str
+        The feature set, 'basic', 'extended' or 'tsfresh-<profile>'.
+    n_jobs : int
+        The number of parallel cross-validation jobs, None for 1, -1 for the number of CPUs.
+    n_splits : int
+        The number of cross-validation folds, 0 to skip cross-validation.
+    n_workers : int
+        The number of worker processes for reading recordings, None for the number of CPUs.
+    batch_size : int
+        The number of recordings handed to a worker at once.
+    use_feature_store : bool
+        True, to reuse the features cached in the feature store of the directory, False to read all recordings.
+    frequency : int
+        The sample rate of the recordings.
+    max_depth : int
+        The maximum depth of the decision tree, None for unlimited.
+    random_state : int
+        The seed of the classifier and the fold assignment.
+
+    Returns
+    -------
+    (pipeline, metadata) : tuple(Pipeline, dict)
+        The fitted prediction pipeline and the model metadata.
+    """
+
+    start_time = time.perf_counter()
+
+    measurements, features = loadMeasurementSeries(directory, feature_set, n_workers, batch_size, use_feature_store)
+    if len(measurements) == 0:
+        raise ValueError(f'No recordings found in {directory}')
+
+    feature_extractor = createFeatureExtractor(feature_set, frequency)
+    features = pd.DataFrame(features, columns=feature_extractor.featureNames())
+    labels = measurements['material'].astype(str).to_numpy()
+    load_time = time.perf_counter() - start_time
+
+    classifier = DecisionTreeClassifier(max_depth=max_depth, random_state=random_state)
+
+    cv_scores = None
+    if n_splits > 0:
+        # stratified folds need at least one recording of each class per fold
+        n_splits = min(n_splits, int(np.min(np.unique(labels, return_counts=True)[1])))
+        if n_splits < 2:
+            print('Warning: skipping cross-validation, at least 2 recordings per class are required')
+
+    if n_splits > 1:
+        folds = StratifiedKFold(n_splits, shuffle=True, random_state=random_state)
+        cv_scores = cross_validate(classifier, features, labels, cv=folds, n_jobs=n_jobs)['test_score']
+
+    classifier.fit(features, labels)
+    pipeline = Pipeline([
+        ('csv_scaler', feature_extractor),
+        ('classifier', classifier)
+    ])
+    train_time = time.perf_counter() - start_time - load_time
+
+    metadata = {
+        'feature_set': feature_set,
+        'feature_names': list(features.columns),
+        'label_map': {str(label): MATERIAL_NAMES.get(str(label), str(label)) for label in classifier.classes_},
+        'classes': [str(label) for label in classifier.classes_],
+        'sample_rate': frequency,
+        'trained_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'n_recordings': len(labels),
+        'source': os.path.abspath(directory),
+        'cv_scores': None if cv_scores is None else [float(score) for score in cv_scores],
+        'cv_accuracy': None if cv_scores is None else float(np.mean(cv_scores)),
+        'load_time': load_time,
+        'train_time': train_time,
+        'sklearn_version': sklearn.__version__,
+    }
+
+    return pipeline, metadata
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command line entry point of the model training.
+    """
+
+    parser = argparse.ArgumentParser(prog='mldog train', description='Train a material classifier on a measurement series and export the model artifact.')
+    parser.add_argument('directory', help='measurement series directory containing measurements.csv')
+    parser.add_argument('--output', default=None, help=f'model artifact to write (default: {MODEL_FILE} in the directory)')
+    parser.add_argument('--feature-set', default='basic', help='feature set: basic, extended or tsfresh-<profile> (default: basic)')
+    parser.add_argument('--cv', type=int, default=5, help='number of cross-validation folds, 0 to skip (default: 5)')
+    parser.add_argument('--jobs', type=int, default=-1, help='parallel cross-validation jobs (default: -1, all CPUs)')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes for reading recordings (default: number of CPUs)')
+    parser.add_argument('--batch-size', type=int, default=16, help='recordings per worker batch (default: 16)')
+    parser.add_argument('--frequency', type=int, default=96000, help='sample rate of the recordings (default: 96000)')
+    parser.add_argument('--max-depth', type=int, default=None, help='maximum depth of the decision tree (default: unlimited)')
+    parser.add_argument('--no-cache', action='store_true', help='recompute all features instead of using the feature store')
+    args = parser.parse_args(argv)
+
+    pipeline, metadata = trainModel(args.directory, args.feature_set, args.jobs, args.cv, args.workers, args.batch_size,
+                                    not args.no_cache, args.frequency, args.max_depth)
+
+    output = args.output if args.output is not None else os.path.join(args.directory, MODEL_FILE)
+    saveModelArtifact(output, pipeline, metadata)
+
+    print(f'Trained on {metadata["n_recordings"]} recordings in {metadata["load_time"] + metadata["train_time"]:.2f}s '
+          f'(loading: {metadata["load_time"]:.2f}s, training: {metadata["train_time"]:.2f}s)')
+    if metadata['cv_accuracy'] is not None:
+        print(f'Cross-validation accuracy: {metadata["cv_accuracy"]:.3f} (+/- {np.std(metadata["cv_scores"]):.3f})')
+    print(f'Model written to {output} (use with MLDOG_MODEL_PATH or --model)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,58 @@
 import socket
+import select
 import time
 import os
+import multiprocessing
 import numpy as np
+import pandas as pd
+
+from threading import Thread
+from queue import Empty
 
 from struct import *
 
 from .data_source import MeasurementConfiguration, ChannelConfiguration, DataSource
+from .stream_statistics import StreamStatistics
+from .shared_ring_buffer import SharedRingBuffer
+from ...util.drill.io import read_measurement_array, RECORDING_EXTENSION
+
+
+# wire format of sensor data values in capturama packets
+SENSOR_DATA_DTYPE = np.dtype('<f4')
+
+# maximum size of a capturama packet
+MAX_PACKET_SIZE = 4244
+
+# requested kernel receive buffer size in batch mode
+SOCKET_RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# number of rows parsed at once when replaying .csv log files
+CSV_CHUNK_SIZE = 96000
 
+# polling interval while waiting for the consumer during unthrottled replay
+BACKPRESSURE_POLL_INTERVAL = 0.0005
 
 
 class UDPDataSource(DataSource):
     """
     The UDP data source provides access to live measurement data received via UDP.
+
+    Two receive modes are supported:
+    In default mode, every received datagram is decoded and published on its own.
+    In batch mode, all datagrams waiting on the socket are drained into a pool of preallocated buffers on each wakeup
+    and the decoded sensor data is coalesced into blocks, which are published once the sample or time budget is exhausted.
     """
     
-    def __init__(self, port=4245, capturama_ip='localhost', capturama_port=4242):
+    def __init__(self, port=4245, capturama_ip='localhost', capturama_port=4242, dtype=np.float64,
+                 batch_mode=False, block_samples=4800, block_interval=0.05, n_buffers=64):
         """
         Construct a new UDP data source.
+
+        The dtype specifies the element type of the published sensor data arrays.
+        Using np.float32 (the wire format) publishes read-only views on the received datagrams without any copy.
+
+        In batch mode, block_samples and block_interval (seconds) specify the sample and time budget of a published block,
+        n_buffers specifies the maximum number of datagrams drained from the socket per wakeup.
         """
         
         DataSource.__init__(self, 'UDP Data Source')
@@ -25,9 +61,22 @@ class UDPDataSource(DataSource):
         self.port = port
         self.socket = None
         self.seq_no = 0
+        self.dtype = np.dtype(dtype)
+        self.statistics = StreamStatistics()
 
         self.capturama_addr = (capturama_ip, capturama_port)
 
+        # batch mode configuration
+        self.batch_mode = batch_mode
+        self.block_samples = block_samples
+        self.block_interval = block_interval
+        self.n_buffers = n_buffers
+
+        # coalescing block state (only accessed by the receive thread)
+        self._block: np.ndarray = None
+        self._block_fill = 0
+        self._block_time = 0
+
 
     def setup(self):
         if self.socket is None:
@@ -37,10 +86,22 @@ class UDPDataSource(DataSource):
 
             # create socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.settimeout(1)
+
+            if self.batch_mode:
+                # wakeups are handled via select, thus use a non-blocking socket with a large kernel receive buffer
+                self.socket.setblocking(False)
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RECEIVE_BUFFER_SIZE)
+                except OSError as e:
+                    print(f'Could not enlarge socket receive buffer: {e}')
+            else:
+                self.socket.settimeout(1)
+
             self.socket.bind(("", self.port))
             self.socket.sendto('startmsg'.encode('utf-8'), self.capturama_addr)
 
+            self.statistics.reset()
+
 
     def shutdown(self):
         if self.socket is not None:
@@ -71,9 +132,13 @@ class UDPDataSource(DataSource):
         The receiveLoop-function run by the data receive thread.
         """
 
+        if self.batch_mode:
+            self.receiveLoopBatched()
+            return
+
         while self.socket is not None:
             try:
-                msg, _ = self.socket.recvfrom(4244)
+                msg, _ = self.socket.recvfrom(MAX_PACKET_SIZE)
             except(socket.timeout):
                 continue
             except Exception as e:
@@ -81,48 +146,169 @@ class UDPDataSource(DataSource):
                 return
             
             # process received message
+            sensor_data = self.processPacket(msg)
+            if sensor_data is not None:
+                self.publish(sensor_data)
+
+
+    def receiveLoopBatched(self):
+        """
+        The batch mode receive loop, draining all waiting datagrams per wakeup into preallocated buffers.
+        """
+
+        buffers = [bytearray(MAX_PACKET_SIZE) for _ in range(self.n_buffers)]
+        views = [memoryview(buffer) for buffer in buffers]
+        n_bytes = [0] * self.n_buffers
+
+        while self.socket is not None:
+            sock = self.socket
+
+            # wait for new datagrams, but wake up in time to publish a pending block
+            timeout = self.block_interval if self._block_fill > 0 else 1
+
+            try:
+                readable, _, _ = select.select([sock], [], [], timeout)
+            except (OSError, ValueError) as e:
+                # socket got closed during shutdown
+                if self.socket is not None:
+                    print(e)
+                return
+
+            # drain all datagrams already waiting on the socket
+            n_received = 0
+            while readable and n_received < self.n_buffers:
+                try:
+                    n_bytes[n_received] = sock.recv_into(buffers[n_received])
+                except (BlockingIOError, InterruptedError):
+                    break
+                except Exception as e:
+                    if self.socket is not None:
+                        print(e)
+                    return
+                
+                n_received += 1
+
+            # process received messages
+            for idx in range(n_received):
+                sensor_data = self.processPacket(views[idx][:n_bytes[idx]])
+                if sensor_data is not None:
+                    self.appendToBlock(sensor_data)
+
+            # publish coalesced block if the time budget is exhausted
+            if self._block_fill > 0 and time.perf_counter() - self._block_time >= self.block_interval:
+                self.flushBlock()
+
+
+    def processPacket(self, msg):
+        """
+        Process a received packet.
+
+        Returns the decoded sensor data for valid sensor data packets, None otherwise.
+        """
             
-            # packet structure:
-            # bytes: type, description
-            # 0-3: uint32 sequence number
-            # 4-7: packet type
-            # 8-n: payload
-            n_bytes = len(msg)
+        # packet structure:
+        # bytes: type, description
+        # 0-3: uint32 sequence number
+        # 4-7: packet type
+        # 8-n: payload
+        n_bytes = len(msg)
+
+        # unpack sequence number and packet type
+        seq_no, pkt_type = unpack_from('<LL', msg, 0)
+
+        self.statistics.countPacket(n_bytes)
 
-            # unpack sequence number and packet type
-            seq_no, pkt_type = unpack_from('<LL', msg, 0)
+        # print(f'{seq_no}-{pkt_type}: ', end='')
 
-            # print(f'{seq_no}-{pkt_type}: ', end='')
+        if (seq_no == 0 and pkt_type == 0):
+            # meta packet with new channel information
+            print('Recieved meta data information.')
 
-            if (seq_no == 0 and pkt_type == 0):
-                # meta packet with new channel information
-                print('Recieved meta data information.')
+            # publish data of the previous configuration before switching
+            self.flushBlock()
+            
+            self.seq_no = 0
+            self.parseMetaInformation(msg)
+            # self.publish(self.mconfig)
+        elif (self.mconfig is None or seq_no < self.seq_no + 1):
+            # discard lost packets
+            self.statistics.countDiscarded(late = self.mconfig is not None)
+        else:
+            # count skipped sequence numbers
+            if seq_no > self.seq_no + 1:
+                self.statistics.countGap(seq_no - self.seq_no - 1)
+
+            # update sequence number
+            self.seq_no = seq_no
+
+            if (pkt_type == 1):
+                # sensor data packet
+                sensor_data = self.parseSensorData(msg)
+                self.statistics.countSamples(sensor_data.shape[0])
+                return sensor_data
+            elif (pkt_type == 2):
+                # measurement ended packet
+                print('Recieved measurement end notification.')
                 
-                self.seq_no = 0
-                self.parseMetaInformation(msg)
-                # self.publish(self.mconfig)
-            elif (self.mconfig is None or seq_no < self.seq_no + 1):
-                # discard lost packets
-                print('discarded!')
+                self.handleMeasurementEnd()
             else:
-                # update sequence number
-                self.seq_no = seq_no
-
-                if (pkt_type == 1):
-                    # sensor data packet
-                    sensor_data = self.parseSensorData(msg)
-                    self.publish(sensor_data)
-                elif (pkt_type == 2):
-                    # measurement ended packet
-                    print('Recieved measurement end notification.')
-                    
-                    # reset sequence number and channel configuration
-                    self.seq_no = 0
-                    self.mconfig = None
-                    self.data_queue = None
-                else:
-                    # unknown/unexpected packet type
-                    print(f'Recieved unknown/unexpected packet type: {pkt_type}')
+                # unknown/unexpected packet type
+                print(f'Recieved unknown/unexpected packet type: {pkt_type}')
+        
+        return None
+
+
+    def handleMeasurementEnd(self):
+        """
+        Handle a measurement end notification of the capturama.
+        """
+
+        # publish remaining coalesced data
+        self.flushBlock()
+
+        # reset sequence number and channel configuration
+        self.seq_no = 0
+        self.mconfig = None
+        self.data_queue = None
+
+
+    def appendToBlock(self, sensor_data):
+        """
+        Append decoded sensor data to the coalescing block and publish the block once the sample budget is exhausted.
+        """
+
+        n_samples, n_channels = sensor_data.shape
+
+        if self._block is None or self._block.shape[1] != n_channels:
+            # allocate a new block
+            self._block = np.empty((max(self.block_samples, n_samples), n_channels), dtype=self.dtype)
+            self._block_fill = 0
+        elif self._block_fill + n_samples > self._block.shape[0]:
+            # grow block (only happens for pure time budgets)
+            block = np.empty((max(2 * self._block.shape[0], self._block_fill + n_samples), n_channels), dtype=self.dtype)
+            block[:self._block_fill] = self._block[:self._block_fill]
+            self._block = block
+
+        if self._block_fill == 0:
+            self._block_time = time.perf_counter()
+
+        self._block[self._block_fill:self._block_fill + n_samples] = sensor_data
+        self._block_fill += n_samples
+
+        if self.block_samples > 0 and self._block_fill >= self.block_samples:
+            self.flushBlock()
+
+
+    def flushBlock(self):
+        """
+        Publish the pending coalesced block.
+        """
+
+        if self._block_fill > 0:
+            # hand over the block to the consumer and start a fresh one
+            self.publish(self._block[:self._block_fill])
+            self._block = None
+            self._block_fill = 0
 
 
     def parseMetaInformation(self, data):
@@ -139,7 +325,7 @@ class UDPDataSource(DataSource):
 
         # unpack channel information
         channels = []
-        channel_str = data[offset:].decode('ascii')
+        channel_str = bytes(data[offset:]).decode('ascii')
         for cidx, cname in enumerate(channel_str.split(',')):
             channels.append(ChannelConfiguration(cidx, cname))
 
@@ -149,21 +335,18 @@ class UDPDataSource(DataSource):
     def parseSensorData(self, data):
         """
         Parse sensor data.
+
+        The payload is interpreted as (n_samples, n_channels) little-endian float32 array directly on the datagram buffer.
+        Incomplete trailing samples are ignored.
         """
 
         n_channels = len(self.mconfig.channels)
         n_bytes = len(data)
         n_values = int((n_bytes - 8) / 4)  # n float values subtracting the header size
         n_samples = int(n_values / n_channels)
-        unpack_format = '<' + 'f' * n_channels
-
-        sensor_data = []
 
-        for idx in range(0, n_samples):
-            sample = unpack_from(unpack_format, data, 8 + idx * n_channels * 4)
-            sensor_data.append(sample)
-
-        sensor_data = np.array(sensor_data)
+        sensor_data = np.frombuffer(data, dtype=SENSOR_DATA_DTYPE, count=n_samples * n_channels, offset=8)
+        sensor_data = sensor_data.reshape(n_samples, n_channels).astype(self.dtype, copy=False)
 
         # print(f'Seq: {self.seq_no}: {len(sensor_data)}')
         
@@ -171,12 +354,233 @@ class UDPDataSource(DataSource):
 
 
 
+class RingBufferUDPDataSource(UDPDataSource):
+    """
+    UDP data source variant used inside the ingestion process, writing all sensor data into a shared ring buffer.
+
+    Meta information, measurement end notifications and stream statistics are forwarded to the main process via a control queue.
+    """
+
+    def __init__(self, ring: SharedRingBuffer, control_queue, **kwargs):
+        """
+        Construct a new ring buffer UDP data source.
+        """
+
+        super().__init__(dtype=ring.dtype, **kwargs)
+
+        self.ring: SharedRingBuffer = ring
+        self.control_queue = control_queue
+
+        # permanently publish into the ring buffer
+        self.data_queue = self.ring
+
+
+    def parseMetaInformation(self, data):
+        super().parseMetaInformation(data)
+
+        if len(self.mconfig.channels) != self.ring.n_channels:
+            print(f'Channel count {len(self.mconfig.channels)} does not match ring buffer layout ({self.ring.n_channels} channels) -> discarding measurement!')
+            self.mconfig = None
+            return
+
+        self.control_queue.put(('meta', self.mconfig))
+
+
+    def handleMeasurementEnd(self):
+        super().handleMeasurementEnd()
+
+        # keep on publishing into the ring buffer
+        self.data_queue = self.ring
+
+        self.control_queue.put(('end', None))
+
+
+
+def _runIngestionProcess(ring_name, capacity, n_channels, dtype, control_queue, stop_event, source_kwargs):
+    """
+    Entry point of the UDP ingestion process.
+    """
+
+    ring = SharedRingBuffer(capacity, n_channels, dtype, name=ring_name)
+    source = RingBufferUDPDataSource(ring, control_queue, **source_kwargs)
+    source.setup()
+
+    def watch():
+        # forward statistics until shutdown is requested
+        while not stop_event.wait(1):
+            control_queue.put(('statistics', source.getStatistics()))
+
+        source.shutdown()
+
+    watcher = Thread(target=watch, daemon=True)
+    watcher.start()
+
+    source.receiveLoop()
+
+    ring.close()
+
+
+
+class MultiprocessUDPDataSource(DataSource):
+    """
+    UDP data source running socket receive and packet decoding in a separate process.
+
+    The ingestion process writes the decoded sensor data into a shared memory ring buffer, thus sensor data is never pickled.
+    This decouples ingestion from the GIL of the main process, so slow tasks or ui redraws do not cause socket buffer overflows.
+    The receive thread of this data source copies new samples out of the ring buffer (a single memcpy per poll) before publishing them,
+    as queued chunks may outlive the ring buffer contents (task data queues can hold more than capacity samples).
+    If the receive thread itself falls behind by more than capacity samples (also while copying), the overwritten samples are skipped
+    and counted (see getStatistics(), 'ring_overrun_samples'), thus a published chunk is never partially overwritten.
+    """
+
+    def __init__(self, port=4245, capturama_ip='localhost', capturama_port=4242, n_channels=3,
+                 capacity=960000, dtype=np.float32, batch_mode=True, poll_interval=0.005):
+        """
+        Construct a new multiprocess UDP data source.
+        """
+
+        DataSource.__init__(self, 'UDP Data Source (Multiprocess)')
+
+        self.n_channels = n_channels
+        self.capacity = capacity
+        self.dtype = np.dtype(dtype)
+        self.poll_interval = poll_interval
+        self.source_kwargs = {
+            'port': port,
+            'capturama_ip': capturama_ip,
+            'capturama_port': capturama_port,
+            'batch_mode': batch_mode,
+        }
+
+        self.ring: SharedRingBuffer = None
+        self.read_index = 0
+        self.n_overrun = 0
+        self.process = None
+        self.control_queue = None
+        self.stop_event = None
+        self.process_statistics: dict = None
+
+
+    def setup(self):
+        if self.ring is None:
+            self.ring = SharedRingBuffer(self.capacity, self.n_channels, self.dtype)
+            self.read_index = 0
+            self.n_overrun = 0
+
+            # spawn (instead of fork) a clean interpreter, as the main process runs ui and task threads
+            ctx = multiprocessing.get_context('spawn')
+            self.control_queue = ctx.Queue()
+            self.stop_event = ctx.Event()
+            self.process = ctx.Process(target=_runIngestionProcess,
+                                       args=(self.ring.getName(), self.capacity, self.n_channels, self.dtype,
+                                             self.control_queue, self.stop_event, self.source_kwargs),
+                                       daemon=True)
+            self.process.start()
+
+        return True
+
+
+    def shutdown(self):
+        super().shutdown()
+
+        if self.ring is not None:
+            # stop ingestion process
+            self.stop_event.set()
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.process.terminate()
+
+            self.process = None
+            self.control_queue = None
+            self.stop_event = None
+
+            ring = self.ring
+            self.ring = None
+            ring.close()
+
+
+    def getStatistics(self) -> dict:
+        if self.process_statistics is None:
+            return None
+
+        stats = dict(self.process_statistics)
+        stats['ring_overrun_samples'] = self.n_overrun
+
+        return stats
+
+
+    def receiveLoop(self):
+        """
+        The receiveLoop-function run by the data receive thread, forwarding new ring buffer samples.
+        """
+
+        while self.ring is not None:
+            ring = self.ring
+            control_queue = self.control_queue
+
+            # fetch pending control messages
+            messages = []
+            try:
+                while not control_queue.empty():
+                    messages.append(control_queue.get_nowait())
+            except (Empty, OSError, ValueError):
+                pass
+
+            # apply meta information and statistics immediately, defer measurement end after publishing pending data
+            measurement_ended = False
+            for msg_type, payload in messages:
+                if msg_type == 'meta':
+                    self.mconfig = payload
+                elif msg_type == 'statistics':
+                    self.process_statistics = payload
+                elif msg_type == 'end':
+                    measurement_ended = True
+
+            write_index = ring.getWriteIndex()
+
+            if write_index - self.read_index > ring.capacity:
+                # consumer fell behind -> skip overwritten samples (with some safety margin to the producer)
+                new_read_index = write_index - ring.capacity // 2
+                self.n_overrun += new_read_index - self.read_index
+                self.read_index = new_read_index
+
+            if write_index > self.read_index:
+                if self.isMeasuring():
+                    # publish a private copy, the producer overwrites ring buffer samples regardless of pending task data
+                    views = ring.read(self.read_index, write_index)
+                    data = np.concatenate(views) if len(views) > 1 else views[0].copy()
+
+                    # the producer does not wait for this thread -> drop the oldest samples if they were overwritten during the copy
+                    n_overwritten = min(ring.getPendingIndex() - ring.capacity - self.read_index, data.shape[0])
+                    if n_overwritten > 0:
+                        self.n_overrun += n_overwritten
+                        data = data[n_overwritten:]
+
+                    if data.shape[0] > 0:
+                        self.publish(data)
+
+                self.read_index = write_index
+            elif not measurement_ended:
+                time.sleep(self.poll_interval)
+
+            if measurement_ended:
+                # reset channel configuration
+                self.mconfig = None
+                self.data_queue = None
+
+
+
 class LogDataSource(DataSource):
     """
     The log data source provides access to recorded measurement series.
+
+    Recordings are replayed in real-time (speed=1), as multiple of real-time (speed=N) or unthrottled (speed=0).
+    Unthrottled replay is only limited by backpressure of the consumer: publishing pauses while more than max_pending chunks are queued.
+    By default, each measurement replays the next file of the directory, with play_all every measurement replays all files back to back.
     """
 
-    def __init__(self, path:str = '../data', block_size:int = 480, frequency:int = 96000):
+    def __init__(self, path:str = '../data', block_size:int = 480, frequency:int = 96000,
+                 speed:float = 1.0, play_all:bool = False, max_pending:int = 8):
         """
         Construct a new log data source instance.
         """
@@ -192,17 +596,25 @@ class LogDataSource(DataSource):
 
         self.block_size = block_size
         self.frequency = frequency
+
+        self.speed = speed
+        self.play_all = play_all
+        self.max_pending = max_pending
+        self.playlist = []
+
+        self.statistics = StreamStatistics()
     
 
     def setup(self):
         self.file_idx = 0
+        self.statistics.reset()
 
         # read file names from specified directory
         dir_list = os.listdir(self.path)
         # print(dir_list)
 
-        # filter measurement files
-        self.data_files = list(filter(lambda fname: fname.endswith('.csv'), dir_list))
+        # filter measurement files (skipping the measurement series table and scoring results)
+        self.data_files = sorted(filter(lambda fname: (fname.endswith('.csv') or fname.endswith(RECORDING_EXTENSION)) and fname not in ('measurements.csv', 'predictions.csv'), dir_list))
         print(f'-> Log Files: {self.data_files}')
 
         return len(self.data_files) > 0
@@ -219,11 +631,15 @@ class LogDataSource(DataSource):
         # forward call to base class
         super().startMeasurement(data_queue)
 
-        # proceed to next file
-        self.file_path = os.path.join(self.path, self.data_files[self.file_idx])
-        self.file_idx = (self.file_idx + 1) % len(self.data_files)
+        if self.play_all:
+            # replay all files back to back
+            self.playlist = [os.path.join(self.path, fname) for fname in self.data_files]
+        else:
+            # proceed to next file
+            self.playlist = [os.path.join(self.path, self.data_files[self.file_idx])]
+            self.file_idx = (self.file_idx + 1) % len(self.data_files)
 
-        print('Loading file:', self.file_path)
+        self.file_path = self.playlist[0]
 
 
     def stopMeasurement(self):
@@ -237,64 +653,112 @@ class LogDataSource(DataSource):
     def receiveLoop(self):
         while self.data_files is not None:
             if self.file_path is not None:
-                # try to extract the measurement frequency from file name
-                frequency = self.file_path.split('_')[-1]
-                if len(frequency) > 1 and frequency.endswith('Hz.csv'):
-                    frequency = float(frequency.removesuffix('Hz.csv'))
-                else:
-                    frequency = self.frequency
-
-                with open(self.file_path) as f:
-                    row_idx = 0
-
-                    for i, line in enumerate(f):
-                        if self.file_path is None:
-                            # break processing if file_path got reset
-                            break
-
-                        # split next line
-                        row_values = line.strip().split(',')
-
-                        if i == 0:
-                            # read channel config
-                            channels = []
-                            for cidx, cname in enumerate(row_values):
-                                channels.append(ChannelConfiguration(cidx, cname))
-                            self.mconfig = MeasurementConfiguration(frequency, channels)
-
-                            # setup sensor data array shape according to channel config
-                            sensor_data: np.ndarray = np.zeros((self.block_size, len(row_values)))
-
-                            # skip further processing for first line
-                            continue
-
-                        # set sensor data at current row index
-                        sensor_data[row_idx, :] = np.array(row_values)
-
-                        # increment row index
-                        row_idx += 1
-
-                        # publish sensor data if chunk is complete
-                        if row_idx == self.block_size:
-                            self.publish(sensor_data.copy())
-                            row_idx = 0
-                            time.sleep(self.block_size / self.mconfig.frequency)
-                    
-                    # publish remaining sensor data chunk
-                    if row_idx > 0:
-                        self.publish(sensor_data[:row_idx, :].copy())
+                for file_path in self.playlist:
+                    if self.file_path is None:
+                        # break processing if file_path got reset
+                        break
+
+                    print('Loading file:', file_path)
+                    self.replay(file_path)
                     
-                    # check for 
-                    if self.file_path is not None:
-                        print('Reached end of file -> stopping measurement.')
+                # check for 
+                if self.file_path is not None:
+                    print('Reached end of file -> stopping measurement.')
 
-                        # trigger measurement stop
-                        # FIXME: Evil call! Not thread save due to event dispatching!
-                        self.stopMeasurement()
+                    # trigger measurement stop
+                    # FIXME: Evil call! Not thread save due to event dispatching!
+                    self.stopMeasurement()
             else:
                 time.sleep(.1)
 
 
+    def replay(self, file_path):
+        """
+        Replay the given measurement file according to the configured replay speed.
+
+        Pacing is based on the replay start time, thus parsing time is compensated instead of adding up with the sleep time.
+        """
+
+        start_time = time.perf_counter()
+        n_published = 0
+
+        for sensor_data in self.readBlocks(file_path):
+            if self.file_path is None:
+                # break processing if file_path got reset
+                break
+
+            self.publish(sensor_data)
+            self.statistics.countPacket(sensor_data.nbytes)
+            self.statistics.countSamples(sensor_data.shape[0])
+
+            n_published += sensor_data.shape[0]
+
+            if self.speed > 0:
+                # wait until the published samples are due
+                delay = start_time + n_published / (self.mconfig.frequency * self.speed) - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            else:
+                self.waitForConsumer()
+
+
+    def waitForConsumer(self):
+        """
+        Wait until the consumer of the data queue has caught up (backpressure for unthrottled replay).
+        """
+
+        data_queue = self.data_queue
+        while data_queue is not None and self.file_path is not None and data_queue.qsize() >= self.max_pending:
+            time.sleep(BACKPRESSURE_POLL_INTERVAL)
+
+
+    def readBlocks(self, file_path):
+        """
+        Generator reading the given measurement file in blocks of block_size samples.
+
+        The measurement configuration is updated according to the file before the first block is yielded.
+        Files are parsed in large vectorized chunks (csv) or read from a memory map (binary recordings).
+        """
+
+        if file_path.endswith(RECORDING_EXTENSION):
+            data, header = read_measurement_array(file_path, mmap=True)
+
+            frequency = header['frequency'] if header['frequency'] is not None else self.frequency
+            self.mconfig = MeasurementConfiguration(frequency, [ChannelConfiguration(cidx, cname) for cidx, cname in enumerate(header['channels'])])
+
+            for offset in range(0, data.shape[0], self.block_size):
+                # copy block from memory-mapped file
+                yield np.array(data[offset:offset + self.block_size], dtype=np.float64)
+
+            return
+
+        # try to extract the measurement frequency from file name
+        frequency = file_path.split('_')[-1]
+        if len(frequency) > 1 and frequency.endswith('Hz.csv'):
+            frequency = float(frequency.removesuffix('Hz.csv'))
+        else:
+            frequency = self.frequency
+
+        # read channel config
+        with open(file_path) as f:
+            row_values = f.readline().strip().split(',')
+
+        channels = []
+        for cidx, cname in enumerate(row_values):
+            channels.append(ChannelConfiguration(cidx, cname))
+        self.mconfig = MeasurementConfiguration(frequency, channels)
+
+        # parse chunks of a multiple of the block size, so blocks never span two chunks
+        chunk_size = self.block_size * max(1, CSV_CHUNK_SIZE // self.block_size)
+
+        with pd.read_csv(file_path, chunksize=chunk_size, dtype=np.float64) as reader:
+            for chunk in reader:
+                chunk_data = chunk.to_numpy()
+
+                for offset in range(0, chunk_data.shape[0], self.block_size):
+                    yield chunk_data[offset:offset + self.block_size]
+
+
 
 class DummyDataSource(DataSource):
     """
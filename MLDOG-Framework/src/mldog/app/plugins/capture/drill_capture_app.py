@@ -16,7 +16,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from ...model.core import Core
 from ...ui.application import MLDOGApplication
 
-from .drill_capture_model import ApplicationState, MeasurementSeries, DrillCaptureModel
+from .drill_capture_model import ApplicationState, OutputFormat, MeasurementSeries, DrillCaptureModel
 
 
 
@@ -128,6 +128,7 @@ class MeasurementSeriesConfigurator(tk.Frame):
         self.gears: tk.StringVar = tk.StringVar(value='2')
         self.n_recordings: tk.IntVar = tk.IntVar(value=10)
         self.target_dir: tk.StringVar = tk.StringVar(value='recordings')
+        self.output_format: tk.StringVar = tk.StringVar(value=OutputFormat.CSV.value)
 
         self.start_recording_btn: tk.Button = None
         self.continue_recording_btn: tk.Button = None
@@ -163,6 +164,7 @@ class MeasurementSeriesConfigurator(tk.Frame):
         config_pane.rowconfigure(3, weight=0)
         config_pane.rowconfigure(4, weight=0)
         config_pane.rowconfigure(5, weight=0)
+        config_pane.rowconfigure(6, weight=0)
         config_pane.grid(column=0, row=row, padx=20, pady=10, sticky=tk.NSEW)
 
         # operators
@@ -216,6 +218,18 @@ class MeasurementSeriesConfigurator(tk.Frame):
         n_recordings_box = ttk.Spinbox(config_pane, from_=1, to=100, textvariable=self.n_recordings)
         n_recordings_box.grid(column=1, row=c_row, padx=(5, 20), pady=10, ipady=3, sticky = tk.EW, columnspan=3)
 
+        # output format
+        c_row = c_row + 1
+        label = ttk.Label(config_pane, text='Dateiformat:', style='Label.TLabel')
+        # label = ttk.Label(config_pane, text='File Format:', style='Label.TLabel')
+        label.grid(column=0, row=c_row, padx=(20, 5), pady=10, sticky=tk.E)
+
+        radio_btn = ttk.Radiobutton(config_pane, text='CSV', value=OutputFormat.CSV.value, variable=self.output_format)
+        radio_btn.grid(column=1, row=c_row, padx=(5, 20), pady=10, sticky = tk.NSEW)
+
+        radio_btn = ttk.Radiobutton(config_pane, text='Binär (float32)', value=OutputFormat.BINARY.value, variable=self.output_format)
+        radio_btn.grid(column=2, row=c_row, padx=(5, 20), pady=10, sticky = tk.NSEW, columnspan=2)
+
         # TODO: Add result_dir entry
 
         # note
@@ -262,6 +276,7 @@ class MeasurementSeriesConfigurator(tk.Frame):
         self.model.generateMeasurementSeries(self.getMeasurementSeriesConfig(),
                                              self.n_recordings.get(),
                                              self.target_dir.get())
+        self.model.setOutputFormat(OutputFormat(self.output_format.get()))
         self.model.startCapturing()
 
 
@@ -283,6 +298,7 @@ class MeasurementSeriesConfigurator(tk.Frame):
 
         if len(ms_dir) > 0:
             self.model.openMeasurementSeries(ms_dir)
+            self.model.setOutputFormat(OutputFormat(self.output_format.get()))
             self.model.startCapturing()
     
 
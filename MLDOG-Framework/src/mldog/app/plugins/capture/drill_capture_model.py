@@ -10,6 +10,7 @@ from ...model.core import Core
 from ...model.event_dispatcher import EventDispatcher
 
 from ...tasks.drill_procedure_detector_task import DrillProcedureDetectorTask
+from ....util.drill.io import write_measurement_binary, RECORDING_EXTENSION
 
 
 
@@ -19,6 +20,12 @@ class ApplicationState(Enum):
 
 
 
+class OutputFormat(Enum):
+    CSV = 'csv'
+    BINARY = 'binary'
+
+
+
 class MeasurementSeries:
     """
     Class for representing a measurement series.
@@ -143,6 +150,7 @@ class DrillCaptureModel(EventDispatcher):
         self._m_index: int = 0
         self._pause_processing = True
         self._measurement_data: np.ndarray = None
+        self._output_format: OutputFormat = OutputFormat.CSV
 
 
     def getState(self) -> ApplicationState:
@@ -264,6 +272,43 @@ class DrillCaptureModel(EventDispatcher):
         return self._measurement_data
     
 
+    def getOutputFormat(self) -> OutputFormat:
+        """
+        Retrieve the file format used for storing measurements.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        output_format : OutputFormat
+            The measurement file format.
+        """
+
+        return self._output_format
+    
+
+    def setOutputFormat(self, output_format: OutputFormat) -> None:
+        """
+        Set the file format used for storing measurements.
+
+        Binary recordings store float32 samples together with frequency, channel names and start time (see mldog.util.drill.io).
+        In both cases, the file name of each measurement is referenced in the measurements.csv table.
+
+        Parameters
+        ----------
+        output_format : OutputFormat
+            The measurement file format.
+
+        Returns
+        -------
+        None
+        """
+
+        self._output_format = output_format
+    
+
     def hasMeasurementData(self) -> bool:
         """
         Check if valid drill procedure measurement data are available.
@@ -544,9 +589,15 @@ class DrillCaptureModel(EventDispatcher):
             os.makedirs(self._m_series.output_dir)
         
         # store drill procedure measurement data
-        m_file_name = f'{datetime.datetime.now():%Y_%m_%d_%H_%M_%S}_96000Hz.csv'
-        m_file_path = os.path.join(self._m_series.output_dir, m_file_name)
-        np.savetxt(m_file_path, self._measurement_data, delimiter=',', header='Audio,Voltage,Current', fmt='%2.6f')
+        start_time = datetime.datetime.now()
+        if self._output_format == OutputFormat.BINARY:
+            m_file_name = f'{start_time:%Y_%m_%d_%H_%M_%S}_96000Hz{RECORDING_EXTENSION}'
+            m_file_path = os.path.join(self._m_series.output_dir, m_file_name)
+            write_measurement_binary(m_file_path, self._measurement_data, 96000, ['Audio', 'Voltage', 'Current'], start_time)
+        else:
+            m_file_name = f'{start_time:%Y_%m_%d_%H_%M_%S}_96000Hz.csv'
+            m_file_path = os.path.join(self._m_series.output_dir, m_file_name)
+            np.savetxt(m_file_path, self._measurement_data, delimiter=',', header='Audio,Voltage,Current', fmt='%2.6f')
 
         # set measurement file name reference in measurement table
         self._m_series.measurements.loc[self._m_index, 'dataFile'] = m_file_name
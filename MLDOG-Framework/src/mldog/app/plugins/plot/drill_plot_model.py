@@ -4,11 +4,15 @@ from enum import Enum
 
 from ...model.core import Core
 from ...model.event_dispatcher import EventDispatcher
+from ...model.result_coalescer import ResultCoalescer
 
 from ...tasks.drill_procedure_detector_task import DrillProcedureDetectorTask
 from ...tasks.stream_task import StreamTask
 
 
+# maximum redraw rate of the live plot (stream chunks arriving in between are merged)
+PLOT_FRAME_RATE = 30
+
 
 class ApplicationState(Enum):
     LIVE_PLOT = 1
@@ -42,7 +46,7 @@ class DrillPlotModel(EventDispatcher):
         self._pause_processing = False
         self._measurement_data: np.ndarray = np.zeros((self._buffer_size, 3))
 
-        self._core.setTask(StreamTask(), self.handleTaskResult)
+        self._core.setTask(StreamTask(), self.handleTaskResults, batch_results=True, coalescer=ResultCoalescer('merge', self._buffer_size, PLOT_FRAME_RATE))
 
 
     def getState(self) -> ApplicationState:
@@ -134,9 +138,9 @@ class DrillPlotModel(EventDispatcher):
 
             if self._state == ApplicationState.LIVE_PLOT:
                 self._measurement_data: np.ndarray = np.zeros((self._buffer_size, 3))
-                self._core.setTask(StreamTask(), self.handleTaskResult)
+                self._core.setTask(StreamTask(), self.handleTaskResults, batch_results=True, coalescer=ResultCoalescer('merge', self._buffer_size, PLOT_FRAME_RATE))
             else:
-                self._core.setTask(DrillProcedureDetectorTask(), self.handleTaskResult)
+                self._core.setTask(DrillProcedureDetectorTask(), self.handleTaskResults, batch_results=True, coalescer=ResultCoalescer('latest'))
 
             # notify state change
             self._dispatchEvent('state_changed')
@@ -172,21 +176,41 @@ class DrillPlotModel(EventDispatcher):
         msg : object
             The message from the task.
         """
+
+        self.handleTaskResults([msg])
+
+
+    def handleTaskResults(self, msgs: list) -> None:
+        """
+        Handler method for all task result messages pending since the last UI update.
+
+        The plotting buffer is updated once with all new data and a single change event is published, thus bursts of data chunks
+        cause a single redraw.
+
+        Parameters
+        ----------
+        msgs : list
+            The messages from the task.
+        """
         
         if self.isPausing():
             # no processing in preparation mode
             return
-        
-        if type(msg) == np.ndarray:
-            (n_points, nSignals) = msg.shape
 
-            if self._state == ApplicationState.LIVE_PLOT:
-                # update plotting buffer with new information
-                self._measurement_data[0:self._buffer_size - n_points] = self._measurement_data[n_points:]
-                self._measurement_data[self._buffer_size - n_points:, :] = msg[:, [1, 2, 0]]
-            else:
-                # store drill procedure data for further processing
-                self._measurement_data = msg
+        msgs = [msg for msg in msgs if type(msg) == np.ndarray]
+        if len(msgs) == 0:
+            return
+
+        if self._state == ApplicationState.LIVE_PLOT:
+            # update plotting buffer with new information (keeping only the latest buffer_size samples)
+            data = np.concatenate(msgs)[-self._buffer_size:] if len(msgs) > 1 else msgs[0][-self._buffer_size:]
+            n_points = data.shape[0]
+
+            self._measurement_data[0:self._buffer_size - n_points] = self._measurement_data[n_points:]
+            self._measurement_data[self._buffer_size - n_points:, :] = data[:, [1, 2, 0]]
+        else:
+            # store the latest drill procedure data for further processing
+            self._measurement_data = msgs[-1]
 
-            # notify measurement data change
-            self._dispatchEvent('measurement_data_changed')
+        # notify measurement data change
+        self._dispatchEvent('measurement_data_changed')
@@ -2,7 +2,10 @@ import numpy as np
 
 from ..model.task import Task
 from ...util.drill.drill_procedure_detector import DrillProcedureDetector
+from ...util.drill.features import FEATURE_SETS
+from ...util.drill.tsfresh_features import TSFRESH_PROFILES
 from ..model.pipeline import MaterialClassifier
+from ..model.model_registry import getDefaultModelPath
 
 
 class DetectorAndPredictorTask(Task):
@@ -10,18 +13,57 @@ class DetectorAndPredictorTask(Task):
     Simple task class for detecting drill procedures and extracting the related sensor data from the data stream.
     """
     
-    def __init__(self, ttl_max = 150, window_size = 48000, active_power = 50):
+    def __init__(self, ttl_max = 150, window_size = 48000, active_power = 50, mode = 'chunk',
+                 release_power = None, smoothing = 1, hold_samples = 72000):
         """
         Construct a new task instance.
 
         Parameters
         ----------
-        name : str
-            The name of the task.
+        ttl_max, window_size, active_power, mode, release_power, smoothing, hold_samples
+            The detection parameters, see `DrillProcedureDetector`.
         """
         super().__init__('Drill Procedure Detector')
 
-        self.detector = DrillProcedureDetector(ttl_max, window_size, active_power)
+        self.detection_parameters = (ttl_max, window_size, active_power, mode, release_power, smoothing, hold_samples)
+
+        # the detector is rebuilt in setup() to accumulate the feature set of the loaded model while drilling
+        self.detector = DrillProcedureDetector(*self.detection_parameters)
+        self.classifier = MaterialClassifier.getShared()
+
+
+    def setup(self) -> None:
+        """
+        Setup task components.
+
+        Loads the shared material classifier and runs a warm-up prediction before the first measurement data is processed.
+        The detector accumulates the features of the model's feature set while drilling, feature sets which can not be
+        accumulated (tsfresh) are extracted from the detected drill procedure instead.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        metadata = self.classifier.getMetadata()
+        feature_set = metadata.get('feature_set')
+        sample_rate = metadata.get('sample_rate', 96000)
+
+        if feature_set in FEATURE_SETS:
+            accumulated_feature_set = feature_set
+        elif feature_set in [f'tsfresh-{profile}' for profile in TSFRESH_PROFILES]:
+            accumulated_feature_set = None
+        else:
+            model_path = self.classifier.model_path if self.classifier.model_path is not None else getDefaultModelPath()
+            raise ValueError(f'Unsupported model artifact "{model_path}": unknown feature set "{feature_set}"')
+
+        self.detector = DrillProcedureDetector(*self.detection_parameters, feature_set = accumulated_feature_set, frequency = sample_rate)
+
+        self.classifier.warmUp()
 
 
     def reset(self) -> None:
@@ -63,6 +105,9 @@ class DetectorAndPredictorTask(Task):
        
         # check for successful drill procedure detection and publish it accordingly
         if drill_data is not None:
-            material = MaterialClassifier().predict(drill_data)
+            if self.detector.feature_set is not None:
+                material = self.classifier.predictFeatures(self.detector.getFeatures())
+            else:
+                material = self.classifier.predict(drill_data)
             result = [drill_data, material]
             self.publishResult(result)
\ No newline at end of file
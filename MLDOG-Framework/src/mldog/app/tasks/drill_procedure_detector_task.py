@@ -10,18 +10,19 @@ class DrillProcedureDetectorTask(Task):
     Simple task class for detecting drill procedures and extracting the related sensor data from the data stream.
     """
     
-    def __init__(self, ttl_max = 150, window_size = 48000, active_power = 50):
+    def __init__(self, ttl_max = 150, window_size = 48000, active_power = 50, mode = 'chunk',
+                 release_power = None, smoothing = 1, hold_samples = 72000):
         """
         Construct a new task instance.
 
         Parameters
         ----------
-        name : str
-            The name of the task.
+        ttl_max, window_size, active_power, mode, release_power, smoothing, hold_samples
+            The detection parameters, see `DrillProcedureDetector`.
         """
         super().__init__('Drill Procedure Detector')
 
-        self.detector = DrillProcedureDetector(ttl_max, window_size, active_power)
+        self.detector = DrillProcedureDetector(ttl_max, window_size, active_power, mode, release_power, smoothing, hold_samples)
 
 
     def reset(self) -> None:
@@ -0,0 +1,73 @@
+import numpy as np
+
+from ..model.task import Task
+from ...util.drill.multi_drill_procedure_detector import MultiDrillProcedureDetector, channel_groups
+
+
+
+class MultiDrillProcedureDetectorTask(Task):
+    """
+    Task class for detecting drill procedures of several drills sharing one data stream.
+
+    Each detected procedure is published as (group_id, drill_data) tuple, see `MultiDrillProcedureDetector`.
+    """
+
+    def __init__(self, groups: dict = None, ttl_max = 150, window_size = 48000, active_power = 50, mode = 'chunk',
+                 release_power = None, smoothing = 1, hold_samples = 72000, channel_names: list[str] = None):
+        """
+        Construct a new task instance.
+
+        Parameters
+        ----------
+        groups : dict
+            The mapping group id -> (audio index, voltage index, current index) of the stream columns, or None to derive it from channel_names.
+        ttl_max, window_size, active_power, mode, release_power, smoothing, hold_samples
+            The detection parameters, see `DrillProcedureDetector`.
+        channel_names : list[str]
+            The channel names of the stream (e.g. of the measurement configuration of the data source), used if no groups are given.
+        """
+        super().__init__('Multi Drill Procedure Detector')
+
+        if groups is None:
+            groups = channel_groups(channel_names if channel_names is not None else ['Audio', 'Voltage', 'Current'])
+
+        self.detector = MultiDrillProcedureDetector(groups, ttl_max, window_size, active_power, mode, release_power, smoothing, hold_samples)
+
+
+    def reset(self) -> None:
+        """
+        Reset internal buffer to start a new detection from scratch.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.detector.reset()
+
+
+    def process(self, data: np.ndarray) -> None:
+        """
+        Process new measurement data.
+
+        Measurement data is received in chunks (sequential data portions).
+        This method is automatically called by the task thread for each incoming data chunk during an active measurement.
+        Any complex / time consuming calculations on measurement data should be performed within this method.
+
+        Parameters
+        ----------
+        data: ndarray
+            The next chunk of measurement data to process.
+
+        Returns
+        -------
+        None
+        """
+
+        # forward steam data to detector instance and publish all detected procedures
+        for group_id, drill_data in self.detector.update(data):
+            self.publishResult((group_id, drill_data))
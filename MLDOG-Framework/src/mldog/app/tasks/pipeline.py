@@ -1,3 +1,5 @@
+# Exploration script - to train and export a model artifact use: python -m mldog train <measurement series directory>
+
 # Automatically reload external modules (see https://ipython.org/ipython-doc/3/config/extensions/autoreload.html for more information).
 #%load_ext autoreload
 #%autoreload 2
@@ -61,23 +63,21 @@ lisTimeTest = []
 # Breakpoint für Trainingsdaten (70. DataFrame)
 breakpoint1 = '2024_10_23_10_32_42_96000Hz.csv'
 
-# Generierung von Trainingsdaten
+# Generierung von Trainingsdaten (Aufnahmen im data-Ordner des MLDOG-Frameworks)
+data_path = os.path.join(os.path.dirname(current_file_path), '..', '..', '..', '..', 'data')
+trainFiles = []
 for datafr in dfmeasurements['dataFile']:
-    tempdf = pd.read_csv(f'C:/Users/Muster/Desktop/Angewandte Künstliche Intelligenz/Semester 3/Projekt1/Projektrepository/team-9/MLDOG-Framework/data/{datafr}')
-    
-    audioAvg = tempdf['# Audio'].mean()
-    voltageAvg = tempdf['Voltage'].mean()
-    currentAvg = tempdf['Current'].mean()
-    time = tempdf.shape[0] / 96000
-
-    lisVoltTrain += [voltageAvg]
-    lisCurrentTrain += [currentAvg]
-    lisTimeTrain += [time]
-    lisAudioTrain += [audioAvg]
+    trainFiles += [os.path.join(data_path, datafr)]
 
     if datafr == breakpoint1:
         break
 
+# Features (AudioAvg, VoltageAvg, CurrentAvg, time) werden im Feature Store zwischengespeichert -> nur neue Aufnahmen werden gelesen
+# (ein Prozess: das Skript hat keinen Main-Guard, gestartete Worker-Prozesse würden es erneut ausführen)
+featureStore = dog.FeatureStore(os.path.join(data_path, '.features'))
+trainFeatures = featureStore.getFeatures(trainFiles, 'basic', n_workers=1)
+lisAudioTrain, lisVoltTrain, lisCurrentTrain, lisTimeTrain = (list(column) for column in trainFeatures.T)
+
 # Testdaten (optional)
 # Generierung von Testdaten erfolgt hier nach ähnlichem Prinzip wie bei Train
 
@@ -10,10 +10,12 @@ class StatusBar(tk.Frame):
     The application status bar.
     """
     
-    def __init__(self, master):
+    def __init__(self, master, refresh_interval: int = 1000):
         tk.Frame.__init__(self, master)
         self.style: ttk.Style = ttk.Style(self)
         self.data_source: DataSource = None
+        self.refresh_interval: int = refresh_interval
+        self._refresh_job = None
 
         # Activity indicator
         self.active_label = tk.Label(self, text='\u25CF', bd=1, relief=tk.FLAT, anchor=tk.W, background='white')
@@ -24,6 +26,10 @@ class StatusBar(tk.Frame):
         self.ds_label = tk.Label(self, text='Disconnected', bd=1, relief=tk.FLAT, anchor=tk.W, background='white')
         self.ds_label.grid(column=1, row=0, padx=2, pady=2)
 
+        # Stream Statistics Label
+        self.stats_label = tk.Label(self, text='', bd=1, relief=tk.FLAT, anchor=tk.W, background='white')
+        self.stats_label.grid(column=2, row=0, padx=(10, 2), pady=2)
+
         # Separator
         # sep = ttk.Separator(self, orient=tk.VERTICAL)
         # self.style.configure('Normal.TLabel', font=('Cambria', 10),  foreground='black', background='white')
@@ -50,6 +56,7 @@ class StatusBar(tk.Frame):
             self.ds_label.config(text = 'Disconnected')
 
         self.refreshDSActiveLabel()
+        self.refreshStatisticsLabel()
 
 
     def refreshDSActiveLabel(self):
@@ -58,3 +65,26 @@ class StatusBar(tk.Frame):
         """
         
         self.active_label.configure(foreground = 'green' if self.data_source is not None and self.data_source.isMeasuring() else 'red')
+
+
+    def refreshStatisticsLabel(self):
+        """
+        Refresh the stream statistics label and schedule the next refresh as long as the data source provides statistics.
+        """
+
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+
+        stats = None if self.data_source is None else self.data_source.getStatistics()
+
+        if stats is None:
+            self.stats_label.config(text = '')
+            return
+
+        self.stats_label.config(text = f'{stats["samples_per_second"] / 1000:.1f} kS/s  |  '
+                                       f'{stats["bytes_per_second"] / 1e6:.2f} MB/s  |  '
+                                       f'Lost: {stats["gap_skipped"]}  Late: {stats["late"]}  Discarded: {stats["discarded"]}  |  '
+                                       f'Jitter: {stats["jitter"] * 1000:.2f} ms')
+
+        self._refresh_job = self.after(self.refresh_interval, self.refreshStatisticsLabel)
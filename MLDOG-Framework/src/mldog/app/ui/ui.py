@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+from tkinter import messagebox
 
 from ..context import MLDOGContext
 from ..plugin_descriptor import MLDOGApplicationDescription
@@ -16,6 +17,10 @@ class MLDOGUI(tk.Tk):
     """
     Central UI Application based on tkinter.
     """
+
+    # polling intervals (in ms) of the task observer on platforms without tkinter file handlers (Windows)
+    MIN_POLL_INTERVAL = 10
+    MAX_POLL_INTERVAL = 100
     
     def __init__(self, context: MLDOGContext, **kwargs):
         """
@@ -57,8 +62,12 @@ class MLDOGUI(tk.Tk):
         self.style.configure("TSeparator", background="white")
 
         self.configure(bg='white')
-        # start task observer polling loop
-        self.after_idle(lambda: self.triggerTaskObserver())
+
+        # start task observer
+        self._dispatch_job = None
+        self._poll_interval: int = self.MIN_POLL_INTERVAL
+        self._result_fd: int = None
+        self.startTaskObserver()
 
     def run(self):
         """
@@ -77,18 +86,87 @@ class MLDOGUI(tk.Tk):
         self.mainloop()
 
 
+    def startTaskObserver(self) -> None:
+        """
+        Start observing task results.
+
+        Results are delivered event driven: tasks signal new results via the result notifier of the core, whose pipe is watched
+        by a tkinter file handler. Thus the mainloop stays idle without results. On platforms without file handler support (Windows)
+        the result queue is polled with an adaptive interval instead.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        notifier = self.core.getResultNotifier()
+
+        try:
+            self.tk.createfilehandler(notifier.fileno(), tk.READABLE, self.onTaskResultsSignaled)
+            self._result_fd = notifier.fileno()
+        except (AttributeError, tk.TclError):
+            # file handlers are not supported, thus fall back to polling
+            self.after_idle(self.triggerTaskObserver)
+
+
+    def onTaskResultsSignaled(self, fd: int, mask: int) -> None:
+        """
+        Handle the wakeup of the result notifier, scheduling a single result dispatch for the next idle phase of the mainloop
+        (or the next frame, if the frame rate of the active task is limited).
+
+        Thus all results published until then are dispatched together, at most once per frame.
+        """
+
+        # reset the notifier immediately, as a readable pipe would keep the mainloop from ever becoming idle
+        self.core.getResultNotifier().drain()
+
+        self.scheduleTaskResultDispatch()
+
+
+    def scheduleTaskResultDispatch(self) -> None:
+        """
+        Schedule a result dispatch (unless already scheduled) for the next idle phase of the mainloop or the next allowed frame.
+        """
+
+        if self._dispatch_job is None:
+            delay = int(round(self.core.getResultDispatchDelay() * 1000))
+            self._dispatch_job = self.after(delay, self.dispatchTaskResults) if delay > 0 else self.after_idle(self.dispatchTaskResults)
+
+
+    def dispatchTaskResults(self) -> None:
+        """
+        Dispatch all pending task results.
+        """
+
+        self._dispatch_job = None
+        self.core.checkForTaskResults()
+
+        # results held back by the frame rate limit of a task are dispatched with its next frame
+        if self.core.hasPendingTaskResults():
+            self.scheduleTaskResultDispatch()
+
+
     def triggerTaskObserver(self) -> None:
         """
-        Method for polling result messages from tasks.
+        Method for polling result messages from tasks (fallback without file handler support).
 
         This method is used to decouple the task processing thread from the ui thread.
+        The polling interval is reset to MIN_POLL_INTERVAL while results arrive and backs off up to MAX_POLL_INTERVAL when idle.
         """
         
         # check for new task result messages
-        self.core.checkForTaskResults()
+        if self.core.checkForTaskResults() > 0:
+            self._poll_interval = self.MIN_POLL_INTERVAL
+        else:
+            self._poll_interval = min(self._poll_interval * 2, self.MAX_POLL_INTERVAL)
 
-        # schedule next trigger in 10ms
-        self.after(10, self.triggerTaskObserver)
+        # schedule next trigger (not before the next frame of the active task)
+        delay = max(self._poll_interval, int(round(self.core.getResultDispatchDelay() * 1000)))
+        self._dispatch_job = self.after(delay, self.triggerTaskObserver)
 
 
     def setup(self) -> None:
@@ -142,6 +220,7 @@ class MLDOGUI(tk.Tk):
         # add event listeners
         self.core.addListener('data_source_changed', self.onDataSourceChanged)
         self.core.addListener('task_changed', self.onTaskChanged)
+        self.core.addListener('task_failed', self.onTaskFailed)
 
         self.protocol("WM_DELETE_WINDOW", self.shutdown)
 
@@ -184,7 +263,7 @@ class MLDOGUI(tk.Tk):
 
         # universal data source controls
         self.ds_menu.add_separator()
-        self.ds_menu.add_command(label = 'Start / Stop Measurement', command = self.toggleMeasurement, state=tk.NORMAL if self.core.hasActiveDataSource() and self.core.hasActiveTask() else tk.DISABLED)
+        self.ds_menu.add_command(label = 'Start / Stop Measurement', command = self.toggleMeasurement, state=tk.NORMAL if self.core.hasActiveDataSource() and self.core.hasTasks() else tk.DISABLED)
 
         # clear data source control
         self.ds_menu.add_separator()
@@ -244,8 +323,8 @@ class MLDOGUI(tk.Tk):
         if self.core.hasActiveDataSource():
             if self.core.getActiveDataSource().isMeasuring():
                 self.core.getActiveDataSource().stopMeasurement()
-            elif self.core.hasActiveTask():
-                self.core.getActiveDataSource().startMeasurement(self.core.getActiveTask().getDataQueue())
+            else:
+                self.core.startMeasurement()
     
 
     def clearMainFrame(self) -> None:
@@ -315,7 +394,7 @@ class MLDOGUI(tk.Tk):
         """
 
         if self.core.hasActiveDataSource():
-            self.ds_menu.entryconfigure("Start / Stop Measurement", state=tk.NORMAL if self.core.hasActiveTask() else tk.DISABLED)
+            self.ds_menu.entryconfigure("Start / Stop Measurement", state=tk.NORMAL if self.core.hasTasks() else tk.DISABLED)
             self.ds_menu.entryconfigure("Clear", state=tk.NORMAL)
         else:
             self.ds_menu.entryconfigure("Start / Stop Measurement", state=tk.DISABLED)
@@ -339,9 +418,28 @@ class MLDOGUI(tk.Tk):
         None
         """
 
-        self.ds_menu.entryconfigure("Start / Stop Measurement", state=tk.NORMAL if self.core.hasActiveDataSource() and self.core.hasActiveTask() else tk.DISABLED)
+        self.ds_menu.entryconfigure("Start / Stop Measurement", state=tk.NORMAL if self.core.hasActiveDataSource() and self.core.hasTasks() else tk.DISABLED)
     
 
+    def onTaskFailed(self, task, error: Exception) -> None:
+        """
+        Handle a task which stopped due to an exception.
+
+        Parameters
+        ----------
+        task : Task
+            The failed task.
+        error : Exception
+            The exception raised by the task.
+
+        Returns
+        -------
+        None
+        """
+
+        messagebox.showerror('Task failed', f'The task "{task.getName()}" stopped due to an error:\n\n{error}', parent=self)
+
+
     def shutdown(self) -> None:
         """
         Shutdown UI application.
@@ -360,6 +458,16 @@ class MLDOGUI(tk.Tk):
         
         self.core.setDataSource()
         self.core.setTask()
+        for task in self.core.getTasks():
+            self.core.removeTask(task)
+
+        if self._result_fd is not None:
+            self.tk.deletefilehandler(self._result_fd)
+            self._result_fd = None
+        if self._dispatch_job is not None:
+            self.after_cancel(self._dispatch_job)
+            self._dispatch_job = None
+
         self.destroy()
         self.quit()
 
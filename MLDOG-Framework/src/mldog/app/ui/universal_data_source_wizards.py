@@ -5,7 +5,7 @@ import threading
 from ..tasks.drill_procedure_detector_task import DrillProcedureDetectorTask
 from os.path import exists
 from ..model.pipeline import MaterialClassifier
-from ..model.universal_data_sources import DummyDataSource, LogDataSource, UDPDataSource
+from ..model.universal_data_sources import DummyDataSource, LogDataSource, UDPDataSource, MultiprocessUDPDataSource
 from .wizard import Wizard
 from ..model.core import Core
 from ..ui.application import MLDOGApplication
@@ -20,19 +20,25 @@ class UDPDataSourceWizard(Wizard):
         super().__init__('UDP Data Source', 'New UDP Data Source')
 
         self.capturame_ip = None
+        self.batch_mode = None
+        self.multiprocess = None
     
 
     def constructWizardPane(self) -> tk.Frame:
         # initialize parameter
         if self.capturame_ip is None:
             self.capturame_ip = tk.StringVar(value='localhost')
+            self.batch_mode = tk.BooleanVar(value=False)
+            self.multiprocess = tk.BooleanVar(value=False)
 
         # panel container
         config_pane = ttk.LabelFrame(self.wizard, text = "Capturama")
         config_pane.columnconfigure(0, weight=0)
         config_pane.columnconfigure(1, weight=1)
         config_pane.rowconfigure(0, weight=0)
-        config_pane.rowconfigure(1, weight=1)
+        config_pane.rowconfigure(1, weight=0)
+        config_pane.rowconfigure(2, weight=0)
+        config_pane.rowconfigure(3, weight=1)
 
         # capturama ip
         label = ttk.Label(config_pane, text='IP:')
@@ -41,13 +47,30 @@ class UDPDataSourceWizard(Wizard):
         ip_input = ttk.Entry(config_pane, textvariable = self.capturame_ip)
         ip_input.grid(column=1, row=0, padx=(5, 20), pady=10, sticky=(tk.E, tk.W))
 
+        # batched receive mode
+        label = ttk.Label(config_pane, text='Batch Receive:')
+        label.grid(column=0, row=1, padx=(20, 5), pady=10, sticky=tk.E)
+
+        batch_box = ttk.Checkbutton(config_pane, variable = self.batch_mode)
+        batch_box.grid(column=1, row=1, padx=(5, 20), pady=10, sticky=tk.W)
+
+        # separate ingestion process
+        label = ttk.Label(config_pane, text='Separate Process:')
+        label.grid(column=0, row=2, padx=(20, 5), pady=10, sticky=tk.E)
+
+        process_box = ttk.Checkbutton(config_pane, variable = self.multiprocess)
+        process_box.grid(column=1, row=2, padx=(5, 20), pady=10, sticky=tk.W)
+
         return config_pane
 
 
     def finish(self):
         super().finish()
         
-        self.core.setDataSource(UDPDataSource(capturama_ip = self.capturame_ip.get()))
+        if self.multiprocess.get():
+            self.core.setDataSource(MultiprocessUDPDataSource(capturama_ip = self.capturame_ip.get(), batch_mode = self.batch_mode.get()))
+        else:
+            self.core.setDataSource(UDPDataSource(capturama_ip = self.capturame_ip.get(), batch_mode = self.batch_mode.get()))
 
 
 
@@ -62,6 +85,12 @@ class LogDataSourceWizard(Wizard):
         self.path = None
         self.frequency = None
         self.block_size = None
+        self.speed = None
+        self.play_all = None
+    
+
+    def show(self, ui: tk.Frame, core: Core, width=400, height=380):
+        super().show(ui, core, width, height)
     
 
     def constructWizardPane(self) -> tk.Frame:
@@ -70,6 +99,8 @@ class LogDataSourceWizard(Wizard):
             self.path = tk.StringVar(value='../data' if exists('../data') else './data')
             self.frequency = tk.IntVar(value=96000)
             self.block_size = tk.IntVar(value=480)
+            self.speed = tk.DoubleVar(value=1.0)
+            self.play_all = tk.BooleanVar(value=False)
 
         # panel container
         # config_pane = ttk.Frame(self.wizard)
@@ -80,7 +111,9 @@ class LogDataSourceWizard(Wizard):
         config_pane.rowconfigure(0, weight=0)
         config_pane.rowconfigure(1, weight=0)
         config_pane.rowconfigure(2, weight=0)
-        config_pane.rowconfigure(3, weight=1)
+        config_pane.rowconfigure(3, weight=0)
+        config_pane.rowconfigure(4, weight=0)
+        config_pane.rowconfigure(5, weight=1)
 
         # path
         label = ttk.Label(config_pane, text='Path:')
@@ -106,6 +139,20 @@ class LogDataSourceWizard(Wizard):
         block_size_box = ttk.Spinbox(config_pane, from_=1, to=96000, textvariable=self.block_size)
         block_size_box.grid(column=1, row=2, padx=(5, 20), pady=10, sticky = (tk.E, tk.W), columnspan=2)
 
+        # replay speed
+        label = ttk.Label(config_pane, text='Speed (0 = max):')
+        label.grid(column=0, row=3, padx=(20, 5), pady=10, sticky=tk.E)
+
+        speed_box = ttk.Spinbox(config_pane, from_=0, to=1000, increment=1, textvariable=self.speed)
+        speed_box.grid(column=1, row=3, padx=(5, 20), pady=10, sticky = (tk.E, tk.W), columnspan=2)
+
+        # play all files back to back
+        label = ttk.Label(config_pane, text='All Files:')
+        label.grid(column=0, row=4, padx=(20, 5), pady=10, sticky=tk.E)
+
+        play_all_box = ttk.Checkbutton(config_pane, variable = self.play_all)
+        play_all_box.grid(column=1, row=4, padx=(5, 20), pady=10, sticky=tk.W, columnspan=2)
+
         return config_pane
     
 
@@ -120,7 +167,7 @@ class LogDataSourceWizard(Wizard):
         super().finish()
 
         if exists(self.path.get()):
-            self.core.setDataSource(LogDataSource(self.path.get(), self.block_size.get(), self.frequency.get()))
+            self.core.setDataSource(LogDataSource(self.path.get(), self.block_size.get(), self.frequency.get(), self.speed.get(), self.play_all.get()))
         else:
             print(f'The selected path: "{self.path.get()}" does not exist!')
 
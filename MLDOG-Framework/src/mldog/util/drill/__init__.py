@@ -1,4 +1,10 @@
 # Private submodules
 from . import io
+from . import features
+from . import feature_store
+from . import tsfresh_features
 
+from .capture_buffer import CaptureBuffer, StreamBuffer
 from .drill_procedure_detector import DrillProcedureDetector
+from .feature_store import FeatureStore
+from .multi_drill_procedure_detector import MultiDrillProcedureDetector, channel_groups
@@ -0,0 +1,428 @@
+import numpy as np
+
+
+__all__ = ['CaptureBuffer', 'StreamBuffer']
+
+
+class CaptureBuffer():
+    """
+    Preallocated sample buffer for capturing stream sections including their history.
+
+    The buffer consists of a fixed pre-trigger ring, holding the most recent `history_size` samples, and a capture region.
+    Once a capture is started, the ring history is copied to the front of the capture region and subsequent chunks are appended behind it.
+    The capture region grows geometrically (doubling its capacity), thus appending a chunk costs amortized O(chunk size) regardless of the capture length.
+    Both regions are allocated lazily on the first chunk, taking the channel count and value type from the data.
+    """
+
+    def __init__(self, history_size: int = 48000, initial_capacity: int = 96000):
+        """
+        Construct a new capture buffer.
+
+        Parameters
+        ----------
+        history_size : int
+            The number of samples kept in the pre-trigger ring.
+        initial_capacity : int
+            The initial number of samples of the capture region.
+        """
+
+        self.history_size: int = history_size
+        self.initial_capacity: int = max(initial_capacity, history_size, 1)
+
+        self._ring: np.ndarray = None
+        self._ring_count: int = 0
+
+        self._capture: np.ndarray = None
+        self._length: int = 0
+        self._capturing: bool = False
+
+
+    def __len__(self) -> int:
+        """
+        Retrieve the number of buffered samples (the ring history if idle, the captured samples otherwise).
+        """
+
+        if self._capturing:
+            return self._length
+
+        return min(self._ring_count, self.history_size)
+
+
+    def isCapturing(self) -> bool:
+        """
+        Check if a capture is in progress.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        capturing : bool
+            True, if chunks are appended to the capture region, False if they are kept in the pre-trigger ring.
+        """
+
+        return self._capturing
+
+
+    def reset(self) -> None:
+        """
+        Discard the buffered samples (allocated memory is kept for reuse).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self._ring_count = 0
+        self._length = 0
+
+
+    def append(self, data: np.ndarray) -> None:
+        """
+        Append the given chunk to the capture region if a capture is in progress, or to the pre-trigger ring otherwise.
+
+        Parameters
+        ----------
+        data : ndarray
+            The (n_samples, n_channels) chunk to append.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._capturing:
+            self._appendCapture(data)
+        else:
+            self._appendHistory(data)
+
+
+    def startCapture(self) -> None:
+        """
+        Start a new capture, beginning with the samples of the pre-trigger ring.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self._length = 0
+        self._capturing = True
+
+        n_history = min(self._ring_count, self.history_size)
+        if n_history == 0:
+            return
+
+        # copy ring history in chronological order
+        self._reserve(n_history, self._ring)
+        begin = (self._ring_count - n_history) % self.history_size
+        n_first = min(n_history, self.history_size - begin)
+
+        self._capture[:n_first] = self._ring[begin:begin + n_first]
+        self._capture[n_first:n_history] = self._ring[:n_history - n_first]
+        self._length = n_history
+
+        self._ring_count = 0
+
+
+    def view(self) -> np.ndarray:
+        """
+        Retrieve a view on the samples captured so far.
+
+        The view is only valid until the next call of append(), startCapture() or finishCapture().
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        data : ndarray
+            The (n_samples, n_channels) captured samples.
+        """
+
+        if self._capture is None:
+            return None
+
+        return self._capture[:self._length]
+
+
+    def finishCapture(self, copy: bool = True) -> np.ndarray:
+        """
+        Finish the current capture and retrieve the captured samples.
+
+        Parameters
+        ----------
+        copy : bool
+            True, to return a contiguous copy of the captured samples and keep the capture region for reuse,
+            False, to hand over the capture region itself (returning a view, the next capture allocates a new region).
+
+        Returns
+        -------
+        data : ndarray
+            The (n_samples, n_channels) captured samples.
+        """
+
+        data = self.view()
+        if data is not None:
+            if copy:
+                data = data.copy()
+            else:
+                self._capture = None
+
+        self._length = 0
+        self._capturing = False
+
+        return data
+
+
+    def _appendHistory(self, data: np.ndarray) -> None:
+        """
+        Write the given chunk into the pre-trigger ring, overwriting the oldest samples.
+        """
+
+        if self.history_size == 0:
+            return
+
+        if self._ring is None or self._ring.shape[1:] != data.shape[1:]:
+            self._ring = np.empty((self.history_size,) + data.shape[1:], dtype=data.dtype)
+            self._ring_count = 0
+
+        n_samples = data.shape[0]
+        if n_samples > self.history_size:
+            # only the most recent samples fit into the ring
+            self._ring_count += n_samples - self.history_size
+            data = data[-self.history_size:]
+            n_samples = self.history_size
+
+        begin = self._ring_count % self.history_size
+        n_first = min(n_samples, self.history_size - begin)
+
+        self._ring[begin:begin + n_first] = data[:n_first]
+        self._ring[:n_samples - n_first] = data[n_first:]
+        self._ring_count += n_samples
+
+
+    def _appendCapture(self, data: np.ndarray) -> None:
+        """
+        Append the given chunk to the capture region, growing it if necessary.
+        """
+
+        length = self._length + data.shape[0]
+        self._reserve(length, data)
+
+        self._capture[self._length:length] = data
+        self._length = length
+
+
+    def _reserve(self, n_samples: int, like: np.ndarray) -> None:
+        """
+        Ensure the capture region can hold n_samples samples shaped like the given array, doubling its capacity as needed.
+        """
+
+        if self._capture is None or self._capture.shape[1:] != like.shape[1:]:
+            capacity = self.initial_capacity
+            while capacity < n_samples:
+                capacity *= 2
+
+            self._capture = np.empty((capacity,) + like.shape[1:], dtype=like.dtype)
+            return
+
+        capacity = self._capture.shape[0]
+        if capacity >= n_samples:
+            return
+
+        while capacity < n_samples:
+            capacity *= 2
+
+        grown = np.empty((capacity,) + self._capture.shape[1:], dtype=self._capture.dtype)
+        grown[:self._length] = self._capture[:self._length]
+        self._capture = grown
+
+
+
+class StreamBuffer():
+    """
+    Growable sample buffer addressing the stream by absolute sample indices.
+
+    Chunks are appended at the end, samples no longer needed are discarded from the front.
+    Discarded space is reclaimed by moving the retained samples to the front once the end of the allocation is reached,
+    the allocation is doubled if less than half of it would be free afterwards. Thus appending a chunk costs amortized O(chunk size).
+    """
+
+    def __init__(self, initial_capacity: int = 96000):
+        """
+        Construct a new stream buffer.
+
+        Parameters
+        ----------
+        initial_capacity : int
+            The initial number of samples of the allocation.
+        """
+
+        self.initial_capacity: int = max(initial_capacity, 1)
+
+        self._data: np.ndarray = None
+        self._begin: int = 0
+        self._end: int = 0
+        self._start_index: int = 0
+
+
+    def __len__(self) -> int:
+        """
+        Retrieve the number of retained samples.
+        """
+
+        return self._end - self._begin
+
+
+    def getStartIndex(self) -> int:
+        """
+        Retrieve the absolute index of the first retained sample.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        start_index : int
+            The absolute index of the first retained sample.
+        """
+
+        return self._start_index
+
+
+    def getStopIndex(self) -> int:
+        """
+        Retrieve the absolute index after the last appended sample.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        stop_index : int
+            The total number of samples appended since the last reset.
+        """
+
+        return self._start_index + self._end - self._begin
+
+
+    def reset(self) -> None:
+        """
+        Discard all samples and restart absolute indexing at zero (allocated memory is kept for reuse).
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self._begin = 0
+        self._end = 0
+        self._start_index = 0
+
+
+    def append(self, data: np.ndarray) -> None:
+        """
+        Append the given chunk.
+
+        Parameters
+        ----------
+        data : ndarray
+            The (n_samples, n_channels) chunk to append.
+
+        Returns
+        -------
+        None
+        """
+
+        n_samples = data.shape[0]
+
+        if self._data is None or self._data.shape[1:] != data.shape[1:]:
+            capacity = self.initial_capacity
+            while capacity < 2 * n_samples:
+                capacity *= 2
+
+            self._data = np.empty((capacity,) + data.shape[1:], dtype=data.dtype)
+            self._start_index += self._end - self._begin
+            self._begin = 0
+            self._end = 0
+
+        elif self._end + n_samples > self._data.shape[0]:
+            n_retained = self._end - self._begin
+            capacity = self._data.shape[0]
+            while capacity < 2 * (n_retained + n_samples):
+                capacity *= 2
+
+            if capacity > self._data.shape[0]:
+                moved = np.empty((capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+            else:
+                moved = self._data
+
+            # move retained samples to the front
+            moved[:n_retained] = self._data[self._begin:self._end]
+            self._data = moved
+            self._begin = 0
+            self._end = n_retained
+
+        self._data[self._end:self._end + n_samples] = data
+        self._end += n_samples
+
+
+    def discard(self, index: int) -> None:
+        """
+        Discard all samples before the given absolute index.
+
+        Parameters
+        ----------
+        index : int
+            The absolute index of the first sample to retain.
+
+        Returns
+        -------
+        None
+        """
+
+        n_discard = min(max(index - self._start_index, 0), self._end - self._begin)
+        self._begin += n_discard
+        self._start_index += n_discard
+
+
+    def slice(self, start: int, stop: int) -> np.ndarray:
+        """
+        Retrieve a view on the samples of the given absolute index range.
+
+        The view is only valid until the next call of append().
+
+        Parameters
+        ----------
+        start : int
+            The absolute index of the first sample (clipped to the retained samples).
+        stop : int
+            The absolute index after the last sample (clipped to the retained samples).
+
+        Returns
+        -------
+        data : ndarray
+            The (n_samples, n_channels) samples.
+        """
+
+        begin = self._begin + min(max(start - self._start_index, 0), self._end - self._begin)
+        end = self._begin + min(max(stop - self._start_index, 0), self._end - self._begin)
+
+        return self._data[begin:max(begin, end)]
@@ -1,7 +1,188 @@
+from collections import deque
+
 import numpy as np
 
+from .capture_buffer import CaptureBuffer, StreamBuffer
+from .features import FeatureAccumulator
+
+
+__all__ = ['DrillProcedureDetector', 'PowerActivity', 'ProcedureTracker']
+
+
+class PowerActivity():
+    """
+    Per-sample drill activity detection based on power consumption.
+
+    The power is optionally smoothed by a moving average and compared to the active power, or - for hysteresis -
+    the drill stays active until the power falls below the release power.
+    Smoothing and hysteresis state is carried across chunks, thus the result does not depend on the chunking of the stream.
+    Power arrays may be one-dimensional (n_samples,) or two-dimensional (n_samples, n_groups) to evaluate several drills at once.
+    """
+
+    def __init__(self, active_power = 20, release_power = None, smoothing = 1):
+        """
+        Construct a new power activity detection.
+
+        Parameters
+        ----------
+        active_power : float
+            The power level beyond which the drill is considered active.
+        release_power : float
+            The power level below which an active drill is considered inactive again, or None to use active_power.
+        smoothing : int
+            The length of the moving average applied to the power, 1 to disable smoothing.
+        """
+
+        self.active_power = active_power
+        self.release_power = release_power if release_power is not None else active_power
+        self.smoothing = max(int(smoothing), 1)
+
+        self.reset()
+
+
+    def reset(self):
+        """
+        Reset smoothing and hysteresis state.
+        """
+
+        self.power_history = None
+        self.was_active = False
+
+
+    def update(self, power: np.ndarray) -> np.ndarray:
+        """
+        Determine for each sample of the given power chunk if the drill is active.
+
+        Parameters
+        ----------
+        power : ndarray
+            The (n_samples,) or (n_samples, n_groups) power values.
+
+        Returns
+        -------
+        active : ndarray
+            The boolean activity per sample (and group).
+        """
+
+        power = power.astype(np.float64, copy=False)
+
+        if self.smoothing > 1:
+            if self.power_history is None or self.power_history.shape[1:] != power.shape[1:]:
+                self.power_history = np.zeros((self.smoothing - 1,) + power.shape[1:])
+
+            # moving average, continued across chunk boundaries
+            extended = np.concatenate((self.power_history, power))
+            cumsum = np.concatenate((np.zeros((1,) + power.shape[1:]), np.cumsum(extended, axis=0)))
+            power = (cumsum[self.smoothing:] - cumsum[:-self.smoothing]) / self.smoothing
+            self.power_history = extended[-(self.smoothing - 1):]
+
+        if self.release_power >= self.active_power:
+            active = power > self.active_power
+        else:
+            # hysteresis: keep the previous state while the power is between release and active power
+            event = np.where(power > self.active_power, 1, np.where(power < self.release_power, -1, 0))
+            sample_idx = np.arange(event.shape[0]).reshape((-1,) + (1,) * (event.ndim - 1))
+            event_idx = np.maximum.accumulate(np.where(event != 0, sample_idx, -1), axis=0)
+            last_event = np.take_along_axis(event, np.maximum(event_idx, 0), axis=0)
+            active = np.where(event_idx >= 0, last_event > 0, self.was_active)
+
+        if active.shape[0] > 0:
+            self.was_active = active[-1].copy()
+
+        return active
+
+
+
+class ProcedureTracker():
+    """
+    Sample accurate tracking of drill procedure boundaries in a stream of activity flags.
+
+    A procedure ranges from the first to the last active sample and ends once hold_samples consecutive samples are inactive.
+    Boundaries are reported as absolute (inclusive) sample indices.
+    """
+
+    def __init__(self, hold_samples = 72000):
+        """
+        Construct a new procedure tracker.
+
+        Parameters
+        ----------
+        hold_samples : int
+            The number of consecutive inactive samples ending a drill procedure.
+        """
+
+        self.hold_samples = hold_samples
+
+        self.reset()
+
+
+    def reset(self):
+        """
+        Reset the tracking state.
+        """
+
+        self.start_detected = False
+        self.start_index = None
+        self.last_active_index = None
+
+
+    def update(self, active: np.ndarray, base_index: int) -> list[tuple[int, int]]:
+        """
+        Track procedure boundaries within the next chunk of activity flags.
+
+        Parameters
+        ----------
+        active : ndarray
+            The boolean activity per sample of the chunk.
+        base_index : int
+            The absolute index of the first sample of the chunk.
+
+        Returns
+        -------
+        procedures : list[tuple[int, int]]
+            The (start_index, end_index) of all procedures ending within the chunk.
+        """
+
+        procedures = []
+        n_samples = active.shape[0]
+
+        # find procedure boundaries (relative to the chunk start)
+        offset = 0
+        while offset < n_samples:
+            if not self.start_detected:
+                hits = np.flatnonzero(active[offset:])
+                if hits.shape[0] == 0:
+                    break
+
+                # start detected
+                offset += int(hits[0])
+                self.start_detected = True
+                self.start_index = base_index + offset
+                self.last_active_index = self.start_index
+                offset += 1
+            else:
+                # search for an inactive gap of at least hold_samples, starting at the last active sample
+                active_idxs = np.concatenate(([self.last_active_index - base_index], offset + np.flatnonzero(active[offset:])))
+                gaps = np.flatnonzero(np.diff(active_idxs) > self.hold_samples)
+
+                if gaps.shape[0] > 0:
+                    # end detected within the chunk, continue with the next start
+                    procedures.append((self.start_index, base_index + int(active_idxs[gaps[0]])))
+                    self.start_detected = False
+                    offset = int(active_idxs[gaps[0] + 1])
+                    continue
+
+                last_active = int(active_idxs[-1])
+                if n_samples - 1 - last_active >= self.hold_samples:
+                    # end detected at the end of the chunk
+                    procedures.append((self.start_index, base_index + last_active))
+                    self.start_detected = False
+                else:
+                    self.last_active_index = base_index + last_active
+                break
+
+        return procedures
 
-__all__ = ['DrillProcedureDetector']
 
 
 class DrillProcedureDetector():
@@ -10,31 +191,75 @@ class DrillProcedureDetector():
 
     A common use case in the drill domain is the processing of a whole drilling procedure.
     The `DrillProcedureDetector` monitors the live data stream and checks for each time step if the drill was active or not based on power consumption.
-    Once the drill is considered active, the data stream is written into an internal buffer.
+    Once the drill is considered active, the data stream is written into an internal buffer (a preallocated `CaptureBuffer`, so appending stays cheap for long procedures).
     After the drill is considered inactive again, the internal buffer is returned - signaling the end of a drilling procedure - and reset for further processing.
     Using default settings, the `DrillProcedureDetector` will include 48000 measurements (0.5 seconds) before and after the detected drilling procedure.
+
+    The detector supports two detection modes:
+    In 'chunk' mode (default), a whole chunk is considered active if its maximum power exceeds the active power and the end of a procedure
+    is detected after ttl_max inactive chunks. Thus the margins of the returned procedure depend on the chunk size of the data source.
+    In 'sample' mode, the power is evaluated per sample (optionally smoothed by a moving average and with a lower release power for hysteresis).
+    A procedure ranges from the first to the last active sample, ending once hold_samples consecutive samples are inactive,
+    and is returned with exactly window_size samples before and after it - independent of how the stream is chunked.
+
+    If a feature set is given, the features of each procedure are accumulated chunk by chunk while it is recorded (see `FeatureAccumulator`),
+    thus they are available via getFeatures() as soon as the procedure is returned.
     """
 
-    def __init__(self, ttl_max = 150, window_size = 48000, active_power = 20):
+    def __init__(self, ttl_max = 150, window_size = 48000, active_power = 20, mode = 'chunk',
+                 release_power = None, smoothing = 1, hold_samples = 72000, feature_set = None, frequency = 96000):
         """
         Construct a new drill procedure detector.
 
         Parameters
         ----------
         ttl_max : int
-            The TTL (time-to-live) counter reset value.
+            The TTL (time-to-live) counter reset value ('chunk' mode).
         window_size : int
             The number of measurements before and after a detected drill procedure.
         active_power : int
             The power level beyond which the drill is considered active / drilling (and inactive below).
+        mode : str
+            The detection mode, either 'chunk' or 'sample'.
+        release_power : float
+            The power level below which an active drill is considered inactive again, or None to use active_power ('sample' mode).
+        smoothing : int
+            The length of the moving average applied to the power, 1 to disable smoothing ('sample' mode).
+        hold_samples : int
+            The number of consecutive inactive samples ending a drill procedure ('sample' mode).
+        feature_set : str
+            The feature set to accumulate for each procedure ('basic' or 'extended'), or None to disable feature accumulation.
+        frequency : int
+            The sample rate used for the feature computation.
         """
 
-        self.buffer = np.zeros((0, 3))
+        if mode not in ('chunk', 'sample'):
+            raise ValueError(f'Unknown detection mode "{mode}"')
+
+        self.mode = mode
         self.start_detected = False
         self.ttl_max = ttl_max
         self.ttl = ttl_max
         self.window_size = window_size
         self.active_power = active_power
+        self.feature_set = feature_set
+        self.frequency = frequency
+        self.features = None
+
+        if mode == 'chunk':
+            self.buffer = CaptureBuffer(window_size)
+            self.accumulator = FeatureAccumulator(feature_set, frequency) if feature_set is not None else None
+        else:
+            self.buffer = StreamBuffer(2 * window_size + hold_samples)
+            self.activity = PowerActivity(active_power, release_power, smoothing)
+            self.tracker = ProcedureTracker(hold_samples)
+
+            # detected procedures (start_index, end_index) waiting for their post window
+            self.pending = deque()
+            # extracted procedures (data, features) not yet returned
+            self.completed = deque()
+            # feature accumulators of detected procedures: start_index -> (accumulator, index of the next sample to accumulate)
+            self.accumulators = {}
 
 
     def reset(self):
@@ -42,7 +267,30 @@ class DrillProcedureDetector():
         Reset internal buffer to start a new detection from scratch.
         """
 
-        self.buffer = np.zeros((0, 3))
+        self.buffer.reset()
+        self.features = None
+
+        if self.mode == 'sample':
+            self.activity.reset()
+            self.tracker.reset()
+            self.pending.clear()
+            self.completed.clear()
+            self.accumulators.clear()
+        elif self.accumulator is not None:
+            self.accumulator.reset()
+
+
+    def getFeatures(self) -> np.ndarray:
+        """
+        Retrieve the accumulated features of the drill procedure returned by the last call of update().
+
+        Returns
+        -------
+        features : np.ndarray | None
+            The (n_features,) feature values (see `feature_names()`), or None if feature accumulation is disabled.
+        """
+
+        return self.features
 
 
     def update(self, data: np.ndarray) -> np.ndarray:
@@ -53,15 +301,16 @@ class DrillProcedureDetector():
         ----------
         data : ndarray
             The next chunk of (stream) data.
-        
+
         Returns
         -------
         drill_data : np.ndarray | None
             The data for a complete detected drill procedure if the drill procedure just ended with the given data package, None otherwise.
+            In 'sample' mode, a chunk may complete several (short) procedures - they are returned one per call.
         """
-        
-        # store new data in history buffer
-        self.buffer = np.vstack([self.buffer, data])
+
+        if self.mode == 'sample':
+            return self.updateSamples(data)
 
         # initialize dummy result
         result = None
@@ -75,14 +324,29 @@ class DrillProcedureDetector():
 
         if not self.start_detected:
             if is_active:
-                # start detected
+                # start detected -> capture history and new data
                 self.start_detected = True
                 self.ttl = self.ttl_max
-            else:
-                # limit history
-                if len(self.buffer) > self.window_size:
-                    self.buffer = self.buffer[-self.window_size:]
+                self.buffer.startCapture()
+
+                if self.accumulator is not None:
+                    # start accumulation with captured history (none if the stream starts with an active drill)
+                    self.accumulator.reset()
+                    if len(self.buffer) > 0:
+                        self.accumulator.update(self.buffer.view())
+
+            # store new data in history ring (limited to window_size) or capture buffer
+            self.buffer.append(data)
+
+            if self.start_detected and self.accumulator is not None:
+                self.accumulator.update(data)
         else:
+            # store new data in capture buffer
+            self.buffer.append(data)
+
+            if self.accumulator is not None:
+                self.accumulator.update(data)
+
             if is_active:
                 # reset ttl as long as the drill is active
                 self.ttl = self.ttl_max
@@ -90,8 +354,75 @@ class DrillProcedureDetector():
                 self.ttl = self.ttl - 1
                 if self.ttl == 0:
                     # ttl expired -> end of drill procedure
-                    result = self.buffer
-                    self.buffer = np.zeros((0, 3))
+                    result = self.buffer.finishCapture()
                     self.start_detected = False
-        
+
+                    if self.accumulator is not None:
+                        self.features = self.accumulator.getFeatures()
+
         return result
+
+
+    def updateSamples(self, data: np.ndarray) -> np.ndarray:
+        """
+        Sample accurate variant of update().
+        """
+
+        base_index = self.buffer.getStopIndex()
+        self.buffer.append(data)
+
+        active = self.activity.update(np.abs(data[:, 1] * data[:, 2]))
+        self.pending.extend(self.tracker.update(active, base_index))
+
+        stop_index = self.buffer.getStopIndex()
+        if self.feature_set is not None:
+            self.accumulateSamples(stop_index)
+
+        # extract procedures with complete post window
+        while len(self.pending) > 0 and self.pending[0][1] + self.window_size < stop_index:
+            start_index, end_index = self.pending.popleft()
+            drill_data = self.buffer.slice(start_index - self.window_size, end_index + self.window_size + 1).copy()
+            features = self.accumulators.pop(start_index)[0].getFeatures() if self.feature_set is not None else None
+            self.completed.append((drill_data, features))
+
+        # discard samples no longer needed as pre window
+        keep_index = stop_index - self.window_size
+        if len(self.pending) > 0:
+            keep_index = min(keep_index, self.pending[0][0] - self.window_size)
+        if self.tracker.start_detected:
+            keep_index = min(keep_index, self.tracker.start_index - self.window_size)
+        self.buffer.discard(keep_index)
+
+        if len(self.completed) == 0:
+            return None
+
+        drill_data, self.features = self.completed.popleft()
+        return drill_data
+
+
+    def accumulateSamples(self, stop_index: int) -> None:
+        """
+        Accumulate the features of all detected procedures up to the samples known to belong to them.
+
+        Samples up to window_size behind the last active sample (or behind the end) of a procedure are part of it,
+        thus only the remaining post window is accumulated once the end is detected.
+        """
+
+        procedures = list(self.pending)
+        if self.tracker.start_detected:
+            procedures.append((self.tracker.start_index, None))
+
+        for start_index, end_index in procedures:
+            entry = self.accumulators.get(start_index)
+            if entry is None:
+                entry = (FeatureAccumulator(self.feature_set, self.frequency), max(start_index - self.window_size, self.buffer.getStartIndex()))
+
+            last_index = end_index if end_index is not None else self.tracker.last_active_index
+            accumulator, next_index = entry
+            bound = min(last_index + self.window_size + 1, stop_index)
+
+            if bound > next_index:
+                accumulator.update(self.buffer.slice(next_index, bound))
+                next_index = bound
+
+            self.accumulators[start_index] = (accumulator, next_index)
@@ -0,0 +1,293 @@
+# on-disk cache for per-recording features
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+import numpy as np
+
+from .features import FEATURE_SET_VERSIONS, extract_features
+from .io import read_measurement_array
+
+
+__all__ = ['FeatureStore', 'recording_features', 'extract_recording_features']
+
+
+# default feature store location within a measurement series directory
+FEATURE_STORE_DIR = '.features'
+
+
+def recording_features(file: str, feature_set: str = 'basic', frequency: int = 96000) -> np.ndarray:
+    """Method to read a measurement recording and extract its features.
+
+    Parameters
+    ----------
+    file : string
+        The path to the (.csv or binary) recording.
+
+    feature_set : str
+        The feature set, see `features.feature_names()`.
+
+    frequency : int
+        The sample rate to use if it is not stored with the recording.
+
+    Returns
+    ----------
+    features : numpy.ndarray
+        The (n_features,) feature values.
+    """
+
+    data, header = read_measurement_array(file, csv_dtype=np.float64)
+
+    return extract_features(data, header['frequency'] if header['frequency'] is not None else frequency, feature_set)
+
+
+def extract_recording_features(files: list[str], feature_set: str = 'basic', n_workers: int = None, batch_size: int = 16) -> np.ndarray:
+    """Method to extract the features of the given recordings in parallel.
+
+    Each worker process reads and reduces whole recordings, thus only feature vectors are transferred between processes.
+
+    Parameters
+    ----------
+    files : list[str]
+        The paths to the recordings.
+
+    feature_set : str
+        The feature set, see `features.feature_names()`.
+
+    n_workers : int
+        The number of worker processes, None for the number of CPUs, 1 to extract within the calling process.
+
+    batch_size : int
+        The number of recordings handed to a worker at once.
+
+    Returns
+    ----------
+    features : numpy.ndarray
+        The (n_files, n_features) feature values.
+    """
+
+    feature_sets = [feature_set] * len(files)
+
+    if n_workers == 1 or len(files) <= 1:
+        rows = list(map(recording_features, files, feature_sets))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            rows = list(executor.map(recording_features, files, feature_sets, chunksize=batch_size))
+
+    return np.stack(rows) if len(rows) > 0 else np.zeros((0, 0))
+
+
+
+class FeatureStore():
+    """
+    On-disk cache for the features of measurement recordings.
+
+    Entries are keyed by the absolute recording path and validated against the file size and modification time,
+    thus changed recordings are recomputed. Each feature set is stored in a separate file tagged with the version of the
+    feature set definition - a version change invalidates all entries of the feature set.
+    Feature computation therefore scales with the number of new (or changed) recordings instead of the total number.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Construct a new feature store.
+
+        Parameters
+        ----------
+        directory : str
+            The directory holding the store files (created on the first flush).
+        """
+
+        self.directory: str = directory
+
+        # loaded feature sets: name -> {'version': int, 'entries': {path: (size, mtime_ns, features)}}
+        self._tables: dict = {}
+        self._modified: set = set()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+
+    def getTableFile(self, feature_set: str) -> str:
+        """
+        Retrieve the store file of the given feature set.
+
+        Parameters
+        ----------
+        feature_set : str
+            The feature set name.
+
+        Returns
+        -------
+        file : str
+            The path of the store file.
+        """
+
+        return os.path.join(self.directory, f'{feature_set}.pkl')
+
+
+    def _getTable(self, feature_set: str, version: int) -> dict:
+        """
+        Retrieve the (lazily loaded) entries of the given feature set, discarding them on version mismatch.
+        """
+
+        table = self._tables.get(feature_set)
+
+        if table is None:
+            table_file = self.getTableFile(feature_set)
+            if os.path.exists(table_file):
+                try:
+                    with open(table_file, 'rb') as f:
+                        table = pickle.load(f)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    print(f'Discarding unreadable feature store file: {table_file}')
+                    table = None
+
+            self._tables[feature_set] = table
+
+        if table is None or table.get('version') != version:
+            table = {'version': version, 'entries': {}}
+            self._tables[feature_set] = table
+            self._modified.add(feature_set)
+
+        return table['entries']
+
+
+    def lookup(self, file: str, feature_set: str = 'basic', version: int = None) -> np.ndarray:
+        """
+        Look up the stored features of the given recording.
+
+        Parameters
+        ----------
+        file : str
+            The path to the recording.
+        feature_set : str
+            The feature set name.
+        version : int
+            The feature set version, None for the version registered in `features.FEATURE_SET_VERSIONS`.
+
+        Returns
+        -------
+        features : ndarray
+            The stored features, or None if the recording is unknown or changed since.
+        """
+
+        version = version if version is not None else FEATURE_SET_VERSIONS[feature_set]
+        entries = self._getTable(feature_set, version)
+
+        path = os.path.abspath(file)
+        entry = entries.get(path)
+        if entry is None:
+            return None
+
+        stat = os.stat(path)
+        if entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+            return None
+
+        return entry[2]
+
+
+    def store(self, file: str, features: np.ndarray, feature_set: str = 'basic', version: int = None) -> None:
+        """
+        Store the features of the given recording (persisted by flush()).
+
+        Parameters
+        ----------
+        file : str
+            The path to the recording.
+        features : ndarray
+            The features of the recording.
+        feature_set : str
+            The feature set name.
+        version : int
+            The feature set version, None for the version registered in `features.FEATURE_SET_VERSIONS`.
+
+        Returns
+        -------
+        None
+        """
+
+        version = version if version is not None else FEATURE_SET_VERSIONS[feature_set]
+        entries = self._getTable(feature_set, version)
+
+        path = os.path.abspath(file)
+        stat = os.stat(path)
+        entries[path] = (stat.st_size, stat.st_mtime_ns, np.asarray(features))
+        self._modified.add(feature_set)
+
+
+    def getFeatures(self, files: list[str], feature_set: str = 'basic', extract: Callable[[list[str]], np.ndarray] = None,
+                    version: int = None, n_workers: int = None) -> np.ndarray:
+        """
+        Retrieve the features of the given recordings, computing (and storing) only missing or outdated entries.
+
+        Parameters
+        ----------
+        files : list[str]
+            The paths to the recordings.
+        feature_set : str
+            The feature set name.
+        extract : Callable[[list[str]], ndarray]
+            The method computing the (n_files, n_features) features of a list of recordings, None for `extract_recording_features()`.
+        version : int
+            The feature set version, None for the version registered in `features.FEATURE_SET_VERSIONS`.
+        n_workers : int
+            The number of worker processes for the default extraction, None for the number of CPUs.
+
+        Returns
+        -------
+        features : ndarray
+            The (n_files, n_features) feature values.
+        """
+
+        rows = [self.lookup(file, feature_set, version) for file in files]
+        missing = [idx for idx, row in enumerate(rows) if row is None]
+
+        self.hits += len(files) - len(missing)
+        self.misses += len(missing)
+
+        if len(missing) > 0:
+            missing_files = [files[idx] for idx in missing]
+
+            if extract is None:
+                computed = extract_recording_features(missing_files, feature_set, n_workers)
+            else:
+                computed = extract(missing_files)
+
+            for idx, file, features in zip(missing, missing_files, computed):
+                rows[idx] = features
+                self.store(file, features, feature_set, version)
+
+            self.flush()
+
+        return np.stack(rows) if len(rows) > 0 else np.zeros((0, 0))
+
+
+    def flush(self) -> None:
+        """
+        Persist all modified feature sets.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if len(self._modified) == 0:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        for feature_set in self._modified:
+            table_file = self.getTableFile(feature_set)
+
+            # write atomically, thus concurrent readers never see partial files
+            with open(table_file + '.tmp', 'wb') as f:
+                pickle.dump(self._tables[feature_set], f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(table_file + '.tmp', table_file)
+
+        self._modified.clear()
@@ -0,0 +1,330 @@
+# vectorized feature extraction for drill procedures (audio, voltage and current channels)
+import numpy as np
+import pandas as pd
+
+
+__all__ = ['FEATURE_SETS', 'FEATURE_SET_VERSIONS', 'feature_names', 'compute_moments', 'merge_moments', 'features_from_moments', 'extract_features', 'extract_feature_frame',
+           'FeatureAccumulator']
+
+
+CHANNEL_NAMES = ['Audio', 'Voltage', 'Current']
+
+CHANNEL_STATISTICS = ['Rms', 'Peak', 'Energy', 'Std', 'Min', 'Max']
+
+POWER_STATISTICS = ['PowerAvg', 'PowerStd', 'PowerMin', 'PowerMax', 'Energy']
+
+# available feature sets: 'basic' matches the features of the pickled classifier, 'extended' adds signal and power statistics
+FEATURE_SETS = {
+    'basic': ['AudioAvg', 'VoltageAvg', 'CurrentAvg', 'time'],
+    'extended': ['AudioAvg', 'VoltageAvg', 'CurrentAvg', 'time']
+                + [f'{channel}{statistic}' for channel in CHANNEL_NAMES for statistic in CHANNEL_STATISTICS]
+                + POWER_STATISTICS,
+}
+
+# versions of the feature set definitions (increase on any change of the computation to invalidate cached features)
+FEATURE_SET_VERSIONS = {
+    'basic': 1,
+    'extended': 1,
+}
+
+
+def feature_names(feature_set: str = 'basic') -> list[str]:
+    """Method to retrieve the feature (column) names of a feature set.
+
+    Parameters
+    ----------
+    feature_set : str
+        The feature set, 'basic' or 'extended'.
+
+    Returns
+    ----------
+    names : list[str]
+        The feature names in column order.
+    """
+
+    if feature_set not in FEATURE_SETS:
+        raise ValueError(f'Unknown feature set "{feature_set}"')
+
+    return list(FEATURE_SETS[feature_set])
+
+
+def compute_moments(data: np.ndarray, feature_set: str = 'basic') -> dict:
+    """Method to compute the sufficient statistics of drill procedures, from which all features are derived.
+
+    The statistics are sample counts, channel sums, sums of squares, minima and maxima, as well as sums, sums of squares,
+    minima and maxima of the power (voltage * current). Only the statistics required by the feature set are computed.
+    Statistics of consecutive data sections can be merged, allowing incremental feature computation.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The (n_samples, n_channels) data of a drill procedure, or (n_procedures, n_samples, n_channels) data of equally long procedures.
+        The first three channels are interpreted as audio, voltage and current.
+
+    feature_set : str
+        The feature set, 'basic' or 'extended'.
+
+    Returns
+    ----------
+    moments : dict
+        The statistics ('n', 'sum', 'sumsq', 'min', 'max', 'power_sum', 'power_sumsq', 'power_min', 'power_max').
+    """
+
+    data = np.asarray(data)[..., :3]
+    n = data.shape[-2]
+
+    if feature_set == 'basic':
+        # column sums as matrix-vector product (a single pass, avoiding slow strided reductions)
+        return {'n': n, 'sum': np.ones(n) @ data}
+
+    # channel-major copy, thus all further reductions run on contiguous memory
+    channels = np.ascontiguousarray(np.swapaxes(data, -1, -2), dtype=np.float64)
+    power = channels[..., 1, :] * channels[..., 2, :]
+
+    moments = {
+        'n': n,
+        'sum': channels.sum(axis=-1),
+        'sumsq': np.einsum('...i,...i->...', channels, channels),
+        'min': channels.min(axis=-1),
+        'max': channels.max(axis=-1),
+        'power_sum': power.sum(axis=-1),
+        'power_sumsq': np.einsum('...i,...i->...', power, power),
+        'power_min': power.min(axis=-1),
+        'power_max': power.max(axis=-1),
+    }
+
+    return moments
+
+
+def merge_moments(moments: dict, other: dict) -> dict:
+    """Method to merge the statistics of two data sections (as computed by compute_moments()).
+
+    Parameters
+    ----------
+    moments : dict
+        The statistics of the first section, or None.
+
+    other : dict
+        The statistics of the second section.
+
+    Returns
+    ----------
+    moments : dict
+        The statistics of both sections.
+    """
+
+    if moments is None:
+        return dict(other)
+
+    merged = {}
+    for key, value in other.items():
+        if key.endswith('min'):
+            merged[key] = np.minimum(moments[key], value)
+        elif key.endswith('max'):
+            merged[key] = np.maximum(moments[key], value)
+        else:
+            merged[key] = moments[key] + value
+
+    return merged
+
+
+def features_from_moments(moments: dict, frequency: int = 96000, feature_set: str = 'basic') -> np.ndarray:
+    """Method to derive the features of a feature set from the statistics computed by compute_moments().
+
+    Parameters
+    ----------
+    moments : dict
+        The statistics of one or more drill procedures.
+
+    frequency : int
+        The sample rate.
+
+    feature_set : str
+        The feature set, 'basic' or 'extended'.
+
+    Returns
+    ----------
+    features : numpy.ndarray
+        The (n_features,) or (n_procedures, n_features) feature values, ordered as given by feature_names().
+    """
+
+    n = moments['n']
+    mean = moments['sum'] / n
+    duration = np.broadcast_to(np.float64(n / frequency), mean.shape[:-1])
+
+    columns = [mean[..., 0], mean[..., 1], mean[..., 2], duration]
+
+    if feature_set == 'extended':
+        mean_square = moments['sumsq'] / n
+        rms = np.sqrt(mean_square)
+        peak = np.maximum(np.abs(moments['min']), np.abs(moments['max']))
+        energy = moments['sumsq'] / frequency
+        std = np.sqrt(np.maximum(mean_square - mean * mean, 0))
+
+        for cidx in range(3):
+            columns += [rms[..., cidx], peak[..., cidx], energy[..., cidx], std[..., cidx], moments['min'][..., cidx], moments['max'][..., cidx]]
+
+        power_mean = moments['power_sum'] / n
+        power_std = np.sqrt(np.maximum(moments['power_sumsq'] / n - power_mean * power_mean, 0))
+        columns += [power_mean, power_std, moments['power_min'], moments['power_max'], moments['power_sum'] / frequency]
+
+    elif feature_set != 'basic':
+        raise ValueError(f'Unknown feature set "{feature_set}"')
+
+    return np.stack(columns, axis=-1)
+
+
+def extract_features(data, frequency: int = 96000, feature_set: str = 'basic') -> np.ndarray:
+    """Method to extract the features of one or more drill procedures.
+
+    Parameters
+    ----------
+    data : numpy.ndarray | list[numpy.ndarray]
+        A (n_samples, n_channels) drill procedure, a (n_procedures, n_samples, n_channels) array of equally long procedures
+        or a list of procedures of arbitrary length.
+
+    frequency : int
+        The sample rate.
+
+    feature_set : str
+        The feature set, 'basic' or 'extended'.
+
+    Returns
+    ----------
+    features : numpy.ndarray
+        The (n_features,) features of a single procedure, or the (n_procedures, n_features) features of multiple procedures.
+    """
+
+    if isinstance(data, (list, tuple)):
+        if len(data) == 0:
+            return np.zeros((0, len(feature_names(feature_set))))
+
+        return np.stack([features_from_moments(compute_moments(procedure, feature_set), frequency, feature_set) for procedure in data])
+
+    return features_from_moments(compute_moments(data, feature_set), frequency, feature_set)
+
+
+def extract_feature_frame(data, frequency: int = 96000, feature_set: str = 'basic') -> pd.DataFrame:
+    """Method to extract the features of one or more drill procedures as data frame (one row per procedure).
+
+    The column names match the feature names the classifiers are trained with (see feature_names()).
+
+    Parameters
+    ----------
+    data : numpy.ndarray | list[numpy.ndarray]
+        The drill procedure(s), see extract_features().
+
+    frequency : int
+        The sample rate.
+
+    feature_set : str
+        The feature set, 'basic' or 'extended'.
+
+    Returns
+    ----------
+    features : pandas.DataFrame
+        The feature data frame.
+    """
+
+    features = extract_features(data, frequency, feature_set)
+
+    return pd.DataFrame(np.atleast_2d(features), columns=feature_names(feature_set))
+
+
+
+class FeatureAccumulator():
+    """
+    Incremental feature extraction, updating the statistics of a drill procedure chunk by chunk while it is recorded.
+
+    Once the procedure is complete, its features are derived from the accumulated statistics in constant time.
+    The features equal those of extract_features() on the complete procedure (up to floating point summation order).
+    """
+
+    def __init__(self, feature_set: str = 'basic', frequency: int = 96000):
+        """
+        Construct a new feature accumulator.
+
+        Parameters
+        ----------
+        feature_set : str
+            The feature set, 'basic' or 'extended'.
+        frequency : int
+            The sample rate.
+        """
+
+        feature_names(feature_set)
+
+        self.feature_set: str = feature_set
+        self.frequency: int = frequency
+        self.moments: dict = None
+
+
+    def reset(self) -> None:
+        """
+        Discard the accumulated statistics to start a new procedure.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.moments = None
+
+
+    def getSampleCount(self) -> int:
+        """
+        Retrieve the number of accumulated samples.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        n_samples : int
+            The number of samples accumulated since the last reset.
+        """
+
+        return 0 if self.moments is None else self.moments['n']
+
+
+    def update(self, data: np.ndarray) -> None:
+        """
+        Accumulate the statistics of the next chunk of the procedure.
+
+        Parameters
+        ----------
+        data : ndarray
+            The (n_samples, n_channels) chunk.
+
+        Returns
+        -------
+        None
+        """
+
+        if data.shape[0] > 0:
+            self.moments = merge_moments(self.moments, compute_moments(data, self.feature_set))
+
+
+    def getFeatures(self) -> np.ndarray:
+        """
+        Retrieve the features of the accumulated samples.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        features : ndarray
+            The (n_features,) feature values, ordered as given by feature_names(), or None if no samples were accumulated.
+        """
+
+        if self.moments is None:
+            return None
+
+        return features_from_moments(self.moments, self.frequency, self.feature_set)
@@ -1,14 +1,53 @@
-# .csv data io functions
+# .csv / binary data io functions
 import pandas as pd
+import numpy as np
+import datetime
+import json
 import os
 
 
-__all__ = ['read_measurement_csv']
+__all__ = ['read_measurement_csv', 'read_measurement_binary', 'read_measurement', 'read_measurement_array',
+           'read_measurement_header', 'write_measurement_binary', 'open_measurement',
+           'BinaryMeasurementWriter', 'MeasurementRecording', 'RECORDING_EXTENSION']
+
+
+# file extension of binary measurement recordings
+RECORDING_EXTENSION = '.drec'
+
+# binary recording layout: magic, uint32 header length, json header (padded), raw little-endian float32 samples
+RECORDING_MAGIC = b'MLDOGREC'
+RECORDING_DTYPE = np.dtype('<f4')
+RECORDING_ALIGNMENT = 64
+
+
+def _parse_file_name(file: str) -> tuple:
+    """Method to extract start time and frequency from a measurement file name ('<start time>_<frequency>Hz.<ext>').
+
+    Returns (start_time, frequency), with None for information not present in the file name.
+    """
+
+    name_split = os.path.splitext(os.path.basename(file))[0].split('_')
+
+    # extract frequency information
+    frequency = None
+    if name_split[-1].endswith('Hz') and name_split[-1][:-2].isdigit():
+        frequency = int(name_split[-1][:-2])
+
+    # Determine start time of measurement (capture application uses underscores, older recordings dashes for the time)
+    start_time = None
+    for time_format in ['%Y_%m_%d_%H_%M_%S', '%Y_%m_%d_%H-%M-%S']:
+        try:
+            start_time = pd.to_datetime('_'.join(name_split[:-1]), format = time_format)
+            break
+        except ValueError:
+            pass
+
+    return start_time, frequency
 
 
 def read_measurement_csv(csv_file: str, set_time_index: bool = False):
     """Method to read sensor time series data from a .csv file.
-    
+
     Parameters
     ----------
     csv_file : string
@@ -16,23 +55,15 @@ def read_measurement_csv(csv_file: str, set_time_index: bool = False):
 
     set_time_index : bool
         If True, set the (generated) time information as index for the measurement data.
-    
+
     Returns
     ----------
     df : pandas.DataFrame
         A pandas DataFrame with the sensor data.
     """
 
-    # split file name by underscore '_'
-    name_split = os.path.basename(csv_file)[:-4].split('_') 
-
-    # extract frequency information
-    frequency = int(name_split[-1][:-2])
-    # print(frequency)
-
-    # Determine start time of measurement
-    start_time = pd.to_datetime('_'.join(name_split[:-1]), format = '%Y_%m_%d_%H-%M-%S')
-    # print(start_time)
+    # extract frequency information and start time of measurement
+    start_time, frequency = _parse_file_name(csv_file)
 
     # read raw csv data
     df = pd.read_csv(csv_file)
@@ -48,3 +79,389 @@ def read_measurement_csv(csv_file: str, set_time_index: bool = False):
     return df
 
 
+def read_measurement_header(file: str) -> dict:
+    """Method to read the header of a binary measurement recording.
+
+    Parameters
+    ----------
+    file : string
+        The path to the binary recording.
+
+    Returns
+    ----------
+    header : dict
+        The header information: frequency, channels, start_time (pandas.Timestamp or None), dtype, data_offset and n_samples.
+    """
+
+    with open(file, 'rb') as f:
+        magic = f.read(len(RECORDING_MAGIC))
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f'"{file}" is not a binary measurement recording')
+
+        header_len = int.from_bytes(f.read(4), 'little')
+        header = json.loads(f.read(header_len).decode('utf-8'))
+
+    header['dtype'] = np.dtype(header['dtype'])
+    header['start_time'] = None if header.get('start_time') is None else pd.Timestamp(header['start_time'])
+    header['data_offset'] = len(RECORDING_MAGIC) + 4 + header_len
+
+    # the number of samples is derived from the file size, so partially written recordings remain readable
+    sample_size = len(header['channels']) * header['dtype'].itemsize
+    header['n_samples'] = (os.path.getsize(file) - header['data_offset']) // sample_size
+
+    return header
+
+
+def read_measurement_array(file: str, mmap: bool = False, csv_dtype = np.float64) -> tuple:
+    """Method to read the raw sample array of a (.csv or binary) measurement recording.
+
+    Parameters
+    ----------
+    file : string
+        The path to the recording.
+
+    mmap : bool
+        If True, memory-map binary recordings instead of reading them into memory.
+
+    csv_dtype : dtype
+        The value type for parsing .csv recordings (binary recordings keep their stored type).
+        Defaults to float64 like read_measurement_csv, thus features match between both paths.
+
+    Returns
+    ----------
+    (data, header) : tuple(numpy.ndarray, dict)
+        The (n_samples, n_channels) sample array and the header information (see read_measurement_header).
+    """
+
+    if file.endswith(RECORDING_EXTENSION):
+        header = read_measurement_header(file)
+        shape = (header['n_samples'], len(header['channels']))
+
+        if mmap:
+            data = np.memmap(file, dtype=header['dtype'], mode='r', offset=header['data_offset'], shape=shape)
+        else:
+            with open(file, 'rb') as f:
+                f.seek(header['data_offset'])
+                data = np.fromfile(f, dtype=header['dtype'], count=shape[0] * shape[1]).reshape(shape)
+
+        return data, header
+
+    # csv recording
+    start_time, frequency = _parse_file_name(file)
+    df = pd.read_csv(file, dtype=csv_dtype)
+    data = df.to_numpy()
+
+    header = {
+        'frequency': frequency,
+        # np.savetxt prefixes the header with '# '
+        'channels': [c.removeprefix('# ').strip() for c in df.columns],
+        'start_time': start_time,
+        'dtype': data.dtype,
+        'data_offset': None,
+        'n_samples': data.shape[0],
+    }
+
+    return data, header
+
+
+def read_measurement_binary(file: str, set_time_index: bool = False):
+    """Method to read sensor time series data from a binary measurement recording.
+
+    Parameters
+    ----------
+    file : string
+        The path to the binary recording to read.
+
+    set_time_index : bool
+        If True, set the (generated) time information as index for the measurement data.
+
+    Returns
+    ----------
+    df : pandas.DataFrame
+        A pandas DataFrame with the sensor data (one column per channel).
+    """
+
+    data, header = read_measurement_array(file)
+    df = pd.DataFrame(data, columns=header['channels'])
+
+    # construct date time information based on start time and sample rate
+    time_idx = pd.date_range(start = header['start_time'], periods = len(df), freq = pd.Timedelta(seconds = 1.0 / header['frequency']))
+    if set_time_index:
+        # override sequential index with timestamp based index
+        df.set_index(time_idx, inplace=True)
+    else:
+        df['Time'] = time_idx
+
+    return df
+
+
+def read_measurement(file: str, set_time_index: bool = False):
+    """Method to read sensor time series data from a .csv file or binary recording, depending on the file extension.
+
+    Parameters
+    ----------
+    file : string
+        The path to the recording to read.
+
+    set_time_index : bool
+        If True, set the (generated) time information as index for the measurement data.
+
+    Returns
+    ----------
+    df : pandas.DataFrame
+        A pandas DataFrame with the sensor data.
+    """
+
+    if file.endswith(RECORDING_EXTENSION):
+        return read_measurement_binary(file, set_time_index)
+
+    return read_measurement_csv(file, set_time_index)
+
+
+class BinaryMeasurementWriter:
+    """Writer for binary measurement recordings, appending sample data chunk by chunk.
+
+    The recording consists of a small json header (frequency, channel names, start time, sample type)
+    followed by the raw little-endian float32 samples, aligned to 64 bytes.
+    """
+
+    def __init__(self, file: str, frequency: int, channels: list[str], start_time: datetime.datetime = None):
+        """Create a new binary recording.
+
+        Parameters
+        ----------
+        file : string
+            The path of the recording to create.
+
+        frequency : int
+            The sample rate.
+
+        channels : list[str]
+            The channel names.
+
+        start_time : datetime
+            The start time of the measurement.
+        """
+
+        self.n_channels = len(channels)
+
+        header = json.dumps({
+            'version': 1,
+            'frequency': frequency,
+            'channels': list(channels),
+            'start_time': None if start_time is None else start_time.isoformat(),
+            'dtype': RECORDING_DTYPE.str,
+        }).encode('utf-8')
+
+        # pad header with spaces to align the sample data
+        prefix_len = len(RECORDING_MAGIC) + 4
+        header += b' ' * (-(prefix_len + len(header)) % RECORDING_ALIGNMENT)
+
+        self._file = open(file, 'wb')
+        self._file.write(RECORDING_MAGIC)
+        self._file.write(len(header).to_bytes(4, 'little'))
+        self._file.write(header)
+
+
+    def write(self, data: np.ndarray) -> None:
+        """Append a chunk of (n_samples, n_channels) sample data."""
+
+        if data.ndim != 2 or data.shape[1] != self.n_channels:
+            raise ValueError(f'Expected sample data with {self.n_channels} channels, got shape {data.shape}')
+
+        self._file.write(np.ascontiguousarray(data, dtype=RECORDING_DTYPE).data)
+
+
+    def close(self) -> None:
+        """Close the recording."""
+
+        self._file.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def write_measurement_binary(file: str, data: np.ndarray, frequency: int, channels: list[str], start_time: datetime.datetime = None):
+    """Method to write sensor time series data to a binary measurement recording.
+
+    Parameters
+    ----------
+    file : string
+        The path of the recording to write.
+
+    data : numpy.ndarray
+        The (n_samples, n_channels) sample data.
+
+    frequency : int
+        The sample rate.
+
+    channels : list[str]
+        The channel names.
+
+    start_time : datetime
+        The start time of the measurement.
+
+    Returns
+    ----------
+    None
+    """
+
+    with BinaryMeasurementWriter(file, frequency, channels, start_time) as writer:
+        writer.write(data)
+
+
+class MeasurementRecording:
+    """Lazily indexed view of a measurement recording.
+
+    Binary recordings are memory-mapped, so only the accessed sample ranges are actually read from disk
+    (.csv recordings have to be parsed and are thus loaded into memory).
+    Time information is computed on demand from start time and frequency instead of being materialized per sample.
+    Slicing by sample range or time window returns new MeasurementRecording instances sharing the underlying data.
+    """
+
+    def __init__(self, data: np.ndarray, frequency: int, channels: list[str], start_time: pd.Timestamp = None, file: str = None):
+        """Create a recording view on the given sample data.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The (n_samples, n_channels) sample data (possibly a numpy.memmap).
+
+        frequency : int
+            The sample rate.
+
+        channels : list[str]
+            The channel names.
+
+        start_time : pandas.Timestamp
+            The time of the first sample, or None if unknown.
+
+        file : string
+            The path of the underlying recording file.
+        """
+
+        self.data = data
+        self.frequency = frequency
+        self.channels = channels
+        self.start_time = start_time
+        self.file = file
+
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+
+    def __getitem__(self, key):
+        """Access the sample data using numpy indexing (slices return views)."""
+
+        return self.data[key]
+
+
+    def __repr__(self):
+        return f'MeasurementRecording: {len(self)} samples x {self.channels} @ {self.frequency}Hz (start: {self.start_time})'
+
+
+    @property
+    def duration(self) -> float:
+        """The duration of the recording in seconds."""
+
+        return len(self) / self.frequency
+
+
+    def time_at(self, idx):
+        """Method to compute the time of the given sample index (or index array).
+
+        Returns timestamps if the start time is known, otherwise time offsets in seconds.
+        """
+
+        offset = np.asarray(idx) / self.frequency
+
+        if self.start_time is None:
+            return offset
+
+        if np.ndim(offset) == 0:
+            return self.start_time + pd.Timedelta(seconds=float(offset))
+
+        return self.start_time + pd.to_timedelta(offset, unit='s')
+
+
+    def index_at(self, time) -> int:
+        """Method to compute the sample index for the given time.
+
+        The time can either be an offset in seconds relative to the start of the recording, or an absolute timestamp.
+        """
+
+        if isinstance(time, (int, float, np.integer, np.floating)):
+            offset = float(time)
+        else:
+            offset = (pd.Timestamp(time) - self.start_time).total_seconds()
+
+        return min(max(int(np.ceil(offset * self.frequency - 1e-9)), 0), len(self))
+
+
+    def slice_samples(self, start: int = None, stop: int = None) -> 'MeasurementRecording':
+        """Method to retrieve the sample range [start, stop) as recording view."""
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        start_time = None if self.start_time is None else self.time_at(start)
+
+        return MeasurementRecording(self.data[start:stop], self.frequency, self.channels, start_time, self.file)
+
+
+    def slice_time(self, start = None, stop = None) -> 'MeasurementRecording':
+        """Method to retrieve the time window [start, stop) as recording view.
+
+        Bounds can be given as offsets in seconds or as absolute timestamps.
+        """
+
+        start_idx = None if start is None else self.index_at(start)
+        stop_idx = None if stop is None else self.index_at(stop)
+
+        return self.slice_samples(start_idx, stop_idx)
+
+
+    def to_array(self) -> np.ndarray:
+        """Method to load the sample data of this view into memory."""
+
+        return np.array(self.data)
+
+
+    def to_dataframe(self, set_time_index: bool = False) -> pd.DataFrame:
+        """Method to load the sample data of this view into a pandas DataFrame.
+
+        Time information is only generated for the samples of this view.
+        """
+
+        df = pd.DataFrame(self.to_array(), columns=self.channels)
+        time_idx = self.time_at(np.arange(len(self)))
+
+        if set_time_index:
+            df.set_index(pd.Index(time_idx), inplace=True)
+        else:
+            df['Time'] = time_idx
+
+        return df
+
+
+def open_measurement(file: str) -> MeasurementRecording:
+    """Method to open a measurement recording as lazily indexed view.
+
+    Parameters
+    ----------
+    file : string
+        The path to the recording (binary recordings are memory-mapped, .csv recordings loaded into memory).
+
+    Returns
+    ----------
+    recording : MeasurementRecording
+        The recording view.
+    """
+
+    data, header = read_measurement_array(file, mmap=True)
+
+    return MeasurementRecording(data, header['frequency'], header['channels'], header['start_time'], file)
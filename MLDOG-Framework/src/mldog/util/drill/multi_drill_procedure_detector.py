@@ -0,0 +1,224 @@
+import re
+
+import numpy as np
+
+from .capture_buffer import StreamBuffer
+from .drill_procedure_detector import PowerActivity, ProcedureTracker
+
+
+__all__ = ['MultiDrillProcedureDetector', 'channel_groups']
+
+
+# channel names of a drill: '<Audio|Voltage|Current>[ _-]<group id>', e.g. 'Voltage 2' (leading '#' of csv headers is ignored)
+CHANNEL_NAME_PATTERN = re.compile(r'^#?\s*(audio|voltage|current)(?:\s*[ _-]\s*|\s*)(\w*)\s*$', re.IGNORECASE)
+
+CHANNEL_ROLES = ('audio', 'voltage', 'current')
+
+
+def channel_groups(channel_names: list[str]) -> dict:
+    """Method to derive the channel group mapping of a multi-drill stream from its channel names.
+
+    Channels are grouped by the suffix of their name, e.g. 'Audio 1', 'Voltage 1', 'Current 1' form group 1.
+    Numeric suffixes are converted to int, the plain names 'Audio', 'Voltage', 'Current' form group 0.
+    Groups lacking a voltage or current channel are skipped, a missing audio channel is replaced by the voltage channel.
+
+    Parameters
+    ----------
+    channel_names : list[str]
+        The channel names in stream column order.
+
+    Returns
+    ----------
+    groups : dict
+        The mapping group id -> (audio index, voltage index, current index).
+    """
+
+    roles = {}
+    for idx, name in enumerate(channel_names):
+        match = CHANNEL_NAME_PATTERN.match(name)
+        if match is None:
+            continue
+
+        role, suffix = match.group(1).lower(), match.group(2)
+        group_id = int(suffix) if suffix.isdigit() else (suffix if suffix else 0)
+        roles.setdefault(group_id, {}).setdefault(role, idx)
+
+    groups = {}
+    for group_id, group_roles in roles.items():
+        if 'voltage' not in group_roles or 'current' not in group_roles:
+            continue
+
+        groups[group_id] = (group_roles.get('audio', group_roles['voltage']), group_roles['voltage'], group_roles['current'])
+
+    return groups
+
+
+
+class MultiDrillProcedureDetector():
+    """
+    Utility component for detecting and extracting drilling procedures of several drills sharing one data stream.
+
+    Each drill is described by a channel group, mapping a group id to the stream columns of its (audio, voltage, current) channels.
+    The power of all groups is computed and evaluated in one vectorized pass per chunk, and all groups share a single stream buffer
+    (holding the samples still needed by any group). Detected procedures are returned as (group_id, drill_data) tuples,
+    the drill data consisting of the audio, voltage and current columns of the group - i.e. the layout of a single-drill stream.
+
+    The detection modes and parameters correspond to the `DrillProcedureDetector`:
+    In 'chunk' mode, a chunk is active for a group if its maximum power exceeds the active power and a procedure ends after ttl_max inactive chunks.
+    In 'sample' mode, procedures are tracked per sample and returned with exactly window_size samples before and after them.
+    """
+
+    def __init__(self, groups: dict, ttl_max = 150, window_size = 48000, active_power = 20, mode = 'chunk',
+                 release_power = None, smoothing = 1, hold_samples = 72000):
+        """
+        Construct a new multi drill procedure detector.
+
+        Parameters
+        ----------
+        groups : dict
+            The mapping group id -> (audio index, voltage index, current index) of the stream columns.
+        ttl_max, window_size, active_power, mode, release_power, smoothing, hold_samples
+            The detection parameters, see `DrillProcedureDetector`.
+        """
+
+        if mode not in ('chunk', 'sample'):
+            raise ValueError(f'Unknown detection mode "{mode}"')
+
+        if len(groups) == 0:
+            raise ValueError('No channel groups specified')
+
+        self.mode = mode
+        self.group_ids = list(groups.keys())
+        self.columns = np.array([groups[group_id] for group_id in self.group_ids], dtype=np.intp)
+        self.ttl_max = ttl_max
+        self.window_size = window_size
+        self.active_power = active_power
+
+        self.buffer = StreamBuffer(2 * window_size + (hold_samples if mode == 'sample' else 0))
+
+        if mode == 'sample':
+            self.activity = PowerActivity(active_power, release_power, smoothing)
+            self.trackers = [ProcedureTracker(hold_samples) for _ in self.group_ids]
+            # detected procedures (group index, start_index, end_index) waiting for their post window
+            self.pending = []
+
+        self.reset()
+
+
+    def reset(self):
+        """
+        Reset internal state to start a new detection from scratch.
+        """
+
+        self.buffer.reset()
+
+        n_groups = len(self.group_ids)
+        self.start_detected = np.zeros(n_groups, dtype=bool)
+        self.start_index = np.zeros(n_groups, dtype=np.int64)
+        self.ttl = np.full(n_groups, self.ttl_max)
+        # end of the previous procedure per group (history of 'chunk' mode starts behind it)
+        self.floor_index = np.zeros(n_groups, dtype=np.int64)
+
+        if self.mode == 'sample':
+            self.activity.reset()
+            for tracker in self.trackers:
+                tracker.reset()
+            self.pending = []
+
+
+    def update(self, data: np.ndarray) -> list[tuple]:
+        """
+        Update the internal buffer with new stream data and check if drilling procedures have been completed.
+
+        Parameters
+        ----------
+        data : ndarray
+            The next chunk of (stream) data.
+
+        Returns
+        -------
+        procedures : list[tuple]
+            The (group_id, drill_data) of all drill procedures completed with the given data package (possibly empty).
+        """
+
+        base_index = self.buffer.getStopIndex()
+        self.buffer.append(data)
+
+        # power of all groups at once
+        power = np.abs(data[:, self.columns[:, 1]] * data[:, self.columns[:, 2]])
+
+        if self.mode == 'sample':
+            procedures = self.updateSamples(power, base_index)
+        else:
+            procedures = self.updateChunk(power, base_index)
+
+        # discard samples no longer needed by any group
+        keep_index = self.buffer.getStopIndex() - self.window_size
+        if np.any(self.start_detected):
+            keep_index = min(keep_index, int(np.min(self.start_index[self.start_detected])))
+        if self.mode == 'sample' and len(self.pending) > 0:
+            keep_index = min(keep_index, min(start_index for _, start_index, _ in self.pending) - self.window_size)
+        self.buffer.discard(keep_index)
+
+        return procedures
+
+
+    def updateChunk(self, power: np.ndarray, base_index: int) -> list[tuple]:
+        """
+        Chunk based detection for all groups.
+        """
+
+        stop_index = self.buffer.getStopIndex()
+        is_active = np.max(power, axis=0) > self.active_power if power.shape[0] > 0 else np.zeros(len(self.group_ids), dtype=bool)
+
+        # start detected -> capture history (limited to window_size) and new data
+        starting = ~self.start_detected & is_active
+        self.start_index[starting] = np.maximum(base_index - self.window_size, self.floor_index[starting])
+
+        # reset ttl as long as the drill is active, count down otherwise
+        self.ttl[is_active] = self.ttl_max
+        expiring = self.start_detected & ~is_active
+        self.ttl[expiring] -= 1
+
+        # ttl expired -> end of drill procedure
+        ending = expiring & (self.ttl == 0)
+
+        procedures = []
+        for group_idx in np.flatnonzero(ending):
+            drill_data = self.buffer.slice(int(self.start_index[group_idx]), stop_index)[:, self.columns[group_idx]]
+            procedures.append((self.group_ids[group_idx], drill_data))
+
+        self.floor_index[ending] = stop_index
+        self.start_detected = (self.start_detected | starting) & ~ending
+
+        return procedures
+
+
+    def updateSamples(self, power: np.ndarray, base_index: int) -> list[tuple]:
+        """
+        Sample accurate detection for all groups.
+        """
+
+        active = self.activity.update(power)
+
+        for group_idx, tracker in enumerate(self.trackers):
+            for start_index, end_index in tracker.update(active[:, group_idx], base_index):
+                self.pending.append((group_idx, start_index, end_index))
+
+            self.start_detected[group_idx] = tracker.start_detected
+            if tracker.start_detected:
+                self.start_index[group_idx] = tracker.start_index - self.window_size
+
+        # extract procedures with complete post window
+        stop_index = self.buffer.getStopIndex()
+        procedures = []
+        pending = []
+        for group_idx, start_index, end_index in self.pending:
+            if end_index + self.window_size < stop_index:
+                drill_data = self.buffer.slice(start_index - self.window_size, end_index + self.window_size + 1)[:, self.columns[group_idx]]
+                procedures.append((self.group_ids[group_idx], drill_data))
+            else:
+                pending.append((group_idx, start_index, end_index))
+        self.pending = pending
+
+        return procedures
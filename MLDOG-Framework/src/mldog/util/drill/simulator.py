@@ -0,0 +1,342 @@
+# capturama simulator, replaying drill recordings via the capturama UDP packet protocol
+import argparse
+import os
+import random
+import socket
+import time
+from struct import pack, pack_into
+
+import numpy as np
+
+from .io import read_measurement_array, RECORDING_EXTENSION
+
+
+__all__ = ['CapturamaSimulator', 'load_recordings', 'generate_drill_signal', 'main']
+
+
+# packet types of the capturama protocol
+PACKET_META = 0
+PACKET_SENSOR_DATA = 1
+PACKET_END = 2
+
+# maximum size of a capturama packet (8 byte header + float32 payload)
+MAX_PACKET_SIZE = 4244
+
+DEFAULT_CHANNELS = ['Audio', 'Voltage', 'Current']
+
+
+def load_recordings(path: str, frequency: int = 96000) -> tuple[np.ndarray, list[str], int]:
+    """Method to load one or more measurement recordings for replay.
+
+    Parameters
+    ----------
+    path : string
+        A recording file or a directory with recording files ('*Hz.csv' or binary recordings), which are concatenated in name order.
+
+    frequency : int
+        The sample rate to use if it is not stored with the recording.
+
+    Returns
+    ----------
+    (data, channels, frequency) : tuple(numpy.ndarray, list[str], int)
+        The float32 sample array, the channel names and the sample rate.
+    """
+
+    if os.path.isdir(path):
+        files = sorted(os.path.join(path, f) for f in os.listdir(path) if f.endswith('Hz.csv') or f.endswith(RECORDING_EXTENSION))
+    else:
+        files = [path]
+
+    if len(files) == 0:
+        raise FileNotFoundError(f'No recordings found in "{path}"')
+
+    arrays = []
+    channels = None
+    for file in files:
+        data, header = read_measurement_array(file, csv_dtype=np.float32)
+        arrays.append(data.astype(np.float32, copy=False))
+
+        if channels is None:
+            channels = header['channels']
+            if header['frequency'] is not None:
+                frequency = header['frequency']
+
+    return np.concatenate(arrays), channels, frequency
+
+
+def generate_drill_signal(duration: float, frequency: int = 96000, n_drills: int = 3, seed: int = None) -> np.ndarray:
+    """Method to generate a synthetic drill signal with audio, voltage and current channels.
+
+    The signal consists of idle noise, interrupted by n_drills equally spaced drill procedures of increased power consumption.
+
+    Parameters
+    ----------
+    duration : float
+        The signal duration in seconds.
+
+    frequency : int
+        The sample rate.
+
+    n_drills : int
+        The number of drill procedures.
+
+    seed : int
+        The random seed.
+
+    Returns
+    ----------
+    data : numpy.ndarray
+        The (n_samples, 3) float32 sample array.
+    """
+
+    rng = np.random.default_rng(seed)
+    n_samples = int(duration * frequency)
+
+    # activity envelope with drill procedures of a third of their time slot
+    active = np.zeros(n_samples, dtype=np.float32)
+    slot = n_samples // max(n_drills, 1)
+    for idx in range(n_drills):
+        active[idx * slot + slot // 3:idx * slot + 2 * slot // 3] = 1
+
+    audio = rng.normal(0, 0.01, n_samples) + active * 0.3 * np.sin(2 * np.pi * 800 * np.arange(n_samples) / frequency)
+    voltage = rng.normal(0, 0.05, n_samples) + active * 20
+    current = rng.normal(0, 0.01, n_samples) + active * 5
+
+    return np.stack([audio, voltage, current], axis=1).astype(np.float32)
+
+
+
+class CapturamaSimulator:
+    """
+    Local stand-in for the capturama, streaming sample data via UDP using the capturama packet protocol.
+
+    The simulator waits for a 'startmsg' of a UDP data source (or uses a fixed target address) and sends a meta packet (type 0),
+    the sample data as sensor data packets (type 1) and finally a measurement end packet (type 2).
+    The replay speed can be real-time (speed=1), a multiple of real-time (speed=N) or unthrottled (speed=0).
+    Packet loss and reordering can be injected with the given probabilities.
+    """
+
+    def __init__(self, data: np.ndarray, frequency: int = 96000, channels: list[str] = None, port: int = 4242,
+                 speed: float = 1.0, loss: float = 0.0, reorder: float = 0.0, loop: bool = False, seed: int = None):
+        """
+        Construct a new capturama simulator.
+
+        Parameters
+        ----------
+        data : ndarray
+            The (n_samples, n_channels) sample data to replay.
+        frequency : int
+            The sample rate.
+        channels : list[str]
+            The channel names.
+        port : int
+            The port to listen for start messages.
+        speed : float
+            The replay speed as multiple of real-time, or 0 for maximum speed.
+        loss : float
+            The probability of dropping a sensor data packet.
+        reorder : float
+            The probability of swapping a sensor data packet with its successor.
+        loop : bool
+            True, to replay the data endlessly, False to send a measurement end packet after a single pass.
+        seed : int
+            The random seed for loss and reordering.
+        """
+
+        self.data: np.ndarray = np.ascontiguousarray(data, dtype='<f4')
+        self.frequency: int = frequency
+        self.channels: list[str] = channels if channels is not None else DEFAULT_CHANNELS[:data.shape[1]]
+        self.port: int = port
+        self.speed: float = speed
+        self.loss: float = loss
+        self.reorder: float = reorder
+        self.loop: bool = loop
+
+        self.samples_per_packet: int = (MAX_PACKET_SIZE - 8) // (4 * self.data.shape[1])
+
+        self._random = random.Random(seed)
+        self._socket: socket.socket = None
+        self._stop = False
+
+        # replay statistics
+        self.n_sent = 0
+        self.n_dropped = 0
+        self.n_reordered = 0
+
+
+    def waitForStart(self) -> tuple:
+        """
+        Wait for the start message of a data source.
+
+        Returns
+        -------
+        address : tuple
+            The address of the data source.
+        """
+
+        while not self._stop:
+            try:
+                msg, address = self._socket.recvfrom(1024)
+            except socket.timeout:
+                continue
+
+            if msg.decode('utf-8', errors='ignore').strip() == 'startmsg':
+                return address
+
+        return None
+
+
+    def run(self, target: tuple = None) -> None:
+        """
+        Run the simulator.
+
+        Parameters
+        ----------
+        target : tuple
+            A fixed (host, port) target address, or None to wait for the start message of a data source.
+
+        Returns
+        -------
+        None
+        """
+
+        self._stop = False
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.settimeout(1)
+
+        try:
+            if target is None:
+                self._socket.bind(('', self.port))
+                print(f'Waiting for start message on port {self.port}...')
+                target = self.waitForStart()
+
+            if target is not None:
+                print(f'Streaming {self.data.shape[0]} samples @ {self.frequency}Hz to {target[0]}:{target[1]}')
+                self.stream(target)
+        finally:
+            self._socket.close()
+            self._socket = None
+
+
+    def stop(self) -> None:
+        """
+        Stop a running simulator.
+        """
+
+        self._stop = True
+
+
+    def stream(self, target: tuple) -> None:
+        """
+        Stream the sample data to the given target address.
+
+        Parameters
+        ----------
+        target : tuple
+            The (host, port) target address.
+
+        Returns
+        -------
+        None
+        """
+
+        # meta packet: frequency followed by comma separated channel names
+        self._socket.sendto(pack('<LLL', 0, PACKET_META, self.frequency) + ','.join(self.channels).encode('ascii'), target)
+
+        packet = bytearray(8 + self.samples_per_packet * self.data.shape[1] * 4)
+        held_back = None
+        seq_no = 0
+        n_streamed = 0
+        start_time = time.perf_counter()
+
+        while not self._stop:
+            for offset in range(0, self.data.shape[0], self.samples_per_packet):
+                if self._stop:
+                    break
+
+                samples = self.data[offset:offset + self.samples_per_packet]
+                seq_no += 1
+                n_streamed += samples.shape[0]
+
+                # build sensor data packet
+                n_bytes = 8 + samples.nbytes
+                pack_into('<LL', packet, 0, seq_no, PACKET_SENSOR_DATA)
+                packet[8:n_bytes] = samples.tobytes()
+                msg = bytes(packet[:n_bytes])
+
+                # inject packet loss and reordering
+                if self._random.random() < self.loss:
+                    self.n_dropped += 1
+                elif held_back is None and self._random.random() < self.reorder:
+                    held_back = msg
+                    self.n_reordered += 1
+                else:
+                    self._socket.sendto(msg, target)
+                    self.n_sent += 1
+
+                    if held_back is not None:
+                        self._socket.sendto(held_back, target)
+                        self.n_sent += 1
+                        held_back = None
+
+                # pace according to replay speed
+                if self.speed > 0:
+                    delay = start_time + n_streamed / (self.frequency * self.speed) - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+
+            if not self.loop:
+                break
+
+        if held_back is not None:
+            self._socket.sendto(held_back, target)
+            self.n_sent += 1
+
+        # measurement end packet
+        seq_no += 1
+        self._socket.sendto(pack('<LL', seq_no, PACKET_END), target)
+
+        runtime = time.perf_counter() - start_time
+        print(f'Sent {self.n_sent} packets ({n_streamed} samples) in {runtime:.2f}s '
+              f'({n_streamed / runtime / 1000:.1f} kS/s, dropped: {self.n_dropped}, reordered: {self.n_reordered})')
+
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command line entry point of the capturama simulator.
+    """
+
+    parser = argparse.ArgumentParser(prog='mldog simulate', description='Replay drill recordings or synthetic signals via the capturama UDP protocol.')
+    parser.add_argument('recordings', nargs='?', help='recording file or directory (omit for a synthetic signal)')
+    parser.add_argument('--duration', type=float, default=10.0, help='duration of the synthetic signal in seconds (default: 10)')
+    parser.add_argument('--frequency', type=int, default=96000, help='sample rate (default: 96000)')
+    parser.add_argument('--speed', type=float, default=1.0, help='replay speed as multiple of real-time, 0 for maximum speed (default: 1)')
+    parser.add_argument('--loss', type=float, default=0.0, help='packet loss probability (default: 0)')
+    parser.add_argument('--reorder', type=float, default=0.0, help='packet reordering probability (default: 0)')
+    parser.add_argument('--loop', action='store_true', help='replay endlessly')
+    parser.add_argument('--port', type=int, default=4242, help='port to listen for start messages (default: 4242)')
+    parser.add_argument('--target', help='send to the given host:port immediately instead of waiting for a start message')
+    parser.add_argument('--seed', type=int, default=None, help='random seed')
+    args = parser.parse_args(argv)
+
+    if args.recordings is not None:
+        data, channels, frequency = load_recordings(args.recordings, args.frequency)
+    else:
+        data, channels, frequency = generate_drill_signal(args.duration, args.frequency, seed=args.seed), DEFAULT_CHANNELS, args.frequency
+
+    target = None
+    if args.target is not None:
+        host, port = args.target.rsplit(':', 1)
+        target = (host, int(port))
+
+    simulator = CapturamaSimulator(data, frequency, channels, args.port, args.speed, args.loss, args.reorder, args.loop, args.seed)
+
+    try:
+        simulator.run(target)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == '__main__':
+    main()
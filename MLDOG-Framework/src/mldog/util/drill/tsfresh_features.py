@@ -0,0 +1,262 @@
+# tsfresh based feature extraction for drill procedures, parallelized over recordings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .feature_store import FeatureStore
+from .io import read_measurement_array
+
+
+__all__ = ['TSFRESH_PROFILES', 'profile_parameters', 'tsfresh_feature_names', 'extract_tsfresh_features',
+           'extract_tsfresh_feature_frame', 'extract_tsfresh_recording_features']
+
+
+CHANNEL_NAMES = ['Audio', 'Voltage', 'Current']
+
+# calculators exceeding the live latency budget (~0.1s and more per channel and second of 96kHz data)
+COSTLY_CALCULATORS = [
+    'augmented_dickey_fuller', 'number_cwt_peaks', 'partial_autocorrelation', 'lempel_ziv_complexity', 'permutation_entropy',
+    'agg_linear_trend', 'change_quantiles', 'benford_correlation', 'longest_strike_below_mean', 'longest_strike_above_mean',
+    'fourier_entropy', 'ar_coefficient',
+]
+
+# parameter profiles: 'minimal' and 'efficient-live' fit the live prediction, 'efficient' and 'comprehensive' are meant for offline training
+TSFRESH_PROFILES = ['minimal', 'efficient-live', 'efficient', 'comprehensive']
+
+# version of the profile definitions (increase on any change to invalidate cached features)
+PROFILE_VERSION = 1
+
+
+def profile_parameters(profile: str = 'efficient-live') -> dict:
+    """Method to retrieve the tsfresh calculator parameters of a profile.
+
+    Parameters
+    ----------
+    profile : str
+        The parameter profile, one of TSFRESH_PROFILES.
+
+    Returns
+    ----------
+    parameters : dict
+        The tsfresh default_fc_parameters.
+    """
+
+    # import on demand, tsfresh is slow to import
+    from tsfresh.feature_extraction import ComprehensiveFCParameters, EfficientFCParameters, MinimalFCParameters
+
+    if profile == 'minimal':
+        return MinimalFCParameters()
+    elif profile == 'efficient-live':
+        parameters = EfficientFCParameters()
+        for calculator in COSTLY_CALCULATORS:
+            parameters.pop(calculator, None)
+        return parameters
+    elif profile == 'efficient':
+        return EfficientFCParameters()
+    elif profile == 'comprehensive':
+        return ComprehensiveFCParameters()
+
+    raise ValueError(f'Unknown tsfresh profile "{profile}"')
+
+
+def profile_version(profile: str) -> str:
+    """
+    Retrieve the feature store version of a profile (changes with the profile definitions and the tsfresh version).
+    """
+
+    import tsfresh
+
+    return f'{profile}-{PROFILE_VERSION}-tsfresh-{tsfresh.__version__}'
+
+
+def _to_frame(procedures: list[np.ndarray], first_id: int = 0) -> pd.DataFrame:
+    """
+    Build a tsfresh input frame (one row per sample with id and channel columns) of the given procedures.
+    """
+
+    lengths = [procedure.shape[0] for procedure in procedures]
+    frame = pd.DataFrame(np.concatenate([procedure[:, :3] for procedure in procedures]), columns=CHANNEL_NAMES)
+    frame['id'] = np.repeat(np.arange(first_id, first_id + len(procedures)), lengths)
+
+    return frame
+
+
+def extract_tsfresh_features(procedures: list[np.ndarray], profile: str = 'efficient-live', frequency: int = 96000,
+                             n_jobs: int = 0, chunk_size: int = 16) -> np.ndarray:
+    """Method to extract tsfresh features of the given drill procedures.
+
+    The procedures are converted to tsfresh input frames in chunks of chunk_size procedures, thus memory stays bounded for many recordings.
+    The duration of each procedure is appended as 'time' feature (like the basic feature set).
+
+    Parameters
+    ----------
+    procedures : list[numpy.ndarray]
+        The (n_samples, n_channels) drill procedures (audio, voltage and current channels).
+
+    profile : str
+        The parameter profile, one of TSFRESH_PROFILES.
+
+    frequency : int
+        The sample rate.
+
+    n_jobs : int
+        The number of tsfresh worker processes, 0 to compute within the calling process.
+
+    chunk_size : int
+        The number of procedures per tsfresh call.
+
+    Returns
+    ----------
+    features : numpy.ndarray
+        The (n_procedures, n_features) feature values, ordered as given by tsfresh_feature_names().
+    """
+
+    from tsfresh import extract_features
+
+    if len(procedures) == 0:
+        return np.zeros((0, len(tsfresh_feature_names(profile))))
+
+    parameters = profile_parameters(profile)
+    names = tsfresh_feature_names(profile)[:-1]
+    blocks = []
+
+    for offset in range(0, len(procedures), chunk_size):
+        chunk = procedures[offset:offset + chunk_size]
+        features = extract_features(_to_frame(chunk, offset), column_id='id', default_fc_parameters=parameters,
+                                    n_jobs=n_jobs, disable_progressbar=True)
+
+        durations = np.array([procedure.shape[0] / frequency for procedure in chunk])
+        blocks.append(np.column_stack([features[names].to_numpy(), durations]))
+
+    return np.concatenate(blocks)
+
+
+_feature_names = {}
+
+def tsfresh_feature_names(profile: str = 'efficient-live') -> list[str]:
+    """Method to retrieve the feature (column) names of a tsfresh profile.
+
+    Parameters
+    ----------
+    profile : str
+        The parameter profile, one of TSFRESH_PROFILES.
+
+    Returns
+    ----------
+    names : list[str]
+        The feature names in column order.
+    """
+
+    if profile not in _feature_names:
+        from tsfresh import extract_features
+
+        # tsfresh yields all configured features for any input, thus a short dummy procedure determines the names
+        dummy = np.random.default_rng(0).normal(size=(64, 3))
+        features = extract_features(_to_frame([dummy]), column_id='id', default_fc_parameters=profile_parameters(profile),
+                                    n_jobs=0, disable_progressbar=True)
+        _feature_names[profile] = list(features.columns) + ['time']
+
+    return list(_feature_names[profile])
+
+
+def extract_tsfresh_feature_frame(procedures, profile: str = 'efficient-live', frequency: int = 96000, n_jobs: int = 0,
+                                  chunk_size: int = 16) -> pd.DataFrame:
+    """Method to extract tsfresh features of one or more drill procedures as data frame (one row per procedure).
+
+    Parameters
+    ----------
+    procedures : numpy.ndarray | list[numpy.ndarray]
+        A single (n_samples, n_channels) drill procedure or a list of procedures.
+
+    profile, frequency, n_jobs, chunk_size
+        See extract_tsfresh_features().
+
+    Returns
+    ----------
+    features : pandas.DataFrame
+        The feature data frame.
+    """
+
+    if isinstance(procedures, np.ndarray) and procedures.ndim == 2:
+        procedures = [procedures]
+
+    features = extract_tsfresh_features(list(procedures), profile, frequency, n_jobs, chunk_size)
+
+    return pd.DataFrame(features, columns=tsfresh_feature_names(profile))
+
+
+def tsfresh_recording_features(file: str, profile: str = 'efficient-live', frequency: int = 96000) -> np.ndarray:
+    """Method to read a measurement recording and extract its tsfresh features (executed by the worker processes).
+
+    Parameters
+    ----------
+    file : string
+        The path to the (.csv or binary) recording.
+
+    profile : str
+        The parameter profile, one of TSFRESH_PROFILES.
+
+    frequency : int
+        The sample rate to use if it is not stored with the recording.
+
+    Returns
+    ----------
+    features : numpy.ndarray
+        The (n_features,) feature values.
+    """
+
+    data, header = read_measurement_array(file, csv_dtype=np.float64)
+    frequency = header['frequency'] if header['frequency'] is not None else frequency
+
+    return extract_tsfresh_features([data], profile, frequency)[0]
+
+
+def extract_tsfresh_recording_features(files: list[str], profile: str = 'efficient-live', n_workers: int = None, batch_size: int = 1,
+                                       store: FeatureStore = None, frequency: int = 96000) -> np.ndarray:
+    """Method to extract tsfresh features of the given recordings using a process pool, optionally cached in a feature store.
+
+    Each worker process reads and reduces whole recordings, thus only feature vectors are transferred between processes.
+
+    Parameters
+    ----------
+    files : list[str]
+        The paths to the recordings.
+
+    profile : str
+        The parameter profile, one of TSFRESH_PROFILES.
+
+    n_workers : int
+        The number of worker processes, None for the number of CPUs, 1 to extract within the calling process.
+
+    batch_size : int
+        The number of recordings handed to a worker at once.
+
+    store : FeatureStore
+        The feature store to reuse and persist features (stored as feature set 'tsfresh-<profile>'), or None to compute all features.
+
+    frequency : int
+        The sample rate to use for recordings without stored sample rate.
+
+    Returns
+    ----------
+    features : numpy.ndarray
+        The (n_files, n_features) feature values, ordered as given by tsfresh_feature_names().
+    """
+
+    def extract(missing_files: list[str]) -> np.ndarray:
+        profiles = [profile] * len(missing_files)
+        frequencies = [frequency] * len(missing_files)
+
+        if n_workers == 1 or len(missing_files) <= 1:
+            rows = list(map(tsfresh_recording_features, missing_files, profiles, frequencies))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                rows = list(executor.map(tsfresh_recording_features, missing_files, profiles, frequencies, chunksize=batch_size))
+
+        return np.stack(rows) if len(rows) > 0 else np.zeros((0, len(tsfresh_feature_names(profile))))
+
+    if store is None:
+        return extract(files)
+
+    return store.getFeatures(files, f'tsfresh-{profile}', extract, profile_version(profile))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# make the mldog package importable without installation (like the benchmarks)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from mldog.util.drill.drill_procedure_detector import DrillProcedureDetector
+from mldog.util.drill.features import extract_features
+
+
+CHUNK_SIZE = 480
+
+
+def stream(n_active: int, n_idle: int) -> list:
+    active = np.full((CHUNK_SIZE, 3), 10.0)
+    idle = np.zeros((CHUNK_SIZE, 3))
+    return [active] * n_active + [idle] * n_idle
+
+
+@pytest.mark.parametrize('mode', ['chunk', 'sample'])
+@pytest.mark.parametrize('feature_set', ['basic', 'extended'])
+def test_stream_starting_with_active_drill(mode, feature_set):
+    # the first chunk is already active, thus there is no history to accumulate
+    detector = DrillProcedureDetector(ttl_max=5, window_size=960, active_power=50, mode=mode, hold_samples=2400, feature_set=feature_set)
+
+    results = []
+    for chunk in stream(10, 20):
+        drill_data = detector.update(chunk)
+        if drill_data is not None:
+            results.append((drill_data, detector.getFeatures()))
+
+    assert len(results) == 1
+
+    drill_data, features = results[0]
+    np.testing.assert_allclose(features, extract_features(drill_data, 96000, feature_set))
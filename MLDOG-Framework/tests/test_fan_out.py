@@ -0,0 +1,21 @@
+import numpy as np
+
+from mldog.app.model.fan_out import FanOut
+from mldog.app.model.task import DATA_QUEUE_CAPACITY, Task
+
+
+def test_stalled_task_does_not_block_the_data_stream():
+    stalled, live = Task('stalled'), Task('live')
+    fan_out = FanOut()
+    fan_out.addQueue(stalled.getDataQueue())
+    fan_out.addQueue(live.getDataQueue())
+
+    # nobody consumes the stalled task's queue, the producer must not block
+    chunk = np.zeros((480, 3))
+    for _ in range(DATA_QUEUE_CAPACITY + 10):
+        fan_out.put(chunk)
+        live.getDataQueue().getAll()
+
+    statistics = stalled.getQueueStatistics()['data']
+    assert statistics['depth'] == DATA_QUEUE_CAPACITY
+    assert statistics['dropped'] == 10
@@ -0,0 +1,30 @@
+import os
+import pickle
+
+from mldog.app.model import model_registry as registry_module
+from mldog.app.model.model_registry import ModelRegistry
+
+
+def test_model_is_served_without_file_system_access_between_checks(tmp_path, monkeypatch):
+    model_path = str(tmp_path / 'model.pkl')
+    with open(model_path, 'wb') as model_file:
+        pickle.dump('v1', model_file)
+
+    registry = ModelRegistry(check_interval=3600)
+    assert registry.getModel(model_path) == 'v1'
+
+    n_stat = []
+    stat = os.stat
+    monkeypatch.setattr(registry_module.os, 'stat', lambda *args, **kwargs: n_stat.append(1) or stat(*args, **kwargs))
+
+    for _ in range(100):
+        assert registry.getModel(model_path) == 'v1'
+    assert len(n_stat) == 0
+
+    # a replaced artifact is picked up by an explicit check
+    with open(model_path, 'wb') as model_file:
+        pickle.dump('v2', model_file)
+    os.utime(model_path, ns=(0, 1))
+
+    assert registry.getModel(model_path) == 'v1'
+    assert registry.getModel(model_path, check=True) == 'v2'
@@ -0,0 +1,61 @@
+import multiprocessing
+import threading
+import time
+from queue import Queue
+
+import numpy as np
+
+from mldog.app.model.shared_ring_buffer import SharedRingBuffer
+from mldog.app.model.universal_data_sources import MultiprocessUDPDataSource
+
+
+def receive(source: MultiprocessUDPDataSource, chunks: list, interval: float = 0.05) -> Queue:
+    queue = Queue()
+    source.startMeasurement(queue)
+    thread = threading.Thread(target=source.receiveLoop, daemon=True)
+    thread.start()
+
+    for chunk in chunks:
+        source.ring.write(chunk)
+        time.sleep(interval)
+
+    ring = source.ring
+    source.ring = None
+    thread.join()
+    ring.close()
+
+    return queue
+
+
+def test_published_chunks_are_copies():
+    source = MultiprocessUDPDataSource(capacity=1000)
+    source.ring = SharedRingBuffer(1000, 3)
+    source.control_queue = multiprocessing.Queue()
+
+    queue = receive(source, [np.full((600, 3), idx, dtype=np.float32) for idx in range(5)])
+
+    # each chunk keeps its values although the ring wrapped around meanwhile
+    assert [set(np.unique(queue.get())) for _ in range(queue.qsize())] == [{idx} for idx in range(5)]
+
+
+def test_samples_overwritten_during_copy_are_dropped():
+    source = MultiprocessUDPDataSource(capacity=1000)
+    ring = source.ring = SharedRingBuffer(1000, 3)
+    source.control_queue = multiprocessing.Queue()
+
+    read = ring.read
+
+    def read_while_producing(start, stop):
+        views = read(start, stop)
+        # the producer overwrites the 700 oldest of the samples to be copied
+        if start == 0:
+            ring.write(np.full((700, 3), -1, dtype=np.float32))
+        return views
+
+    ring.read = read_while_producing
+    queue = receive(source, [np.full((1000, 3), 1, dtype=np.float32)])
+
+    first = queue.get()
+    assert first.shape[0] == 300
+    assert set(np.unique(first)) == {1}
+    assert source.n_overrun == 700
@@ -0,0 +1,58 @@
+import time
+
+import numpy as np
+
+from mldog.app.model.core import Core
+from mldog.app.model.task import Task
+
+
+class FailingTask(Task):
+    def __init__(self, fail_in_setup: bool):
+        super().__init__('Failing')
+        self.fail_in_setup = fail_in_setup
+
+    def setup(self):
+        if self.fail_in_setup:
+            raise ValueError('unsupported model')
+
+    def process(self, data):
+        raise RuntimeError('processing failed')
+
+
+class CollectingTask(Task):
+    def process(self, data):
+        self.publishResult(data.shape[0])
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    end_time = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < end_time:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_failing_task_is_detached_and_reported():
+    for fail_in_setup in (True, False):
+        core = Core()
+        failures, results = [], []
+        core.addListener('task_failed', lambda task, error: failures.append(error))
+
+        failing, collecting = FailingTask(fail_in_setup), CollectingTask()
+        core.setTask(failing, autostart=False)
+        core.addTask(collecting, results.append, autostart=False)
+
+        # the data source publishes into the fan-out
+        core._fan_out.put(np.zeros((480, 3)))
+
+        assert wait_for(failing.hasFailed)
+        core.checkForTaskResults()
+
+        assert len(failures) == 1
+        assert core.getTasks() == [collecting]
+        assert failing.getDataQueue() not in core._fan_out.getQueues()
+
+        # the remaining task keeps processing the data stream
+        core._fan_out.put(np.zeros((480, 3)))
+        assert wait_for(lambda: core.checkForTaskResults() > 0 or len(results) >= 2)
+
+        core.removeTask(collecting)
@@ -0,0 +1,39 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from mldog.app.model.training import trainModel
+
+
+def write_series(directory: str, materials: list[str]) -> None:
+    rng = np.random.default_rng(0)
+    files = []
+
+    for idx, material in enumerate(materials):
+        file = f'2024_01_01_00_00_{idx:02d}_96000Hz.csv'
+        level = 1.0 if material == 'holz-spahn' else 2.0
+        data = level + 0.1 * rng.standard_normal((960, 3))
+        np.savetxt(os.path.join(directory, file), data, delimiter=',', header='Audio,Voltage,Current', fmt='%.6f')
+        files.append(file)
+
+    pd.DataFrame({'material': materials, 'dataFile': files}).to_csv(os.path.join(directory, 'measurements.csv'), index=False)
+
+
+def test_single_recording_class_skips_cross_validation(tmp_path, capsys):
+    write_series(str(tmp_path), ['holz-spahn', 'holz-spahn', 'holz-spahn', 'kunststoff-pom'])
+
+    pipeline, metadata = trainModel(str(tmp_path), n_jobs=1, n_splits=5, n_workers=1, use_feature_store=False)
+
+    assert metadata['cv_scores'] is None
+    assert metadata['n_recordings'] == 4
+    assert 'skipping cross-validation' in capsys.readouterr().out
+    assert sorted(metadata['classes']) == ['holz-spahn', 'kunststoff-pom']
+
+
+def test_cross_validation_folds_limited_by_smallest_class(tmp_path):
+    write_series(str(tmp_path), ['holz-spahn'] * 4 + ['kunststoff-pom'] * 2)
+
+    pipeline, metadata = trainModel(str(tmp_path), n_jobs=1, n_splits=5, n_workers=1, use_feature_store=False)
+
+    assert len(metadata['cv_scores']) == 2